@@ -0,0 +1,12 @@
+"""
+Benchmarks
+Script pengukuran performa parser (jalankan dari root repo, mis.
+`python -m benchmarks.bench_extraction`)
+
+    corpus.py            Generator halaman sintetis (Yelp, TripAdvisor, Google, Custom)
+    bench_parsers.py     Benchmark semua parser + baseline regresi
+    bench_extraction.py  Biaya ekstraksi per review (extraction plan)
+    bench_startup.py     Waktu start entry point dan library yang ter-import
+    bench_export.py      Ukuran dan waktu load CSV vs Parquet/Arrow bertipe
+    fake_site.py         HTTP server lokal + driver palsu untuk driver pool yelp_scraper
+"""
@@ -0,0 +1,119 @@
+"""
+Export Benchmark
+Membandingkan output CSV dengan Parquet / Arrow bertipe (columnar_export.py)
+
+Review sintetis ditulis lewat writer streaming masing-masing format, lalu
+diukur: waktu tulis, ukuran file, dan waktu load downstream. Load CSV
+termasuk konversi tipe yang harus dilakukan setiap job downstream (rating,
+tanggal, helpful, pecah contribution); Parquet/Arrow langsung bertipe.
+
+Usage:
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --reviews 200000 --repeat 3
+"""
+
+import os
+import time
+import random
+import tempfile
+import argparse
+
+from columnar_export import open_writer
+from scraper_config import YELP_CONFIG
+
+
+WORDS = ('great', 'music', 'crowd', 'food', 'lines', 'weather', 'stage', 'sound', 'staff',
+         'parking', 'view', 'friendly', 'clean', 'amazing', 'service', 'festival')
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def make_reviews(count: int, seed: int = 1) -> list:
+    """Synthetic Yelp rows as the parsers produce them (all strings)"""
+    rng = random.Random(seed)
+    reviews = []
+    for i in range(count):
+        reviews.append({
+            'username': f"User{i % 5000} {chr(65 + i % 26)}.",
+            'from': rng.choice(('Indio, CA', 'Los Angeles, CA', 'Phoenix, AZ')),
+            'written_date': f"{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2019, 2025)}",
+            'rating': str(rng.randint(1, 5)),
+            'title': '',
+            'review_text': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(20, 80))),
+            'tema_pengalaman': f"Elite {rng.randint(20, 25)}" if i % 4 == 0 else '',
+            'daya_tarik_wisata': str(rng.randint(0, 30)),
+            'status': '',
+            'contribution': f"{rng.randint(1, 500)} reviews, {rng.randint(0, 900)} photos",
+            'review_id': f"{i:016x}",
+        })
+    return reviews
+
+
+def load_csv(path: str):
+    """CSV load plus the conversions a downstream job needs"""
+    import pandas as pd
+    
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    df['rating'] = pd.to_numeric(df['rating'], errors='coerce').astype('Int8')
+    df['written_date'] = pd.to_datetime(df['written_date'], format='%b %d, %Y', errors='coerce')
+    df['daya_tarik_wisata'] = pd.to_numeric(df['daya_tarik_wisata'], errors='coerce').astype('Int32')
+    counts = df.pop('contribution').str.extract(r'(\d+)\s*reviews?,\s*(\d+)\s*photos?')
+    df['contribution_reviews'] = pd.to_numeric(counts[0]).astype('Int32')
+    df['contribution_photos'] = pd.to_numeric(counts[1]).astype('Int32')
+    return df
+
+
+def load_parquet(path: str):
+    import pandas as pd
+    return pd.read_parquet(path)
+
+
+def load_arrow(path: str):
+    import pyarrow.feather as feather
+    return feather.read_table(path).to_pandas()
+
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV vs typed Parquet/Arrow export benchmark')
+    parser.add_argument('--reviews', type=int, default=100000, help='Synthetic reviews to write')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is kept)')
+    args = parser.parse_args()
+    
+    reviews = make_reviews(args.reviews)
+    columns = YELP_CONFIG['columns']
+    loaders = {'csv': load_csv, 'parquet': load_parquet, 'arrow': load_arrow}
+    
+    print("=" * 64)
+    print("EXPORT BENCHMARK")
+    print("=" * 64)
+    print(f"Reviews: {len(reviews)} | Repeat: {args.repeat}")
+    print(f"{'Format':<10} {'write':>9} {'size':>10} {'load':>9} {'load vs csv':>12}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_load = None
+        for fmt, load in loaders.items():
+            path = os.path.join(tmp, f'reviews.{fmt}')
+            
+            def write():
+                with open_writer(path, columns) as writer:
+                    for review in reviews:
+                        writer.write(review)
+            
+            write_seconds = best_time(write, args.repeat)
+            load_seconds = best_time(lambda: load(path), args.repeat)
+            csv_load = csv_load or load_seconds
+            size = os.path.getsize(path) / (1024 * 1024)
+            print(f"{fmt:<10} {write_seconds:8.2f}s {size:8.1f}MB {load_seconds:8.2f}s "
+                  f"{csv_load / load_seconds:11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
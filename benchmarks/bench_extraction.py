@@ -0,0 +1,159 @@
+"""
+Extraction Plan Benchmark
+Mengukur biaya ekstraksi per review sebelum dan sesudah extraction plan
+
+"Before" adalah salinan extract_review lama dari scraper_gui.py yang
+memanggil re.compile() dan membangun argumen pencarian untuk setiap elemen.
+"After" adalah scraper_gui.extract_review dengan plan yang dikompilasi sekali.
+
+Usage:
+    python -m benchmarks.bench_extraction
+    python -m benchmarks.bench_extraction --reviews 500 --repeat 5
+"""
+
+import re
+import time
+import argparse
+
+from bs4 import BeautifulSoup
+
+from extraction_plan import compile_plan
+from scraper_gui import ScraperConfig, extract_review
+
+
+def make_yelp_page(num_reviews: int) -> str:
+    """Build a small synthetic Yelp page"""
+    items = []
+    for i in range(num_reviews):
+        items.append(
+            f'<li class="review"><div><a href="/user_details?userid=u{i}">User{i} A.</a>'
+            f'<span>Indio, CA</span><div>{i} {i % 7} {i % 3}</div>'
+            f'<a href="/elite">Elite 25</a></div>'
+            f'<div aria-label="{i % 5 + 1} star rating" role="img"></div>'
+            f'<span>Apr {i % 28 + 1}, 2024</span>'
+            f'<p><span lang="en" class="raw__09f24">Review number {i} - '
+            f'great music, long lines, hot weather and a lot of fun overall.</span></p>'
+            f'<div>Helpful {i % 10}</div></li>'
+        )
+    return f'<html><body><ul>{"".join(items)}</ul></body></html>'
+
+
+def legacy_extract_review(elem, config: dict) -> dict:
+    """Pre-plan extract_review (re-compiles patterns per element)"""
+    review = {
+        'username': '', 'from': '', 'written_date': '', 'rating': '', 'title': '',
+        'review_text': '', 'tema_pengalaman': '', 'daya_tarik_wisata': '',
+        'status': '', 'contribution': ''
+    }
+    
+    text = elem.get_text(strip=True)
+    if len(text) < 50:
+        return None
+    review['review_text'] = text
+    
+    container = elem
+    for _ in range(config['container_levels']):
+        parent = container.parent
+        if parent is None:
+            break
+        if parent.name == config['container_tag']:
+            container = parent
+            break
+        container = parent
+    
+    container_text = container.get_text(' ', strip=True)
+    
+    if config['username_pattern']:
+        links = container.find_all(config['username_tag'],
+                                   attrs={config['username_attr']: re.compile(config['username_pattern'])})
+        for link in links:
+            name = link.get_text(strip=True)
+            if name and len(name) >= 2 and re.match(r'^[A-Za-z]', name):
+                review['username'] = name
+                break
+    
+    if not review['username']:
+        return None
+    
+    if config['location_pattern']:
+        match = re.search(config['location_pattern'], container_text)
+        if match:
+            review['from'] = match.group(1) if match.lastindex else match.group()
+    
+    if config['date_pattern']:
+        match = re.search(config['date_pattern'], container_text)
+        if match:
+            review['written_date'] = match.group()
+    
+    if config['rating_pattern']:
+        rating_elem = container.find(attrs={'aria-label': re.compile(config['rating_pattern'], re.I)})
+        if rating_elem:
+            match = re.search(r'(\d+)', rating_elem.get('aria-label', ''))
+            if match:
+                review['rating'] = match.group(1)
+    
+    if config['helpful_pattern']:
+        match = re.search(config['helpful_pattern'], container_text)
+        if match:
+            review['daya_tarik_wisata'] = match.group(1)
+    
+    if config['contribution_pattern']:
+        match = re.search(config['contribution_pattern'], container_text)
+        if match:
+            if match.lastindex and match.lastindex >= 2:
+                review['contribution'] = f"{match.group(1)} reviews, {match.group(2)} photos"
+            else:
+                review['contribution'] = match.group(1)
+    
+    if config['elite_pattern'] and config['elite_tag']:
+        elite_elem = container.find(config['elite_tag'],
+                                    attrs={config['elite_attr']: config['elite_pattern']})
+        if elite_elem:
+            review['status'] = elite_elem.get_text(strip=True)
+            review['tema_pengalaman'] = review['status']
+    
+    return review
+
+
+def time_per_review(func, elements, arg, repeat: int) -> float:
+    """Best-of-N time per element in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for elem in elements:
+            func(elem, arg)
+        best = min(best, time.perf_counter() - start)
+    return best / len(elements) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-review extraction benchmark')
+    parser.add_argument('--reviews', type=int, default=200, help='Reviews on the synthetic page')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is kept)')
+    args = parser.parse_args()
+    
+    config = ScraperConfig.PRESETS['Yelp']
+    soup = BeautifulSoup(make_yelp_page(args.reviews), 'lxml')
+    
+    plan = compile_plan(config)
+    elements = soup.find_all(**plan.review_search)
+    
+    # Both paths must produce the same rows
+    before_rows = [legacy_extract_review(e, config) for e in elements]
+    after_rows = [extract_review(e, plan) for e in elements]
+    assert before_rows == after_rows, "Plan-based extraction differs from legacy path"
+    
+    before = time_per_review(legacy_extract_review, elements, config, args.repeat)
+    after = time_per_review(extract_review, elements, plan, args.repeat)
+    
+    print("=" * 60)
+    print("EXTRACTION PLAN BENCHMARK")
+    print("=" * 60)
+    print(f"Reviews: {len(elements)} | Repeat: {args.repeat}")
+    print(f"Before (per-element compile): {before:8.1f} us/review")
+    print(f"After  (compiled plan):       {after:8.1f} us/review")
+    print(f"Speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
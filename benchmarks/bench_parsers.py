@@ -0,0 +1,208 @@
+"""
+Parser Benchmark Suite
+Mengukur kecepatan dan memori parser pada korpus sintetis (offline)
+
+Target yang diukur:
+    html_parser     html_parser.parse_html_file (hanya korpus Yelp)
+    custom_scraper  UniversalScraper.parse_file dengan YELP/TRIPADVISOR/GOOGLE/TEMPLATE_CONFIG
+    scraper_gui     scraper_gui.parse_file (dipakai ScraperApp.parse_file) dengan ScraperConfig.PRESETS
+
+Setiap target dijalankan untuk setiap backend (bs4, lxml, stream). Hasil:
+reviews/sec, MB/sec dan peak memory (heap Python via tracemalloc; memori
+internal libxml2 tidak terhitung). Hasil bisa disimpan sebagai baseline di
+benchmarks/baselines.json; run berikutnya dibandingkan dengan baseline dan
+penurunan throughput di atas toleransi ditandai REGRESSION.
+
+Baseline bergantung pada mesin; simpan ulang setelah ganti mesin.
+
+Usage:
+    python -m benchmarks.bench_parsers
+    python -m benchmarks.bench_parsers --save-baseline
+    python -m benchmarks.bench_parsers --targets custom_scraper --backends lxml --check
+"""
+
+import io
+import os
+import json
+import time
+import tempfile
+import argparse
+import platform
+import tracemalloc
+import contextlib
+
+import html_parser
+import custom_scraper
+import scraper_gui
+import lxml_backend
+from extraction_plan import compile_plan
+from scraper_config import YELP_CONFIG, TRIPADVISOR_CONFIG, GOOGLE_CONFIG, TEMPLATE_CONFIG
+from benchmarks.corpus import SITES, write_corpus
+
+
+TARGETS = ('html_parser', 'custom_scraper', 'scraper_gui')
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+SITE_CONFIGS = {
+    'yelp': YELP_CONFIG,
+    'tripadvisor': TRIPADVISOR_CONFIG,
+    'google': GOOGLE_CONFIG,
+    'custom': TEMPLATE_CONFIG,
+}
+
+SITE_PRESETS = {
+    'yelp': 'Yelp',
+    'tripadvisor': 'TripAdvisor',
+    'google': 'Google Reviews',
+    'custom': 'Custom',
+}
+
+
+def make_parse_func(target: str, site: str, backend: str, strain: bool = False):
+    """Return a filepath -> reviews function for one case (None if not applicable)"""
+    if target == 'html_parser':
+        if site != 'yelp':
+            return None
+        return lambda f: html_parser.parse_html_file(f, strain=strain, backend=backend)
+    if target == 'custom_scraper':
+        scraper = custom_scraper.UniversalScraper(SITE_CONFIGS[site], strain=strain, backend=backend)
+        return scraper.parse_file
+    if target == 'scraper_gui':
+        preset = scraper_gui.ScraperConfig.PRESETS[SITE_PRESETS[site]]
+        plan = compile_plan(preset)
+        return lambda f: scraper_gui.parse_file(f, plan, strain=strain, backend=backend)
+    raise ValueError(f"Unknown target: {target}")
+
+
+def run_case(parse_func, files: list, repeat: int) -> dict:
+    """Time parse_func over all files (best of N) and measure peak memory"""
+    total_bytes = sum(os.path.getsize(f) for f in files)
+    
+    # Parsers print progress; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        best = float('inf')
+        reviews = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            reviews = sum(len(parse_func(f)) for f in files)
+            best = min(best, time.perf_counter() - start)
+        
+        tracemalloc.start()
+        for f in files:
+            parse_func(f)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    return {
+        'reviews': reviews,
+        'seconds': round(best, 4),
+        'reviews_per_sec': round(reviews / best, 1) if best else 0.0,
+        'mb_per_sec': round(total_bytes / 1024 / 1024 / best, 2) if best else 0.0,
+        'peak_mb': round(peak / 1024 / 1024, 1),
+    }
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, params: dict, results: dict):
+    data = {
+        'params': params,
+        'machine': f"{platform.system()} {platform.machine()} / Python {platform.python_version()}",
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    print(f"\n[SAVED] Baseline -> {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parser benchmark suite (synthetic corpus)')
+    parser.add_argument('--targets', type=str, default=','.join(TARGETS),
+                        help=f'Comma separated targets (default: {",".join(TARGETS)})')
+    parser.add_argument('--sites', type=str, default=','.join(SITES),
+                        help=f'Comma separated sites (default: {",".join(SITES)})')
+    parser.add_argument('--backends', type=str, default=','.join(lxml_backend.BACKENDS),
+                        help='Comma separated backends (default: all)')
+    parser.add_argument('--strain', action='store_true', help='Benchmark partial parsing (bs4)')
+    parser.add_argument('--pages', type=int, default=5, help='Pages per site')
+    parser.add_argument('--reviews', type=int, default=100, help='Reviews per page')
+    parser.add_argument('--noise', type=float, default=0.2, help='Non-review block probability')
+    parser.add_argument('--page-kb', type=int, default=0, help='Pad pages up to this size (KB)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is kept)')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='Baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='Store results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=15.0,
+                        help='Allowed throughput drop vs baseline in percent (default: 15)')
+    parser.add_argument('--check', action='store_true', help='Exit with code 1 on regressions')
+    args = parser.parse_args()
+    
+    targets = [t for t in args.targets.split(',') if t]
+    sites = [s for s in args.sites.split(',') if s]
+    backends = [b for b in args.backends.split(',') if b]
+    params = {
+        'pages': args.pages, 'reviews': args.reviews, 'noise': args.noise,
+        'page_kb': args.page_kb, 'strain': args.strain,
+    }
+    
+    baseline = load_baseline(args.baseline)
+    compare = baseline.get('params') == params
+    if baseline and not compare:
+        print("[WARN] Baseline was recorded with different corpus parameters, not comparing")
+    base_results = baseline.get('results', {}) if compare else {}
+    
+    print("=" * 78)
+    print("PARSER BENCHMARK")
+    print("=" * 78)
+    print(f"Corpus: {args.pages} pages x {args.reviews} reviews | noise {args.noise} | "
+          f"page {args.page_kb or 'auto'} KB | repeat {args.repeat}")
+    print(f"\n{'case':<36}{'reviews/s':>11}{'MB/s':>8}{'peak MB':>9}  vs base")
+    print("-" * 78)
+    
+    results = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for site in sites:
+            files = write_corpus(os.path.join(tmp, site), site, args.pages, args.reviews,
+                                 args.noise, args.page_kb)
+            for target in targets:
+                for backend in backends:
+                    parse_func = make_parse_func(target, site, backend, args.strain)
+                    if parse_func is None:
+                        continue
+                    
+                    name = f"{target}/{site}/{backend}"
+                    result = run_case(parse_func, files, args.repeat)
+                    results[name] = result
+                    
+                    delta = ''
+                    base = base_results.get(name)
+                    if base and base['reviews_per_sec']:
+                        change = (result['reviews_per_sec'] / base['reviews_per_sec'] - 1) * 100
+                        delta = f"{change:+.0f}%"
+                        if change < -args.tolerance:
+                            delta += ' REGRESSION'
+                            regressions.append(name)
+                    
+                    print(f"{name:<36}{result['reviews_per_sec']:>11.0f}{result['mb_per_sec']:>8.2f}"
+                          f"{result['peak_mb']:>9.1f}  {delta}")
+    
+    if args.save_baseline:
+        merged = dict(base_results)
+        merged.update(results)
+        save_baseline(args.baseline, params, merged)
+    
+    if regressions:
+        print(f"\n[REGRESSION] {len(regressions)} case(s) slower than baseline by more than "
+              f"{args.tolerance:.0f}%: {', '.join(regressions)}")
+        if args.check:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
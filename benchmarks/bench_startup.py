@@ -0,0 +1,110 @@
+"""
+Startup Benchmark
+Mengukur waktu start setiap entry point dan library berat yang sudah ter-load
+
+Setiap pengukuran berjalan di proses Python baru (import cache kosong):
+
+    - CLI (custom_scraper, html_parser, yelp_scraper): main() dengan --help,
+      diukur sampai argparse selesai mencetak bantuan
+    - GUI (scraper_gui): main() sampai mainloop() dipanggil, yaitu saat
+      window pertama kali bisa tampil; mainloop diganti agar window langsung
+      ditutup. Tanpa display (server/CI) hanya import modul yang diukur.
+
+Targetnya: tidak ada library parsing (bs4, lxml), Selenium atau
+pandas/NumPy yang di-import sebelum dibutuhkan.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10 --entry scraper_gui
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+ENTRY_POINTS = ('scraper_gui', 'custom_scraper', 'html_parser', 'yelp_scraper')
+HEAVY_MODULES = ('bs4', 'lxml', 'selenium', 'webdriver_manager', 'pandas', 'numpy', 'pyarrow', 'urllib3')
+
+# Runs in the child process; prints one JSON line with the measurement
+_PROBE = r"""
+import sys, json, time, importlib
+start = time.perf_counter()
+name, heavy = sys.argv[1], sys.argv[2].split(',')
+
+def loaded():
+    return [m for m in heavy if m in sys.modules]
+
+result = {'name': name}
+module = importlib.import_module(name)
+result['import'] = time.perf_counter() - start
+
+if name == 'scraper_gui':
+    import tkinter as tk
+    
+    def mainloop(root, n=0):
+        result['ready'] = time.perf_counter() - start
+        result['loaded'] = loaded()
+        root.destroy()
+    
+    tk.Tk.mainloop = mainloop
+    try:
+        module.main()
+    except tk.TclError as e:
+        result['error'] = str(e).splitlines()[0]
+        result['loaded'] = loaded()
+else:
+    sys.argv = [name, '--help']
+    out, sys.stdout = sys.stdout, open('nul' if sys.platform == 'win32' else '/dev/null', 'w')
+    try:
+        module.main()
+    except SystemExit:
+        pass
+    finally:
+        sys.stdout.close()
+        sys.stdout = out
+    result['ready'] = time.perf_counter() - start
+    result['loaded'] = loaded()
+print(json.dumps(result))
+"""
+
+
+def measure(name: str) -> dict:
+    """Start one entry point in a fresh interpreter"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run([sys.executable, '-c', _PROBE, name, ','.join(HEAVY_MODULES)],
+                          cwd=root, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} failed to start:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Entry point startup benchmark')
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh processes per entry point (median is kept)')
+    parser.add_argument('--entry', choices=ENTRY_POINTS, action='append',
+                        help='Entry point to measure (default: all, can be repeated)')
+    args = parser.parse_args()
+    
+    print("=" * 72)
+    print("STARTUP BENCHMARK")
+    print("=" * 72)
+    print(f"Repeat: {args.repeat} | times are medians of fresh processes")
+    print(f"{'Entry point':<16} {'import':>9} {'ready':>9}  Heavy modules loaded")
+    
+    for name in args.entry or ENTRY_POINTS:
+        runs = [measure(name) for _ in range(args.repeat)]
+        imported = statistics.median(r['import'] for r in runs)
+        ready = [r['ready'] for r in runs if 'ready' in r]
+        ready_text = f"{statistics.median(ready) * 1000:7.0f}ms" if ready else f"{'n/a':>9}"
+        loaded = ', '.join(runs[-1]['loaded']) or 'none'
+        print(f"{name:<16} {imported * 1000:7.0f}ms {ready_text}  {loaded}")
+        if 'error' in runs[-1]:
+            print(f"{'':<16} [WARN] window not created ({runs[-1]['error']}); import only")
+
+
+if __name__ == "__main__":
+    main()
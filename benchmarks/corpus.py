@@ -0,0 +1,187 @@
+"""
+Synthetic Corpus Generator
+Membuat halaman HTML sintetis ala Yelp, TripAdvisor, Google Reviews dan
+template Custom untuk benchmark (tanpa halaman asli / tanpa internet)
+
+Struktur halaman mengikuti selector di scraper_config.py (YELP_CONFIG,
+TRIPADVISOR_CONFIG, GOOGLE_CONFIG, TEMPLATE_CONFIG) sekaligus
+ScraperConfig.PRESETS di scraper_gui.py, jadi satu korpus bisa dipakai oleh
+html_parser.py, custom_scraper.py dan scraper_gui.py.
+
+Usage:
+    python -m benchmarks.corpus --site yelp --pages 5 --reviews 50 --out pages/
+"""
+
+import os
+import random
+import argparse
+
+
+SITES = ('yelp', 'tripadvisor', 'google', 'custom')
+
+# File names match each config's file_pattern
+FILE_NAMES = {
+    'yelp': 'COACHELLA - Yelp {n}.html',
+    'tripadvisor': 'tripadvisor {n}.html',
+    'google': 'google {n}.html',
+    'custom': 'custom {n}.html',
+}
+
+FIRST_NAMES = ('Carol', 'Dave', 'Heidi', 'Ivan', 'Judy', 'Mallory', 'Niaj', 'Olivia',
+               'Peggy', 'Rupert', 'Sybil', 'Trent', 'Victor', 'Walter', 'Alice', 'Bob')
+CITIES = ('Indio, CA', 'Los Angeles, CA', 'San Diego, CA', 'Phoenix, AZ', 'Las Vegas, NV')
+COUNTRIES = ('Jakarta, Indonesia', 'Bali, Indonesia', 'Tokyo, Japan', 'Paris, France')
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December')
+WORDS = ('great', 'music', 'food', 'lines', 'crowd', 'stage', 'sound', 'weather', 'staff',
+         'friendly', 'view', 'amazing', 'clean', 'price', 'service', 'parking', 'again')
+
+
+def _sentence(rng: random.Random, index: int, words: int) -> str:
+    body = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return f"Review {index} {body}."
+
+
+def _yelp_review(rng: random.Random, i: int, text: str) -> str:
+    name = f"{rng.choice(FIRST_NAMES)} {chr(65 + i % 26)}."
+    return (
+        f'<li class="review__09f24"><div><div>'
+        f'<a href="/user_details?userid=u{i}"><img alt="photo"></a>'
+        f'<a href="/user_details?userid=u{i}">{name}</a></div>\n'
+        f'<div><span>{rng.choice(CITIES)}</span>'
+        f'<div>{rng.randint(1, 400)} {rng.randint(0, 300)} {rng.randint(0, 50)}</div>'
+        + (f'<a href="/elite">Elite {rng.randint(19, 25)}</a>' if rng.random() < 0.3 else '')
+        + f'</div>\n<div aria-label="{rng.randint(1, 5)} star rating" role="img"></div>'
+        f'<span>{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2016, 2025)}</span>\n'
+        f'<p><span lang="en" class="raw__09f24__T4Ezm">{text}</span></p>'
+        f'<div>Helpful {rng.randint(0, 20)}</div></div></li>'
+    )
+
+
+def _tripadvisor_review(rng: random.Random, i: int, text: str) -> str:
+    return (
+        f'<div class="review-container"><div class="member-info">'
+        f'<a class="member memberOverlayLink" href="/Profile/u{i}">Traveler{i} {rng.choice(FIRST_NAMES)}</a>'
+        f'<span>{rng.choice(COUNTRIES)}</span><span>{rng.randint(1, 500)} contributions</span></div>\n'
+        f'<div><span class="ui_bubble_rating bubble_{rng.randint(1, 5)}0"></span>'
+        f'<span>Date of experience: {rng.choice(MONTH_NAMES)} {rng.randint(2016, 2025)}</span>\n'
+        f'<div><div><div class="review-text"><span>{text}</span></div></div></div>\n'
+        f'<span>{rng.randint(0, 30)} helpful votes</span></div></div>'
+    )
+
+
+def _google_review(rng: random.Random, i: int, text: str) -> str:
+    unit = rng.choice(('day', 'week', 'month', 'year'))
+    return (
+        f'<div class="gws-review"><div class="reviewer-name name">{rng.choice(FIRST_NAMES)} {i}</div>'
+        f'<div>Local Guide · {rng.randint(1, 300)} reviews</div>\n'
+        f'<span aria-label="Rated {rng.randint(1, 5)} stars out of 5" role="img"></span>'
+        f'<span>{rng.randint(1, 11)} {unit}s ago</span>\n'
+        f'<span class="review-content">{text}</span>'
+        f'<div>{rng.randint(0, 20)} found helpful</div></div>'
+    )
+
+
+def _custom_review(rng: random.Random, i: int, text: str) -> str:
+    return (
+        f'<div class="entry"><span class="username">{rng.choice(FIRST_NAMES)} {i}</span>'
+        f'<div aria-label="{rng.randint(1, 5)} star" role="img"></div>'
+        f'<span>{rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2016, 2025)}</span>\n'
+        f'<div class="review">{text}</div></div>'
+    )
+
+
+REVIEW_BUILDERS = {
+    'yelp': _yelp_review,
+    'tripadvisor': _tripadvisor_review,
+    'google': _google_review,
+    'custom': _custom_review,
+}
+
+
+def _noise_block(rng: random.Random) -> str:
+    """Markup that is not a review: scripts, styles, nav, ads, comments"""
+    choice = rng.randrange(4)
+    if choice == 0:
+        return f'<script>window.__data = {{"k": "{"x" * rng.randint(50, 400)}"}};</script>'
+    if choice == 1:
+        return f'<style>.c{rng.randint(0, 999)} {{ color: #{rng.randint(0, 0xffffff):06x}; }}</style>'
+    if choice == 2:
+        links = ''.join(f'<a href="/biz/{k}">Related {k}</a>' for k in range(rng.randint(2, 8)))
+        return f'<div class="ad"><span>Sponsored</span>{links}</div>'
+    return f'<!-- tracking {"y" * rng.randint(20, 200)} -->'
+
+
+def make_page(site: str, num_reviews: int, seed: int = 0, noise: float = 0.2,
+              page_kb: int = 0, words: int = 40) -> str:
+    """
+    Build one synthetic review page
+    
+    Args:
+        site: One of SITES
+        num_reviews: Reviews on the page
+        seed: Random seed (pages are deterministic)
+        noise: Probability of a non-review block after each review
+        page_kb: Pad the page with noise up to roughly this size (0 = no padding)
+        words: Words per review text
+    """
+    if site not in REVIEW_BUILDERS:
+        raise ValueError(f"Unknown site: {site}. Available: {', '.join(SITES)}")
+    
+    rng = random.Random(f"{site}-{seed}")
+    build = REVIEW_BUILDERS[site]
+    
+    parts = []
+    for i in range(num_reviews):
+        index = seed * num_reviews + i
+        parts.append(build(rng, index, _sentence(rng, index, words)))
+        if rng.random() < noise:
+            parts.append(_noise_block(rng))
+    
+    size = sum(len(p) for p in parts)
+    while page_kb and size < page_kb * 1024:
+        block = _noise_block(rng)
+        parts.append(block)
+        size += len(block)
+    
+    wrapper = 'ul' if site == 'yelp' else 'div'
+    return (
+        f'<html><head><title>{site} page {seed}</title><script>init()</script></head>'
+        f'<body><nav>Home | Search</nav><div id="main"><{wrapper}>'
+        + '\n'.join(parts)
+        + f'</{wrapper}></div><footer>footer</footer></body></html>'
+    )
+
+
+def write_corpus(directory: str, site: str, pages: int = 5, reviews: int = 50,
+                 noise: float = 0.2, page_kb: int = 0) -> list:
+    """Write synthetic pages to a directory, return the file paths"""
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    for n in range(1, pages + 1):
+        path = os.path.join(directory, FILE_NAMES[site].format(n=n))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(make_page(site, reviews, seed=n, noise=noise, page_kb=page_kb))
+        files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic review page generator')
+    parser.add_argument('--site', type=str, default='yelp', choices=SITES)
+    parser.add_argument('--pages', type=int, default=5, help='Number of pages')
+    parser.add_argument('--reviews', type=int, default=50, help='Reviews per page')
+    parser.add_argument('--noise', type=float, default=0.2,
+                        help='Probability of a non-review block after each review')
+    parser.add_argument('--page-kb', type=int, default=0, help='Pad pages up to this size (KB)')
+    parser.add_argument('--out', type=str, required=True, help='Output directory')
+    args = parser.parse_args()
+    
+    files = write_corpus(args.out, args.site, args.pages, args.reviews, args.noise, args.page_kb)
+    total = sum(os.path.getsize(f) for f in files)
+    print(f"[CORPUS] {len(files)} {args.site} pages, {total / 1024 / 1024:.1f} MB -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Fake Review Site
+HTTP server lokal dengan halaman Yelp sintetis + driver palsu, untuk mencoba
+dan mengukur driver pool (yelp_scraper --workers) dan fetch HTTP/browser
+(--fetch) tanpa Chrome dan internet
+
+Server melayani halaman korpus (benchmarks/corpus.py) per offset `?start=`,
+10 review per halaman, dengan latency buatan. Sebagian halaman bisa dibuat
+"butuh JavaScript": klien HTTP biasa hanya mendapat shell kosong, sedangkan
+FakeDriver (header X-Fake-Browser) mendapat review. FakeDriver meniru bagian
+WebDriver yang dipakai YelpScraper.load_page (get, find_elements,
+execute_script, page_source, quit) memakai urllib, dan dipasang lewat
+driver_factory. FakeDriver tidak menjalankan JavaScript, jadi benchmark
+memakai extract='html' (page_source + parse_reviews).
+
+Usage:
+    python -m benchmarks.fake_site --pages 12 --workers 1,2,4 --rate 2
+    python -m benchmarks.fake_site --fetch auto,browser --js-every 3
+"""
+
+import re
+import time
+import argparse
+import threading
+import urllib.request
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from benchmarks.corpus import make_page
+
+
+PAGE_SIZE = 10
+
+PHOTO_LINK_RE = re.compile(r'<a href="[^"]*"><img alt="photo"></a>')
+PROFILE_LINK_RE = re.compile(r'href="[^"]*/user_details\?userid=')
+
+BROWSER_HEADER = 'X-Fake-Browser'
+
+JS_SHELL = ('<html><head><title>Yelp</title><script src="/static/app.js"></script></head>'
+            '<body><div id="root"></div></body></html>')
+
+
+class FakeSite:
+    """Local HTTP server serving `pages` pages of synthetic Yelp reviews"""
+    
+    def __init__(self, pages: int = 12, latency: float = 0.2, js_every: int = 0):
+        """
+        Args:
+            pages: Number of non-empty pages (later offsets return no reviews)
+            latency: Seconds each response is delayed (simulated page load)
+            js_every: Every Nth page only renders its reviews for the browser
+                      (0 = all pages are server-rendered)
+        """
+        self.pages = pages
+        self.latency = latency
+        self.js_every = js_every
+        self.requests = {'http': 0, 'browser': 0}
+        site = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                start = int(query.get('start', ['0'])[0])
+                page = start // PAGE_SIZE + 1
+                reviews = PAGE_SIZE if page <= site.pages else 0
+                browser = self.headers.get(BROWSER_HEADER) is not None
+                if site.js_every and page % site.js_every == 0 and not browser:
+                    html = JS_SHELL
+                else:
+                    html = make_page('yelp', reviews, seed=page, noise=0.2)
+                # yelp_scraper takes the first profile link as the username
+                body = PHOTO_LINK_RE.sub('', html).encode('utf-8')
+                
+                site.requests['browser' if browser else 'http'] += 1
+                time.sleep(site.latency)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/biz/fake"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeDriver:
+    """Minimal WebDriver stand-in backed by urllib"""
+    
+    def __init__(self):
+        self.page_source = ''
+    
+    def get(self, url: str):
+        request = urllib.request.Request(url, headers={BROWSER_HEADER: '1'})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            self.page_source = response.read().decode('utf-8')
+    
+    def find_elements(self, by, value):
+        # Enough for the profile link count of the readiness wait
+        return PROFILE_LINK_RE.findall(self.page_source)
+    
+    def execute_script(self, script: str):
+        if 'getEntriesByType' in script:
+            # Resource stats: the document is the only request
+            return {'requests': 1, 'bytes': len(self.page_source)}
+        if 'readyState' in script:
+            return 'complete'
+        # No JavaScript engine (e.g. the review extraction script)
+        return None
+    
+    def quit(self):
+        pass
+
+
+def run(pages: int, workers: int, rate: float, latency: float, fetch: str = 'browser',
+        js_every: int = 0, burst: int = 1) -> dict:
+    """Scrape the fake site with YelpScraper, return timing and counts"""
+    from yelp_scraper import YelpScraper
+    
+    with FakeSite(pages, latency, js_every) as site:
+        scraper = YelpScraper(workers=workers, rate=rate, burst=burst, driver_factory=FakeDriver,
+                              fetch_mode=fetch, base_url=site.url, extract='html')
+        start = time.perf_counter()
+        reviews = scraper.scrape_all_reviews()
+        seconds = time.perf_counter() - start
+    return {'reviews': len(reviews), 'http': site.requests['http'],
+            'browser': site.requests['browser'], 'seconds': seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Driver pool benchmark against a local fake site')
+    parser.add_argument('--pages', type=int, default=12, help='Pages with reviews')
+    parser.add_argument('--workers', type=str, default='1,2,4', help='Comma separated pool sizes')
+    parser.add_argument('--rate', type=float, default=2.0, help='Requests per second (token bucket)')
+    parser.add_argument('--burst', type=int, default=1, help='Token bucket burst size')
+    parser.add_argument('--latency', type=float, default=0.2, help='Simulated server latency')
+    parser.add_argument('--fetch', type=str, default='browser',
+                        help='Comma separated fetch modes (auto, http, browser)')
+    parser.add_argument('--js-every', type=int, default=0,
+                        help='Every Nth page needs the browser (0 = none)')
+    args = parser.parse_args()
+    
+    results = []
+    for fetch in [f for f in args.fetch.split(',') if f]:
+        for workers in [int(w) for w in args.workers.split(',') if w]:
+            result = run(args.pages, workers, args.rate, args.latency, fetch, args.js_every, args.burst)
+            results.append((fetch, workers, result))
+    
+    print("\n" + "=" * 60)
+    print(f"{'fetch':>8}{'workers':>8}{'reviews':>10}{'http':>8}{'browser':>9}{'seconds':>10}")
+    print("-" * 60)
+    for fetch, workers, r in results:
+        print(f"{fetch:>8}{workers:>8}{r['reviews']:>10}{r['http']:>8}{r['browser']:>9}{r['seconds']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Columnar Export
+Output review ke Parquet / Arrow IPC dengan kolom bertipe (pyarrow)
+
+CSV menyimpan semua field sebagai teks, sehingga setiap proses downstream
+harus mem-parse ulang rating, tanggal dan angka. Writer di sini menulis
+kolom yang sudah bertipe:
+
+    rating                int8   (1-5, null jika kosong/tidak valid)
+    written_date          date32 ('Mon D, YYYY' atau 'M/D/YYYY')
+    daya_tarik_wisata     int32  (jumlah helpful)
+    contribution_reviews  int32  (dipecah dari 'N reviews, M photos')
+    contribution_photos   int32
+    kolom lain            string
+
+Review di-buffer per kolom dan ditulis sebagai satu row group (Parquet)
+atau record batch (Arrow) setiap ROW_GROUP_SIZE baris, jadi memori tetap
+kecil selama streaming. Seperti CSVStreamWriter, file ditulis ke
+'<output>.part' lalu di-rename setelah selesai. Parquet/Arrow tidak bisa
+di-append di tempat: dengan append=True row group file lama disalin dulu
+ke file baru, lalu review baru ditambahkan.
+
+Format dipilih dari ekstensi output (.parquet/.pq, .arrow/.feather/.ipc);
+selain itu CSV. pyarrow hanya di-import saat file Parquet/Arrow ditulis.
+"""
+
+import os
+import re
+import datetime
+
+from review_stream import CSVStreamWriter, output_columns, ID_COLUMN
+
+
+EXPORT_FORMATS = ('csv', 'parquet', 'arrow')
+FORMAT_EXTENSIONS = {
+    'csv': ('.csv',),
+    'parquet': ('.parquet', '.pq'),
+    'arrow': ('.arrow', '.feather', '.ipc'),
+}
+
+ROW_GROUP_SIZE = 10000
+COMPRESSION = 'zstd'
+
+CONTRIBUTION_COLUMNS = ('contribution_reviews', 'contribution_photos')
+
+MONTHS = {m: i for i, m in enumerate(('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                                      'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+DATE_RE = re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2}),?\s+(\d{4})',
+                     re.IGNORECASE)
+NUMERIC_DATE_RE = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+CONTRIBUTION_RE = re.compile(r'^\s*(\d+)(?:\s*reviews?,\s*(\d+)\s*photos?)?', re.IGNORECASE)
+
+
+def export_format(path: str) -> str:
+    """Output format from the file extension ('csv' if unknown)"""
+    ext = os.path.splitext(path)[1].lower()
+    for fmt, extensions in FORMAT_EXTENSIONS.items():
+        if ext in extensions:
+            return fmt
+    return 'csv'
+
+
+def with_format(path: str, fmt: str) -> str:
+    """Path with the extension of fmt (unchanged if it already has one of its extensions)"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Available: {', '.join(EXPORT_FORMATS)}")
+    if export_format(path) == fmt:
+        return path
+    return os.path.splitext(path)[0] + FORMAT_EXTENSIONS[fmt][0]
+
+
+def parse_rating(value):
+    """1-5 as int, None for an empty or invalid rating"""
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        return None
+    return rating if 1 <= rating <= 5 else None
+
+
+def parse_count(value):
+    """Non-negative int, None for an empty or non-numeric value"""
+    value = (value or '').strip().replace(',', '')
+    return int(value) if value.isdigit() else None
+
+
+def parse_date(value):
+    """datetime.date from 'Mon D, YYYY' (anywhere in the text) or 'M/D/YYYY', else None"""
+    if not value:
+        return None
+    match = DATE_RE.search(value)
+    try:
+        if match:
+            return datetime.date(int(match.group(3)), MONTHS[match.group(1)[:3].lower()], int(match.group(2)))
+        match = NUMERIC_DATE_RE.search(value)
+        if match:
+            return datetime.date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+    except ValueError:
+        return None   # e.g. Feb 30
+    return None
+
+
+def split_contribution(value) -> tuple:
+    """(reviews, photos) from 'N reviews, M photos' or a single count 'N'"""
+    match = CONTRIBUTION_RE.match(value or '')
+    if not match:
+        return None, None
+    photos = match.group(2)
+    return int(match.group(1)), int(photos) if photos is not None else None
+
+
+_CONVERTERS = {
+    'rating': parse_rating,
+    'written_date': parse_date,
+    'daya_tarik_wisata': parse_count,
+}
+
+
+def typed_columns(columns) -> list:
+    """Output columns: contribution becomes its review/photo counts, review_id is added"""
+    typed = []
+    for name in output_columns(columns):
+        typed.extend(CONTRIBUTION_COLUMNS if name == 'contribution' else (name,))
+    return typed
+
+
+def review_schema(columns):
+    """pyarrow schema of the typed output columns"""
+    import pyarrow as pa
+    
+    types = {'rating': pa.int8(), 'written_date': pa.date32(), 'daya_tarik_wisata': pa.int32(),
+             'contribution_reviews': pa.int32(), 'contribution_photos': pa.int32()}
+    return pa.schema([(name, types.get(name, pa.string())) for name in typed_columns(columns)])
+
+
+class ArrowStreamWriter:
+    """Write typed review rows to Parquet or Arrow IPC in row groups"""
+    
+    def __init__(self, output_file: str, columns, row_group_size: int = ROW_GROUP_SIZE,
+                 append: bool = False, fmt: str = None):
+        """
+        Args:
+            output_file: .parquet or .arrow path
+            columns: Config columns (review_id is added, contribution is split)
+            row_group_size: Rows buffered before a row group / batch is written
+            append: Keep the rows of an existing file and add the new ones
+            fmt: 'parquet' or 'arrow' (default: from the extension)
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet/Arrow output needs pyarrow (pip install pyarrow)") from e
+        
+        self.output_file = output_file
+        self.format = fmt or export_format(output_file)
+        if self.format not in ('parquet', 'arrow'):
+            raise ValueError(f"Not a columnar format: {self.format}")
+        self.row_group_size = max(1, row_group_size)
+        self.append = append and os.path.exists(output_file)
+        self.count = 0
+        self.row_groups = 0
+        self.closed = False
+        
+        self.columns = list(columns)
+        self.schema = review_schema(self.columns)
+        self.names = self.schema.names
+        self._buffer = {name: [] for name in self.names}
+        self._split = 'contribution' in self.columns
+        
+        self.part_file = output_file + '.part'
+        if self.format == 'parquet':
+            self.writer = pq.ParquetWriter(self.part_file, self.schema, compression=COMPRESSION)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=COMPRESSION)
+            self.sink = pa.OSFile(self.part_file, 'wb')
+            self.writer = pa.ipc.new_file(self.sink, self.schema, options=options)
+        if self.append:
+            self._copy_existing()
+    
+    def _copy_existing(self):
+        """Stream the row groups of the existing output into the new file"""
+        import pyarrow as pa
+        
+        # Closed before the .part file replaces it (required on Windows)
+        with pa.OSFile(self.output_file, 'rb') as f:
+            schema, batches = _batch_reader(f, self.format)
+            if not schema.equals(self.schema):
+                self.abort()
+                os.remove(self.part_file)
+                raise ValueError(f"{self.output_file} has other columns ({', '.join(schema.names)}); "
+                                 f"use a new output file")
+            for batch in batches(batch_size=self.row_group_size):
+                self._write_table(pa.Table.from_batches([batch], schema=self.schema))
+    
+    def write(self, row: dict):
+        for name in self.names:
+            if name in CONTRIBUTION_COLUMNS:
+                continue
+            value = row.get(name)
+            convert = _CONVERTERS.get(name)
+            if convert:
+                value = convert(value)
+            elif value is not None and not isinstance(value, str):
+                value = str(value)
+            self._buffer[name].append(value)
+        if self._split:
+            reviews, photos = split_contribution(row.get('contribution'))
+            self._buffer['contribution_reviews'].append(reviews)
+            self._buffer['contribution_photos'].append(photos)
+        
+        self.count += 1
+        if len(self._buffer[self.names[0]]) >= self.row_group_size:
+            self.flush()
+    
+    def flush(self):
+        """Write the buffered rows as one row group"""
+        if not self._buffer[self.names[0]]:
+            return
+        import pyarrow as pa
+        
+        table = pa.Table.from_pydict(self._buffer, schema=self.schema)
+        self._buffer = {name: [] for name in self.names}
+        self._write_table(table)
+    
+    def _write_table(self, table):
+        if self.format == 'parquet':
+            self.writer.write_table(table, row_group_size=self.row_group_size)
+        else:
+            self.writer.write_table(table, max_chunksize=self.row_group_size)
+        self.row_groups += 1
+    
+    def _close_files(self):
+        self.writer.close()
+        if self.format == 'arrow':
+            self.sink.close()
+        self.closed = True
+    
+    def close(self) -> int:
+        """Finish the file (removed if nothing new was written), return number of new rows"""
+        if self.closed:
+            return self.count
+        self.flush()
+        self._close_files()
+        if self.count:
+            os.replace(self.part_file, self.output_file)
+        else:
+            # Nothing new: an appended output keeps its original file
+            os.remove(self.part_file)
+        return self.count
+    
+    def sync(self) -> bool:
+        """Rows only reach the output on close() (the file is rewritten), so False"""
+        return False
+    
+    def abort(self):
+        """Close without publishing; the .part file is kept"""
+        if not self.closed:
+            self._close_files()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep the .part file, the output is incomplete
+            self.abort()
+
+
+def _batch_reader(f, fmt: str):
+    """(schema, batches(columns=None, batch_size=...)) of an open Parquet/Arrow file"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if fmt == 'parquet':
+        source = pq.ParquetFile(f)
+        
+        def batches(columns=None, batch_size=ROW_GROUP_SIZE):
+            return source.iter_batches(batch_size=batch_size, columns=columns)
+        return source.schema_arrow, batches
+    
+    source = pa.ipc.open_file(f)
+    
+    def batches(columns=None, batch_size=None):
+        # IPC files keep the record batches as written
+        for i in range(source.num_record_batches):
+            batch = source.get_batch(i)
+            yield batch.select(columns) if columns is not None else batch
+    return source.schema, batches
+
+
+def open_writer(output_file: str, columns, append: bool = False, row_group_size: int = ROW_GROUP_SIZE):
+    """
+    Streaming writer for an output path
+    
+    Args:
+        output_file: .csv, .parquet/.pq or .arrow/.feather/.ipc path
+        columns: Config columns
+        append: Add rows to an existing output
+        row_group_size: Rows per row group (Parquet/Arrow only)
+    
+    Returns:
+        CSVStreamWriter or ArrowStreamWriter (both have write/close/count)
+    """
+    if export_format(output_file) == 'csv':
+        return CSVStreamWriter(output_file, columns, append=append)
+    return ArrowStreamWriter(output_file, columns, row_group_size=row_group_size, append=append)
+
+
+def write_reviews(reviews, output_file: str, columns) -> int:
+    """Write a list of reviews to a Parquet/Arrow file, return number of rows"""
+    with ArrowStreamWriter(output_file, columns) as writer:
+        for review in reviews:
+            writer.write(review)
+    return writer.count
+
+
+def read_id_rows(path: str):
+    """
+    Yield the rows of an existing Parquet/Arrow output as dicts with only
+    username and review_id (plus review_text if there is no review_id column)
+    """
+    import pyarrow as pa
+    
+    with pa.OSFile(path, 'rb') as f:
+        schema, batches = _batch_reader(f, export_format(path))
+        wanted = ['username', ID_COLUMN] if ID_COLUMN in schema.names else ['username', 'review_text']
+        for batch in batches(columns=[n for n in wanted if n in schema.names]):
+            yield from batch.to_pylist()
@@ -0,0 +1,116 @@
+"""
+Crawl Checkpoint
+State file untuk crawl live yang bisa dilanjutkan (--resume)
+
+Setiap halaman yang selesai diproses dicatat sebagai satu baris JSON
+(offset, jumlah review di halaman, counter halaman kosong, dan review baru
+hasil dedup) lalu di-flush + fsync, sehingga state tetap ada walaupun
+proses mati (timeout, Chrome crash, Ctrl+C). Baris pertama berisi URL
+target; checkpoint untuk URL lain diabaikan. Halaman dicatat berurutan
+sesuai offset, jadi offset terakhir selalu berarti semua halaman sebelumnya
+sudah selesai. Setelah crawl selesai normal, file dihapus.
+"""
+
+import os
+import json
+
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(output_file: str) -> str:
+    """State file next to the output CSV"""
+    return output_file + '.checkpoint'
+
+
+class CrawlCheckpoint:
+    """Append-only JSON-lines record of completed pages"""
+    
+    def __init__(self, path: str, url: str):
+        """
+        Args:
+            path: State file
+            url: Crawl target; a checkpoint for another URL is not resumed
+        """
+        self.path = path
+        self.url = url
+        self.last_offset = None
+        self.consecutive_empty = 0
+        self.reviews = []
+        self.pages = 0
+        self.f = None
+        self._lines = []
+    
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+    
+    def load(self) -> bool:
+        """
+        Read a previous checkpoint for the same URL
+        
+        Returns:
+            True if there is something to resume
+        """
+        if not self.exists():
+            return False
+        
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get('url') != self.url or header.get('version') != CHECKPOINT_VERSION:
+            print(f"[WARN] Checkpoint {self.path} is for another crawl, starting over")
+            return False
+        
+        self._lines = lines[:1]
+        for line in lines[1:]:
+            try:
+                page = json.loads(line)
+            except json.JSONDecodeError:
+                # Last line cut off by a crash; everything before it is complete
+                break
+            self._lines.append(line)
+            self.last_offset = page['offset']
+            self.consecutive_empty = page['empty']
+            self.reviews.extend(page['reviews'])
+            self.pages += 1
+        return self.last_offset is not None
+    
+    def open(self, resume: bool = False):
+        """Start writing; with resume=True pages are appended to the loaded state"""
+        if resume and self.last_offset is not None:
+            # Rewrite the complete lines (dropping a cut-off one), then append
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(self._lines) + '\n')
+            os.replace(tmp, self.path)
+            self.f = open(self.path, 'a', encoding='utf-8')
+            return
+        self.last_offset = None
+        self.consecutive_empty = 0
+        self.reviews = []
+        self.pages = 0
+        self.f = open(self.path, 'w', encoding='utf-8')
+        self._write({'version': CHECKPOINT_VERSION, 'url': self.url})
+    
+    def record(self, offset: int, found: int, consecutive_empty: int, reviews: list):
+        """Persist one completed page and its new (deduplicated) reviews"""
+        self._write({'offset': offset, 'found': found, 'empty': consecutive_empty, 'reviews': reviews})
+        self.last_offset = offset
+        self.consecutive_empty = consecutive_empty
+        self.pages += 1
+    
+    def _write(self, entry: dict):
+        self.f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.f.flush()
+        os.fsync(self.f.fileno())
+    
+    def close(self, finished: bool = False):
+        """Close the file; a finished crawl removes it"""
+        if self.f:
+            self.f.close()
+            self.f = None
+        if finished and self.exists():
+            os.remove(self.path)
@@ -7,14 +7,26 @@ Usage:
     python custom_scraper.py --site tripadvisor # Menggunakan config TripAdvisor
     python custom_scraper.py --site google      # Menggunakan config Google
     python custom_scraper.py --site custom      # Menggunakan config custom
+    python custom_scraper.py --watch            # Proses file baru secara terus-menerus
 """
 
 import os
 import re
-import csv
 import glob
 import argparse
-from bs4 import BeautifulSoup
+
+from extraction_plan import compile_plan, USERNAME_START_RE, NUMBER_RE
+from page_loader import read_html, make_soup, escaped_region
+import lxml_backend
+import stream_parser
+from parse_pool import resolve_jobs
+from parse_cache import ParseCache, iter_cached_files, cache_version, DEFAULT_CACHE_PATH
+from review_stream import iter_reviews, dedup_filter_years
+from columnar_export import EXPORT_FORMATS, with_format, open_writer
+from dedup_index import DedupIndex, DEFAULT_INDEX_PATH
+from near_duplicates import drop_near_duplicates, DEFAULT_THRESHOLD
+from data_validation import QualityStats
+from folder_watch import FolderWatcher, IncrementalOutput, watch, DEFAULT_INTERVAL
 
 # Import configurations
 from scraper_config import (
@@ -29,10 +41,28 @@ from scraper_config import (
 class UniversalScraper:
     """Universal scraper yang bisa dikonfigurasi untuk berbagai website"""
     
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, jobs: int = 1, strain: bool = False, backend: str = 'bs4',
+                 cache_path: str = None, rebuild_cache: bool = False, index_path: str = None,
+                 near_threshold: float = None, output_format: str = None):
         self.config = config
-        self.reviews = []
-        
+        self.plan = compile_plan(config)
+        self.jobs = resolve_jobs(jobs)
+        self.strain = strain
+        self.backend = backend
+        self.cache_path = cache_path  # None = no parse cache
+        self.rebuild_cache = rebuild_cache
+        self.index_path = index_path  # None = dedup within this run only
+        self.near_threshold = near_threshold  # None = exact dedup only
+        self.output_format = output_format  # None = from the output_file extension
+        self.quality = QualityStats()
+    
+    def __getstate__(self):
+        # parse_file is sent to the parse worker processes with the scraper;
+        # the run statistics stay here (QualityStats holds a lock)
+        state = self.__dict__.copy()
+        state.pop('quality', None)
+        return state
+    
     def find_html_files(self, directory: str) -> list:
         """Find HTML files matching pattern"""
         pattern = os.path.join(directory, self.config['file_pattern'])
@@ -50,45 +80,50 @@ class UniversalScraper:
         """Parse single HTML file"""
         print(f"[PARSE] {os.path.basename(filepath)}")
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            with open(filepath, 'r', encoding='latin-1') as f:
-                content = f.read()
+        if self.backend == 'stream':
+            reviews = stream_parser.parse_file(filepath, self.plan)
+            print(f"   Found {len(reviews)} reviews")
+            return reviews
+        
+        content = read_html(filepath)
         
-        soup = BeautifulSoup(content, 'lxml')
+        reviews = None
+        if self.backend == 'lxml':
+            reviews = lxml_backend.parse_content(content, self.plan)
+        elif self.strain:
+            region_tags = [self.plan.container_tag, self.plan.review_tag]
+            reviews = self.extract_reviews(make_soup(content, region_tags), strained=True)
+        if reviews is None:
+            reviews = self.extract_reviews(make_soup(content))
+        
+        print(f"   Found {len(reviews)} reviews")
+        return reviews
+    
+    def extract_reviews(self, soup, strained: bool = False) -> list:
+        """Extract all reviews from a parsed page (None if a strained tree is not enough)"""
         reviews = []
         
         # Find review text elements
-        sel = self.config['selectors']['review_text']
-        
-        # Build search kwargs
-        search_kwargs = {'name': sel['tag']}
-        if 'attrs' in sel:
-            for attr_name, attr_val in sel['attrs'].items():
-                if attr_name == 'class':
-                    # Class contains pattern
-                    search_kwargs['class_'] = re.compile(attr_val)
-                elif attr_name == 'lang':
-                    search_kwargs['lang'] = attr_val
-                else:
-                    search_kwargs['attrs'] = {attr_name: re.compile(attr_val)}
-        
-        review_elements = soup.find_all(**search_kwargs)
-        
-        for elem in review_elements:
-            review = self.extract_review(elem, soup)
+        review_elements = soup.find_all(**self.plan.review_search)
+        
+        containers = [None] * len(review_elements)
+        if strained:
+            # Container walk-ups must stay inside the strained review region
+            containers = [self.find_container(elem) for elem in review_elements]
+            if any(escaped_region(c) for c in containers):
+                return None
+        
+        for elem, container in zip(review_elements, containers):
+            review = self.extract_review(elem, soup, container)
             if review and review.get('username'):
                 reviews.append(review)
         
-        print(f"   Found {len(reviews)} reviews")
         return reviews
     
-    def extract_review(self, elem, soup) -> dict:
+    def extract_review(self, elem, soup, container=None) -> dict:
         """Extract review data from element"""
         # Initialize with all columns
-        review = {col: '' for col in self.config['columns']}
+        review = {col: '' for col in self.plan.columns}
         
         # Get review text
         review_text = elem.get_text(strip=True)
@@ -97,7 +132,8 @@ class UniversalScraper:
         review['review_text'] = review_text
         
         # Find container
-        container = self.find_container(elem)
+        if container is None:
+            container = self.find_container(elem)
         if not container:
             return None
         
@@ -109,17 +145,17 @@ class UniversalScraper:
             return None
         
         # Extract other fields using patterns
-        patterns = self.config.get('patterns', {})
+        plan = self.plan
         
         # Location
-        if 'location' in patterns and 'from' in review:
-            match = re.search(patterns['location'], container_text)
+        if plan.location_re and 'from' in review:
+            match = plan.location_re.search(container_text)
             if match:
                 review['from'] = match.group(1) if match.lastindex else match.group()
         
         # Date
-        if 'date' in patterns and 'written_date' in review:
-            match = re.search(patterns['date'], container_text)
+        if plan.date_re and 'written_date' in review:
+            match = plan.date_re.search(container_text)
             if match:
                 review['written_date'] = match.group()
         
@@ -127,14 +163,14 @@ class UniversalScraper:
         review['rating'] = self.extract_rating(container)
         
         # Helpful count
-        if 'helpful' in patterns and 'daya_tarik_wisata' in review:
-            match = re.search(patterns['helpful'], container_text)
+        if plan.helpful_re and 'daya_tarik_wisata' in review:
+            match = plan.helpful_re.search(container_text)
             if match:
                 review['daya_tarik_wisata'] = match.group(1)
         
         # Contribution
-        if 'contribution' in patterns and 'contribution' in review:
-            match = re.search(patterns['contribution'], container_text)
+        if plan.contribution_re and 'contribution' in review:
+            match = plan.contribution_re.search(container_text)
             if match:
                 review['contribution'] = f"{match.group(1)} reviews, {match.group(2)} photos"
         
@@ -150,24 +186,17 @@ class UniversalScraper:
     
     def find_container(self, elem):
         """Find parent container for review"""
-        sel = self.config['selectors']
-        container_tag = sel.get('container_tag', 'div')
-        levels = sel.get('container_levels_up', 10)
+        plan = self.plan
         
         current = elem
-        for _ in range(levels):
+        for _ in range(plan.container_levels):
             parent = current.parent
             if parent is None:
                 break
-            if parent.name == container_tag:
+            if parent.name == plan.container_tag:
                 # Check if this container has a user link
-                username_sel = sel.get('username', {})
-                user_tag = username_sel.get('tag', 'a')
-                user_attrs = username_sel.get('attrs', {})
-                
-                # Build search
-                for attr_name, attr_val in user_attrs.items():
-                    user_elem = parent.find(user_tag, attrs={attr_name: re.compile(attr_val)})
+                for probe in plan.username_probes:
+                    user_elem = parent.find(plan.username_tag, attrs=probe)
                     if user_elem:
                         return parent
             current = parent
@@ -176,43 +205,37 @@ class UniversalScraper:
     
     def extract_username(self, container) -> str:
         """Extract username from container"""
-        sel = self.config['selectors'].get('username', {})
-        tag = sel.get('tag', 'a')
-        attrs = sel.get('attrs', {})
-        
-        # Build search kwargs
-        search_kwargs = {}
-        for attr_name, attr_val in attrs.items():
-            search_kwargs[attr_name] = re.compile(attr_val)
+        plan = self.plan
         
-        links = container.find_all(tag, attrs=search_kwargs) if search_kwargs else container.find_all(tag)
+        if plan.username_attrs:
+            links = container.find_all(plan.username_tag, attrs=plan.username_attrs)
+        else:
+            links = container.find_all(plan.username_tag)
         
         for link in links:
             text = link.get_text(strip=True)
-            if text and len(text) >= 2 and re.match(r'^[A-Za-z]', text):
+            if text and len(text) >= 2 and USERNAME_START_RE.match(text):
                 return text
         
         return ''
     
     def extract_rating(self, container) -> str:
         """Extract rating from container"""
-        sel = self.config['selectors'].get('rating', {})
+        plan = self.plan
         
         # Try aria-label pattern
-        if 'aria_label_pattern' in sel:
-            pattern = sel['aria_label_pattern']
-            elem = container.find(attrs={'aria-label': re.compile(pattern, re.I)})
+        if plan.rating_aria_attrs:
+            elem = container.find(attrs=plan.rating_aria_attrs)
             if elem:
-                match = re.search(r'(\d+)', elem.get('aria-label', ''))
+                match = NUMBER_RE.search(elem.get('aria-label', ''))
                 if match:
                     return match.group(1)
         
         # Try class pattern (for TripAdvisor style)
-        if 'class_pattern' in sel:
-            pattern = sel['class_pattern']
+        if plan.rating_class_re:
             for elem in container.find_all(class_=True):
                 for cls in elem.get('class', []):
-                    match = re.search(pattern, cls)
+                    match = plan.rating_class_re.search(cls)
                     if match:
                         return str(int(match.group(1)) // 10)  # bubble_50 -> 5
         
@@ -220,56 +243,88 @@ class UniversalScraper:
     
     def extract_elite(self, container) -> str:
         """Extract elite/status from container"""
-        sel = self.config['selectors'].get('elite', {})
-        if not sel:
+        plan = self.plan
+        if not plan.elite_tag:
             return ''
         
-        tag = sel.get('tag', 'a')
-        attrs = sel.get('attrs', {})
-        
-        search_kwargs = {}
-        for attr_name, attr_val in attrs.items():
-            search_kwargs[attr_name] = attr_val
-        
-        elem = container.find(tag, attrs=search_kwargs)
+        elem = container.find(plan.elite_tag, attrs=plan.elite_attrs)
         if elem:
             return elem.get_text(strip=True)
         
         return ''
     
-    def filter_by_year(self, reviews: list) -> list:
-        """Filter reviews by year"""
+    def year_range(self):
+        """(start, end) of the configured year filter, None when disabled"""
         year_filter = self.config.get('year_filter', {})
         if not year_filter.get('enabled', False):
-            return reviews
+            return None
+        return (year_filter.get('start', 2019), year_filter.get('end', 2025))
+    
+    def open_cache(self):
+        """Open the parse cache (None when caching is disabled)"""
+        if not self.cache_path:
+            return None
+        cache = ParseCache(self.cache_path)
+        if self.rebuild_cache:
+            cache.clear()
+            self.rebuild_cache = False
+        return cache
+    
+    def open_index(self, output_file: str):
+        """Open the persistent dedup index for an output CSV (None when disabled)"""
+        if not self.index_path:
+            return None
+        index = DedupIndex(self.index_path, scope=self.config['name'])
+        seeded = index.seed_from_csv(output_file)
+        if seeded:
+            print(f"[INDEX] {seeded} review(s) from {output_file} added to the index")
+        return index
+    
+    def watch(self, directory: str = None, interval: float = DEFAULT_INTERVAL):
+        """Keep parsing new/changed files and append new reviews to the output CSV"""
+        if directory is None:
+            directory = os.path.dirname(os.path.abspath(__file__))
         
-        start = year_filter.get('start', 2019)
-        end = year_filter.get('end', 2025)
+        output_file = os.path.join(directory, self.config['output_file'])
+        index = self.open_index(output_file)
+        output = IncrementalOutput(output_file, self.config['columns'], seen=index)
         
-        filtered = []
-        for r in reviews:
-            date_str = r.get('written_date', '')
-            match = re.search(r'(\d{4})', date_str)
-            if match:
-                year = int(match.group(1))
-                if start <= year <= end:
-                    filtered.append(r)
+        print("=" * 60)
+        print(f"UNIVERSAL SCRAPER - {self.config['name'].upper()} (WATCH)")
+        print("=" * 60)
+        print(f"Directory: {directory}")
+        print(f"Pattern: {self.config['file_pattern']}")
+        print(f"Output: {output_file} ({output.total} existing reviews)")
         
-        return filtered
-    
-    def save_csv(self, reviews: list, output_path: str):
-        """Save reviews to CSV"""
-        columns = self.config['columns']
+        cache = self.open_cache()
+        version = cache_version(self.plan, self.backend)
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(reviews)
+        def process_files(files):
+            for f, reviews in iter_cached_files(self.parse_file, files, cache, version, self.jobs):
+                added = output.add(reviews, self.year_range())
+                print(f"[WATCH] {os.path.basename(f)}: {len(reviews)} reviews, "
+                      f"{added} new (total {output.total})")
         
-        print(f"\n[SAVED] {len(reviews)} reviews -> {output_path}")
+        watcher = FolderWatcher(lambda: self.find_html_files(directory), interval)
+        try:
+            watch(watcher, process_files)
+        finally:
+            if cache:
+                cache.close()
+            if index:
+                index.close()
+        
+        return output.total
     
-    def run(self, directory: str = None):
-        """Run the scraper"""
+    def run(self, directory: str = None) -> int:
+        """
+        Run the scraper; reviews are streamed to the output file
+        
+        Returns:
+            Number of reviews written. The reviews are not kept in memory
+            (read the output file for them), so unlike earlier versions
+            no list of reviews is returned.
+        """
         if directory is None:
             directory = os.path.dirname(os.path.abspath(__file__))
         
@@ -278,6 +333,7 @@ class UniversalScraper:
         print("=" * 60)
         print(f"Directory: {directory}")
         print(f"Pattern: {self.config['file_pattern']}")
+        print(f"Jobs: {self.jobs} | Backend: {self.backend}")
         
         # Find files
         files = self.find_html_files(directory)
@@ -285,40 +341,59 @@ class UniversalScraper:
         
         if not files:
             print("[ERROR] No HTML files found!")
-            return []
-        
-        # Parse all files
-        all_reviews = []
-        for f in files:
-            reviews = self.parse_file(f)
-            all_reviews.extend(reviews)
-        
-        # Deduplicate
-        seen = set()
-        unique = []
-        for r in all_reviews:
-            key = (r.get('username', ''), r.get('review_text', '')[:100])
-            if key not in seen and r.get('username'):
-                seen.add(key)
-                unique.append(r)
-        
-        print(f"\nTotal unique: {len(unique)}")
-        
-        # Filter by year
-        if self.config.get('year_filter', {}).get('enabled'):
-            unique = self.filter_by_year(unique)
-            start = self.config['year_filter']['start']
-            end = self.config['year_filter']['end']
-            print(f"After year filter ({start}-{end}): {len(unique)}")
-        
-        # Save
-        if unique:
-            output = os.path.join(directory, self.config['output_file'])
-            self.save_csv(unique, output)
+            return 0
+        
+        # Parse all files (unchanged files come from the parse cache)
+        cache = self.open_cache()
+        version = cache_version(self.plan, self.backend)
+        
+        # Stream: files -> reviews -> dedup -> year filter -> CSV
+        # With the dedup index only reviews not collected before are appended
+        output = os.path.join(directory, self.config['output_file'])
+        if self.output_format:
+            output = with_format(output, self.output_format)
+        index = self.open_index(output)
+        stats = {}
+        samples = []
+        self.quality = QualityStats()
+        
+        results = iter_cached_files(self.parse_file, files, cache, version, self.jobs)
+        years = self.year_range()
+        reviews = dedup_filter_years(iter_reviews(results, stats), years, index)
+        if self.near_threshold:
+            reviews = drop_near_duplicates(reviews, self.near_threshold, stats=stats)
+        
+        with open_writer(output, self.config['columns'], append=index is not None) as writer:
+            for r in reviews:
+                writer.write(r)
+                self.quality.add(r)
+                if len(samples) < 2:
+                    samples.append(r)
+        
+        if cache:
+            print(f"[CACHE] {cache.hits} file(s) from cache, {cache.misses} parsed")
+            cache.close()
+        
+        if index:
+            print(f"[INDEX] {index.added} new review(s), {index.count()} known for {self.config['name']}")
+            index.close()
+        
+        print(f"\nTotal extracted: {stats.get('reviews', 0)}")
+        if self.near_threshold:
+            print(f"Near-duplicates dropped: {stats.get('near_duplicates', 0)}")
+        if years:
+            print(f"Unique after year filter ({years[0]}-{years[1]}): {writer.count}")
+        else:
+            print(f"Unique: {writer.count}")
+        if self.quality.total:
+            print(f"[QUALITY] {self.quality.summary()}")
+        
+        if writer.count:
+            print(f"\n[SAVED] {writer.count} reviews -> {output}")
             
             # Show samples
             print("\n--- Samples ---")
-            for i, r in enumerate(unique[:2]):
+            for i, r in enumerate(samples):
                 print(f"\n[{i+1}] {r.get('username', 'N/A')}")
                 for k, v in r.items():
                     if v and k != 'review_text':
@@ -326,7 +401,7 @@ class UniversalScraper:
                 text = r.get('review_text', '')[:60]
                 print(f"    review: {text}...")
         
-        return unique
+        return writer.count
 
 
 def get_config(site_name: str) -> dict:
@@ -347,6 +422,31 @@ def main():
                         help='Site configuration to use')
     parser.add_argument('--dir', type=str, default=None,
                         help='Directory containing HTML files')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Parse files in N processes (0 = all cores, default: 1)')
+    parser.add_argument('--strain', action='store_true',
+                        help='Only build the tree for review containers (faster, less memory)')
+    parser.add_argument('--backend', type=str, default='bs4', choices=lxml_backend.BACKENDS,
+                        help='Extraction backend (default: bs4)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse every file, ignoring the parse cache')
+    parser.add_argument('--rebuild-cache', action='store_true',
+                        help='Clear the parse cache before running')
+    parser.add_argument('--dedup-index', action='store_true',
+                        help='Skip reviews collected in earlier runs and append new ones to the CSV')
+    parser.add_argument('--near-dup', action='store_true',
+                        help='Also drop near-duplicate reviews by the same user (edited, "Read more" cut)')
+    parser.add_argument('--near-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Near-duplicate similarity threshold 0-1 (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and process new/changed files as they are saved')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f'Watch polling interval in seconds (default: {DEFAULT_INTERVAL})')
+    parser.add_argument('--quality-report', action='store_true',
+                        help='Print the full validation report of the written reviews (kept while scraping)')
+    parser.add_argument('--format', type=str, default=None, choices=EXPORT_FORMATS,
+                        help='Output format: csv, or typed parquet/arrow written in row groups '
+                             '(default: from the config output_file extension)')
     
     args = parser.parse_args()
     
@@ -357,8 +457,22 @@ def main():
         config = ACTIVE_CONFIG
     
     # Run scraper
-    scraper = UniversalScraper(config)
-    scraper.run(args.dir)
+    scraper = UniversalScraper(
+        config, jobs=args.jobs, strain=args.strain, backend=args.backend,
+        cache_path=None if args.no_cache else DEFAULT_CACHE_PATH,
+        rebuild_cache=args.rebuild_cache,
+        index_path=DEFAULT_INDEX_PATH if args.dedup_index else None,
+        near_threshold=args.near_threshold if args.near_dup else None,
+        output_format=args.format
+    )
+    if args.watch:
+        if args.format and args.format != 'csv':
+            print("[WARN] Watch mode appends to the CSV output; --format is ignored")
+        scraper.watch(args.dir, args.interval)
+    else:
+        scraper.run(args.dir)
+        if args.quality_report and scraper.quality.total:
+            print('\n'.join(scraper.quality.report().lines()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,423 @@
+"""
+Data Validation
+Validasi hasil scraping secara kolumnar (pandas/NumPy)
+
+Semua pemeriksaan dijalankan sebagai operasi kolom pada satu DataFrame,
+bukan loop Python per review: field kosong, rating (valid 1-5 dan
+distribusinya), tanggal (valid dan distribusi tahun), panjang teks,
+duplikat (username + 100 karakter awal review_text) dan skor kualitas.
+Hasilnya berupa ValidationReport yang dirender GUI (lines()) dan bisa
+dicetak sebagai JSON dari command line. Near-duplicate (MinHash, lihat
+near_duplicates.py) tetap per review dan hanya dijalankan jika diminta.
+
+QualityStats menyimpan agregat yang sama secara incremental selama
+scraping (add() per review), sehingga skor kualitas tersedia kapan saja
+dan report untuk run yang selesai tidak perlu memindai ulang data.
+
+Usage:
+    python data_validation.py scraped_reviews.csv
+    python data_validation.py scraped_reviews.csv --json --near-dup
+"""
+
+import re
+import json
+import operator
+import threading
+import argparse
+from dataclasses import dataclass, field, asdict
+from typing import Optional, TYPE_CHECKING
+
+from near_duplicates import find_near_duplicates
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+CHECK_FIELDS = ('username', 'from', 'written_date', 'rating', 'review_text')
+REQUIRED_FIELDS = ('username', 'review_text')  # empty values are issues, not warnings
+
+DATE_YEAR_RE = re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+(\d{4})')
+SHORT_REVIEW = 50
+DUPLICATE_PREFIX = 100
+BAR_WIDTH = 20
+
+
+@dataclass
+class ValidationReport:
+    """Result of validating a set of reviews"""
+    
+    total: int
+    empty: dict                          # field -> empty values
+    ratings_valid: int = 0
+    ratings_invalid: int = 0
+    rating_distribution: dict = field(default_factory=lambda: {star: 0 for star in range(1, 6)})
+    dates_valid: int = 0
+    dates_invalid: int = 0
+    year_distribution: dict = field(default_factory=dict)
+    text_length: Optional[dict] = None   # avg, min, max
+    short_reviews: int = 0
+    duplicates: int = 0
+    near_duplicates: Optional[list] = None   # [{'size', 'usernames', 'preview'}], None = not checked
+    issues: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+    score: int = 100
+    
+    def assess(self):
+        """Derive issues, warnings and the quality score from the counts"""
+        self.issues = []
+        self.warnings = []
+        for name, count in self.empty.items():
+            if count > 0 and name in REQUIRED_FIELDS:
+                self.issues.append(f"{name} has {count} empty values")
+            elif count > 0:
+                self.warnings.append(f"{name} has {count} empty values")
+        if self.ratings_invalid:
+            self.issues.append(f"{self.ratings_invalid} invalid ratings")
+        if self.dates_invalid:
+            self.warnings.append(f"{self.dates_invalid} invalid dates")
+        if self.short_reviews:
+            self.warnings.append(f"{self.short_reviews} very short reviews")
+        if self.duplicates:
+            self.warnings.append(f"{self.duplicates} potential duplicates")
+        if self.near_duplicates:
+            self.warnings.append(f"{len(self.near_duplicates)} near-duplicate groups")
+        self.score = max(0, 100 - len(self.issues) * 20 - len(self.warnings) * 5)
+        return self
+    
+    @property
+    def quality(self) -> str:
+        if self.score >= 80:
+            return 'GOOD'
+        if self.score >= 50:
+            return 'ACCEPTABLE'
+        return 'NEEDS REVIEW'
+    
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data['quality'] = self.quality
+        return data
+    
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+    
+    def lines(self) -> list:
+        """Human-readable report, one log line per entry"""
+        total = self.total
+        out = ["\n" + "=" * 50, "DATA VALIDATION REPORT", "=" * 50, f"\nTotal Reviews: {total}"]
+        
+        out.append("\n--- Empty Fields Check ---")
+        for name, count in self.empty.items():
+            pct = (count / total) * 100 if total else 0.0
+            status = "✓" if count == 0 else "⚠" if pct < 20 else "✗"
+            out.append(f"  {status} {name}: {count} empty ({pct:.1f}%)")
+        
+        out.append("\n--- Rating Validation ---")
+        out.append(f"  ✓ Valid ratings (1-5): {self.ratings_valid}")
+        if self.ratings_invalid:
+            out.append(f"  ✗ Invalid ratings: {self.ratings_invalid}")
+        out.append("  Rating distribution:")
+        for star, count in self.rating_distribution.items():
+            out.append(f"    {star}★: {count} {_bar(count, total)}")
+        
+        out.append("\n--- Date Validation ---")
+        out.append(f"  ✓ Valid dates: {self.dates_valid}")
+        if self.dates_invalid:
+            out.append(f"  ⚠ Invalid/missing dates: {self.dates_invalid}")
+        out.append("  Year distribution:")
+        for year in sorted(self.year_distribution):
+            count = self.year_distribution[year]
+            out.append(f"    {year}: {count} {_bar(count, total)}")
+        
+        out.append("\n--- Review Text Analysis ---")
+        if self.text_length:
+            out.append(f"  Average length: {self.text_length['avg']:.0f} chars")
+            out.append(f"  Min length: {self.text_length['min']} chars")
+            out.append(f"  Max length: {self.text_length['max']} chars")
+            if self.short_reviews:
+                out.append(f"  ⚠ Short reviews (<{SHORT_REVIEW} chars): {self.short_reviews}")
+        
+        out.append("\n--- Duplicate Check ---")
+        if not self.duplicates:
+            out.append("  ✓ No duplicates found")
+        else:
+            out.append(f"  ⚠ Potential duplicates: {self.duplicates}")
+        
+        if self.near_duplicates is not None:
+            out.append("\n--- Near-Duplicate Check ---")
+            if not self.near_duplicates:
+                out.append("  ✓ No near-duplicates found")
+            else:
+                involved = sum(group['size'] for group in self.near_duplicates)
+                out.append(f"  ⚠ Near-duplicate groups: {len(self.near_duplicates)} ({involved} reviews)")
+                for group in self.near_duplicates[:3]:
+                    out.append(f"    [{', '.join(group['usernames'])}] {group['preview']}...")
+        
+        out.extend(["\n" + "=" * 50, "VALIDATION SUMMARY", "=" * 50])
+        if not self.issues and not self.warnings:
+            out.append("✓ All checks passed! Data looks valid.")
+        else:
+            if self.issues:
+                out.append(f"\n✗ Issues ({len(self.issues)}):")
+                out.extend(f"   - {issue}" for issue in self.issues)
+            if self.warnings:
+                out.append(f"\n⚠ Warnings ({len(self.warnings)}):")
+                out.extend(f"   - {warning}" for warning in self.warnings)
+        out.append(f"\nData Quality Score: {self.score}/100")
+        out.append(f"→ Data quality: {self.quality}")
+        out.append("=" * 50)
+        return out
+
+
+def _bar(count: int, total: int) -> str:
+    return "█" * int(count / max(1, total) * BAR_WIDTH)
+
+
+def _rating(value: str) -> int:
+    """1-5 for a valid rating, 0 for an invalid one, -1 if empty"""
+    if not value:
+        return -1
+    try:
+        rating = int(value)
+    except ValueError:
+        return 0
+    return rating if 1 <= rating <= 5 else 0
+
+
+def _year(value: str):
+    """Year of a valid date, '' for an invalid one, None if empty"""
+    if not value:
+        return None
+    match = DATE_YEAR_RE.search(value)
+    return match.group(1) if match else ''
+
+
+def _text(value) -> str:
+    if isinstance(value, str):
+        return value
+    if value is None or value != value:   # None / NaN
+        return ''
+    return str(value)
+
+
+def reviews_frame(reviews) -> 'pd.DataFrame':
+    """Columnar table of the checked fields (missing/None values become '')"""
+    import pandas as pd
+    return pd.DataFrame({name: pd.Series([_text(r.get(name)) for r in reviews], dtype=object)
+                         for name in CHECK_FIELDS})
+
+
+def _column(df: 'pd.DataFrame', name: str) -> 'np.ndarray':
+    """Column as an object array of str ('' for missing values or columns)"""
+    import numpy as np
+    import pandas as pd
+    
+    if name not in df:
+        return np.full(len(df), '', dtype=object)
+    values = df[name].to_numpy(dtype=object)
+    if len(values) and pd.api.types.infer_dtype(values, skipna=False) != 'string':
+        values = np.array([_text(v) for v in values] or [], dtype=object)
+    return values
+
+
+def _count_codes(values: 'np.ndarray', classify, labels: list) -> 'np.ndarray':
+    """
+    Count rows per class, classifying each distinct value only once
+    
+    Few distinct values (ratings, dates) are parsed in Python with exact
+    int()/re semantics; the class is broadcast to the rows through the
+    factorized codes and counted with bincount.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    codes, uniques = pd.factorize(values)
+    classes = np.array([labels.index(classify(v)) for v in uniques], dtype=np.int64)
+    return np.bincount(classes[codes], minlength=len(labels)) if len(codes) else np.zeros(len(labels), np.int64)
+
+
+def validate_frame(df: 'pd.DataFrame', near_duplicates: bool = False) -> ValidationReport:
+    """
+    Run all checks on a DataFrame of reviews
+    
+    Args:
+        df: One row per review; CHECK_FIELDS columns that are missing count
+            as empty
+        near_duplicates: Also run the (per review) MinHash near-duplicate check
+    
+    Returns:
+        ValidationReport
+    """
+    # pandas/NumPy are imported on first validation, not at program start
+    import numpy as np
+    import pandas as pd
+    
+    total = len(df)
+    cols = {name: _column(df, name) for name in CHECK_FIELDS}
+    
+    # Long free text is not converted to a fixed-width or Arrow string
+    # column (that copy costs more than the checks); per-value string
+    # operations run through map() in C and land in NumPy arrays
+    empty = {name: list(map(str.strip, values)).count('') for name, values in cols.items()}
+    report = ValidationReport(total=total, empty=empty)
+    
+    ratings = _count_codes(cols['rating'], _rating, [-1, 0, 1, 2, 3, 4, 5])
+    report.ratings_invalid = int(ratings[1])
+    report.ratings_valid = int(ratings[2:].sum())
+    report.rating_distribution = {star: int(ratings[star + 1]) for star in range(1, 6)}
+    
+    # Dates: 'Mon D, YYYY' anywhere in the value
+    years = sorted({_year(v) for v in pd.unique(cols['written_date'])} - {None, ''})
+    dates = _count_codes(cols['written_date'], _year, [None, ''] + years)
+    report.dates_invalid = int(dates[1])
+    report.dates_valid = int(dates[2:].sum())
+    report.year_distribution = {year: int(count) for year, count in zip(years, dates[2:])}
+    
+    lengths = np.fromiter(map(len, cols['review_text']), dtype=np.int64, count=total)
+    if total:
+        report.text_length = {'avg': float(lengths.mean()), 'min': int(lengths.min()), 'max': int(lengths.max())}
+        report.short_reviews = int((lengths < SHORT_REVIEW).sum())
+    
+    # Duplicate key (username, text prefix) as one int64 per row
+    users, _ = pd.factorize(cols['username'])
+    prefix = operator.itemgetter(slice(DUPLICATE_PREFIX))
+    prefixes, _ = pd.factorize(np.array(list(map(prefix, cols['review_text'])), dtype=object))
+    keys = users.astype(np.int64) * (int(prefixes.max(initial=0)) + 1) + prefixes
+    report.duplicates = total - len(np.unique(keys))
+    
+    if near_duplicates:
+        records = [{'username': u, 'review_text': t} for u, t in zip(cols['username'], cols['review_text'])]
+        report.near_duplicates = near_duplicate_groups(records)
+    return report.assess()
+
+
+def near_duplicate_groups(reviews: list) -> list:
+    """Near-duplicate clusters as report entries (size, first usernames, preview)"""
+    return [
+        {'size': len(cluster),
+         'usernames': [_text(reviews[i].get('username')) for i in cluster[:4]],
+         'preview': _text(reviews[cluster[0]].get('review_text'))[:50]}
+        for cluster in find_near_duplicates(reviews)
+    ]
+
+
+class QualityStats:
+    """
+    Running validation aggregates, updated once per review
+    
+    Holds the same counts as validate_frame (empty fields, rating and year
+    histograms, length stats, duplicate keys), so report() and score are
+    available at any moment without rescanning the reviews. Thread-safe:
+    a worker can add() while the UI reads the score.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.empty = {name: 0 for name in CHECK_FIELDS}
+        self.ratings = {value: 0 for value in (-1, 0, 1, 2, 3, 4, 5)}   # -1 = empty, 0 = invalid
+        self.dates_invalid = 0
+        self.years = {}
+        self.length_sum = 0
+        self.length_min = None
+        self.length_max = 0
+        self.short_reviews = 0
+        self.duplicates = 0
+        self._keys = set()
+        self._lock = threading.Lock()
+    
+    def add(self, review: dict):
+        """Count one review"""
+        values = {name: _text(review.get(name)) for name in CHECK_FIELDS}
+        rating = _rating(values['rating'])
+        year = _year(values['written_date'])
+        text = values['review_text']
+        length = len(text)
+        key = (values['username'], text[:DUPLICATE_PREFIX])   # exact, like validate_frame
+        
+        with self._lock:
+            self.total += 1
+            for name, value in values.items():
+                if not value.strip():
+                    self.empty[name] += 1
+            self.ratings[rating] += 1
+            if year == '':
+                self.dates_invalid += 1
+            elif year is not None:
+                self.years[year] = self.years.get(year, 0) + 1
+            self.length_sum += length
+            self.length_min = length if self.length_min is None else min(self.length_min, length)
+            self.length_max = max(self.length_max, length)
+            if length < SHORT_REVIEW:
+                self.short_reviews += 1
+            if key in self._keys:
+                self.duplicates += 1
+            else:
+                self._keys.add(key)
+    
+    def update(self, reviews):
+        for review in reviews:
+            self.add(review)
+    
+    def report(self) -> ValidationReport:
+        """Validation report of everything added so far (near-duplicates not checked)"""
+        with self._lock:
+            report = ValidationReport(
+                total=self.total,
+                empty=dict(self.empty),
+                ratings_valid=sum(self.ratings[star] for star in range(1, 6)),
+                ratings_invalid=self.ratings[0],
+                rating_distribution={star: self.ratings[star] for star in range(1, 6)},
+                dates_valid=sum(self.years.values()),
+                dates_invalid=self.dates_invalid,
+                year_distribution=dict(sorted(self.years.items())),
+                short_reviews=self.short_reviews,
+                duplicates=self.duplicates,
+            )
+            if self.total:
+                report.text_length = {'avg': self.length_sum / self.total,
+                                      'min': self.length_min, 'max': self.length_max}
+        return report.assess()
+    
+    @property
+    def score(self) -> int:
+        return self.report().score
+    
+    def summary(self) -> str:
+        """One-line quality summary for progress output"""
+        report = self.report()
+        text = f"score {report.score}/100 ({report.quality})"
+        if report.issues or report.warnings:
+            text += f"; {'; '.join(report.issues + report.warnings)}"
+        return text
+
+
+def validate_reviews(reviews, near_duplicates: bool = False) -> ValidationReport:
+    """Validate a list of review dicts"""
+    return validate_frame(reviews_frame(reviews), near_duplicates)
+
+
+def validate_csv(path: str, near_duplicates: bool = False) -> ValidationReport:
+    """Validate a scraped CSV (all columns read as text)"""
+    import pandas as pd
+    df = pd.read_csv(path, dtype=object, keep_default_na=False, encoding='utf-8')
+    return validate_frame(df, near_duplicates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate a scraped reviews CSV')
+    parser.add_argument('csv', type=str, help='CSV written by the scrapers')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the report as JSON')
+    parser.add_argument('--near-dup', action='store_true',
+                        help='Also look for near-duplicate reviews (slower, per review)')
+    args = parser.parse_args()
+    
+    report = validate_csv(args.csv, args.near_dup)
+    if args.json:
+        print(report.to_json())
+    else:
+        print('\n'.join(report.lines()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Dedup Index
+Index review_id yang disimpan di disk (SQLite) untuk dedup lintas run
+
+Setiap review yang sudah ditulis ke output dicatat dengan review_id-nya
+(lihat review_stream.review_id) per scope (mis. nama config / bisnis).
+Run berikutnya dengan scope yang sama melewati review tersebut, jadi
+pengumpulan ulang bisnis yang sama hanya menambahkan review baru. Cek dan
+tambah masing-masing O(1) lewat primary key. Saat index dibuka untuk output
+yang sudah ada, ID baris di output tersebut yang belum ada di index
+dimasukkan (seed_from_csv).
+
+ID baru baru disimpan permanen saat commit(), yaitu setelah output berhasil
+ditulis. Jika run mati setelah baris sudah di-flush ke CSV tapi sebelum
+commit, baris itu dimasukkan ke index oleh seed_from_csv di run berikutnya,
+jadi tidak ditulis dua kali.
+"""
+
+import os
+import time
+import csv
+import sqlite3
+
+from review_stream import review_id, trim_partial_row, ID_COLUMN
+from columnar_export import export_format, read_id_rows
+
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser('~'), '.scraper_cache', 'dedup_index.sqlite3')
+
+
+class DedupIndex:
+    """Persistent set of review IDs, usable as `seen` in dedup_reviews"""
+    
+    def __init__(self, path: str = DEFAULT_INDEX_PATH, scope: str = 'default'):
+        """
+        Args:
+            path: SQLite file
+            scope: Namespace for the IDs (one per business / output)
+        """
+        self.path = path
+        self.scope = scope
+        self.added = 0
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_reviews (
+                scope TEXT NOT NULL,
+                review_id TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                PRIMARY KEY (scope, review_id)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+    
+    def __contains__(self, review_id: str) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM seen_reviews WHERE scope = ? AND review_id = ?",
+            (self.scope, review_id)
+        ).fetchone()
+        return row is not None
+    
+    def add(self, review_id: str):
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO seen_reviews VALUES (?, ?, ?)",
+            (self.scope, review_id, time.time())
+        )
+        self.added += cursor.rowcount
+    
+    def count(self) -> int:
+        """Number of IDs stored for this scope"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM seen_reviews WHERE scope = ?", (self.scope,)
+        ).fetchone()[0]
+    
+    def seed_from_csv(self, csv_path: str) -> int:
+        """
+        Add the reviews of an existing output that are missing from the index
+        
+        Called before rows are appended to an output: the first time the
+        index is enabled for it all its rows are added, after a run that
+        died between a CSV flush and the index commit only those last rows.
+        Either way they are not appended again. Parquet/Arrow outputs (see
+        columnar_export.py) are read as well.
+        
+        Args:
+            csv_path: Output file
+        
+        Returns:
+            Number of IDs added
+        """
+        if not os.path.exists(csv_path):
+            return 0
+        added = self.added
+        if export_format(csv_path) != 'csv':
+            for row in read_id_rows(csv_path):
+                if row.get('username'):
+                    self.add(row.get(ID_COLUMN) or review_id(row))
+        else:
+            # A row cut off by a crash is dropped before its ID is taken
+            if trim_partial_row(csv_path):
+                print(f"[WARN] Dropped an incomplete last row from {csv_path}")
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    if row.get('username'):
+                        self.add(row.get(ID_COLUMN) or review_id(row))
+        self.commit()
+        
+        # Seeded rows are not new reviews
+        seeded, self.added = self.added - added, added
+        return seeded
+    
+    def clear(self):
+        """Forget every ID in this scope"""
+        self.conn.execute("DELETE FROM seen_reviews WHERE scope = ?", (self.scope,))
+        self.conn.commit()
+    
+    def commit(self):
+        self.conn.commit()
+    
+    def close(self, commit: bool = True):
+        """Close the index; with commit=False IDs added since the last commit are dropped"""
+        if commit:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+        self.conn.close()
@@ -0,0 +1,138 @@
+"""
+Driver Pool
+Beberapa WebDriver yang mengambil halaman secara paralel
+
+DriverPool menyimpan hingga `size` driver yang dibuat lewat factory (fungsi
+tanpa argumen yang mengembalikan driver). Factory bisa diganti, mis. dengan
+driver palsu yang mengambil halaman dari HTTP server lokal, sehingga pool
+bisa dicoba tanpa Chrome (lihat benchmarks/fake_site.py).
+
+Pool dipakai oleh fungsi fetch di page_pipeline.run_pipeline, yang
+mengambil beberapa halaman sekaligus (satu per driver).
+"""
+
+import queue
+import threading
+import contextlib
+
+
+CLOSED_POLL = 0.1  # seconds between closed checks while waiting for a driver
+
+
+class DriverPool:
+    """Up to `size` drivers created on demand by a factory"""
+    
+    def __init__(self, factory, size: int = 1):
+        """
+        Args:
+            factory: Callable returning a new driver (needs .quit())
+            size: Maximum number of drivers
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.created = 0
+        self.closed = False
+        self._idle = queue.LifoQueue()
+        self._drivers = []
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Take an idle driver, create one if below size, otherwise wait
+        
+        Raises:
+            RuntimeError: The pool is closed (also while waiting)
+        """
+        if self.closed:
+            raise RuntimeError("Driver pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("Driver pool is closed")
+            create = self.created < self.size
+            if create:
+                self.created += 1
+        if not create:
+            # Released drivers are quit once the pool is closed, so a waiter
+            # has to notice the close itself
+            while True:
+                try:
+                    return self._idle.get(timeout=CLOSED_POLL)
+                except queue.Empty:
+                    if self.closed:
+                        raise RuntimeError("Driver pool is closed")
+        
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self.created -= 1
+            raise
+        with self._lock:
+            closed = self.closed
+            if closed:
+                self.created -= 1
+            else:
+                self._drivers.append(driver)
+        if closed:
+            # The pool was closed while the driver started
+            _quit(driver)
+            raise RuntimeError("Driver pool is closed")
+        return driver
+    
+    def release(self, driver, broken: bool = False):
+        """
+        Return a driver; a broken driver is quit and replaced on demand, and
+        drivers still busy when the pool was closed are quit here
+        """
+        with self._lock:
+            if not broken and not self.closed:
+                self._idle.put(driver)
+                return
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self.created -= 1
+        _quit(driver)
+    
+    @contextlib.contextmanager
+    def driver(self):
+        driver = self.acquire()
+        try:
+            yield driver
+        except Exception:
+            self.release(driver, broken=True)
+            raise
+        self.release(driver)
+    
+    def close(self):
+        """Quit idle drivers; busy drivers are quit when released"""
+        idle = []
+        with self._lock:
+            self.closed = True
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                self._drivers.remove(driver)
+                self.created -= 1
+                idle.append(driver)
+        for driver in idle:
+            _quit(driver)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"[WARN] Error closing driver: {e}")
@@ -0,0 +1,203 @@
+"""
+Extraction Plan Compiler
+Mengubah preset/config dict menjadi extraction plan yang sudah dikompilasi
+
+Semua regex dan argumen pencarian BeautifulSoup dibuat sekali per run, bukan
+untuk setiap elemen review. Plan bersifat immutable dan dipakai bersama oleh
+html_parser.py, custom_scraper.py dan scraper_gui.py.
+
+Format yang didukung:
+    - scraper_config.*_CONFIG (punya key 'selectors')
+    - ScraperConfig.PRESETS di scraper_gui.py (format flat)
+"""
+
+import re
+import copy
+from dataclasses import dataclass
+from typing import Optional, Pattern
+
+
+DEFAULT_COLUMNS = (
+    'username', 'from', 'written_date', 'rating', 'title',
+    'review_text', 'tema_pengalaman', 'daya_tarik_wisata',
+    'status', 'contribution'
+)
+
+# Shared helpers used by every extractor
+USERNAME_START_RE = re.compile(r'^[A-Za-z]')
+NUMBER_RE = re.compile(r'(\d+)')
+YEAR_RE = re.compile(r'(\d{4})')
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """
+    Pre-compiled selectors and patterns for one preset
+    
+    The dicts below are passed straight to BeautifulSoup (which requires a
+    real dict for attrs) and must be treated as read-only.
+    """
+    
+    name: str
+    source: dict
+    columns: tuple
+    
+    # Review text element
+    review_tag: str
+    review_search: dict                  # kwargs for soup.find_all
+    
+    # Container walk-up
+    container_tag: str
+    container_levels: int
+    container_needs_user: bool           # Container must contain a user link
+    
+    # Username links
+    username_tag: str
+    username_attrs: dict                 # {attr: compiled regex}
+    username_probes: tuple               # One single-attr dict per username attr
+    
+    # Rating
+    rating_aria_re: Optional[Pattern]
+    rating_class_re: Optional[Pattern]
+    rating_aria_attrs: Optional[dict]
+    
+    # Elite / status (exact attribute match)
+    elite_tag: str
+    elite_attrs: dict
+    
+    # Text patterns applied to the container text
+    location_re: Optional[Pattern]
+    date_re: Optional[Pattern]
+    helpful_re: Optional[Pattern]
+    contribution_re: Optional[Pattern]
+    
+    # Year filter (enabled, start, end)
+    year_filter: tuple
+    
+    def __reduce__(self):
+        # Compiled patterns are rebuilt from the source preset, so a plan
+        # can be sent to worker processes
+        return (compile_plan, (self.source,))
+    
+    @property
+    def has_elite(self) -> bool:
+        return bool(self.elite_tag and self.elite_attrs)
+
+
+def _compile(pattern, flags=0):
+    return re.compile(pattern, flags) if pattern else None
+
+
+def _compile_config(config: dict) -> ExtractionPlan:
+    """Compile scraper_config.py style config (nested 'selectors')"""
+    sel = config['selectors']
+    patterns = config.get('patterns', {})
+    
+    # Review element search kwargs
+    review_sel = sel['review_text']
+    review_search = {'name': review_sel['tag']}
+    other_attrs = {}
+    for attr_name, attr_val in review_sel.get('attrs', {}).items():
+        if attr_name == 'class':
+            # Class contains pattern
+            review_search['class_'] = re.compile(attr_val)
+        elif attr_name == 'lang':
+            review_search['lang'] = attr_val
+        else:
+            other_attrs[attr_name] = re.compile(attr_val)
+    if other_attrs:
+        review_search['attrs'] = other_attrs
+    
+    username_sel = sel.get('username', {})
+    rating_sel = sel.get('rating', {})
+    elite_sel = sel.get('elite', {})
+    
+    username_attrs = {k: re.compile(v) for k, v in username_sel.get('attrs', {}).items()}
+    rating_aria_re = _compile(rating_sel.get('aria_label_pattern'), re.I)
+    year_filter = config.get('year_filter', {})
+    
+    return ExtractionPlan(
+        name=config.get('name', 'custom'),
+        source=copy.deepcopy(config),
+        columns=tuple(config.get('columns', DEFAULT_COLUMNS)),
+        review_tag=review_sel['tag'],
+        review_search=review_search,
+        container_tag=sel.get('container_tag', 'div'),
+        container_levels=sel.get('container_levels_up', 10),
+        container_needs_user=True,
+        username_tag=username_sel.get('tag', 'a'),
+        username_attrs=username_attrs,
+        username_probes=tuple({k: v} for k, v in username_attrs.items()),
+        rating_aria_re=rating_aria_re,
+        rating_class_re=_compile(rating_sel.get('class_pattern')),
+        rating_aria_attrs={'aria-label': rating_aria_re} if rating_aria_re else None,
+        elite_tag=elite_sel.get('tag', 'a') if elite_sel else '',
+        elite_attrs=dict(elite_sel.get('attrs', {})) if elite_sel else {},
+        location_re=_compile(patterns.get('location')),
+        date_re=_compile(patterns.get('date')),
+        helpful_re=_compile(patterns.get('helpful')),
+        contribution_re=_compile(patterns.get('contribution')),
+        year_filter=(
+            bool(year_filter.get('enabled', False)),
+            year_filter.get('start', 2019),
+            year_filter.get('end', 2025),
+        ),
+    )
+
+
+def _compile_preset(preset: dict) -> ExtractionPlan:
+    """Compile scraper_gui.py style preset (flat keys)"""
+    review_search = {'name': preset['review_tag']}
+    if preset.get('review_class'):
+        review_search['class_'] = re.compile(preset['review_class'])
+    if preset.get('review_lang'):
+        review_search['lang'] = preset['review_lang']
+    
+    username_attrs = {}
+    if preset.get('username_pattern'):
+        username_attrs[preset['username_attr']] = re.compile(preset['username_pattern'])
+    
+    elite_attrs = {}
+    if preset.get('elite_pattern') and preset.get('elite_tag'):
+        elite_attrs[preset['elite_attr']] = preset['elite_pattern']
+    
+    rating_aria_re = _compile(preset.get('rating_pattern'), re.I)
+    
+    return ExtractionPlan(
+        name=preset.get('name', 'custom'),
+        source=copy.deepcopy(preset),
+        columns=tuple(preset.get('columns', DEFAULT_COLUMNS)),
+        review_tag=preset['review_tag'],
+        review_search=review_search,
+        container_tag=preset['container_tag'],
+        container_levels=preset['container_levels'],
+        container_needs_user=False,
+        username_tag=preset.get('username_tag', 'a'),
+        username_attrs=username_attrs,
+        username_probes=tuple({k: v} for k, v in username_attrs.items()),
+        rating_aria_re=rating_aria_re,
+        rating_class_re=None,
+        rating_aria_attrs={'aria-label': rating_aria_re} if rating_aria_re else None,
+        elite_tag=preset.get('elite_tag', '') if elite_attrs else '',
+        elite_attrs=elite_attrs,
+        location_re=_compile(preset.get('location_pattern')),
+        date_re=_compile(preset.get('date_pattern')),
+        helpful_re=_compile(preset.get('helpful_pattern')),
+        contribution_re=_compile(preset.get('contribution_pattern')),
+        year_filter=(False, 2019, 2025),
+    )
+
+
+def compile_plan(config) -> ExtractionPlan:
+    """
+    Compile a config/preset dict into an ExtractionPlan
+    
+    Args:
+        config: scraper_config style dict, GUI preset dict, or an
+                ExtractionPlan (returned unchanged)
+    """
+    if isinstance(config, ExtractionPlan):
+        return config
+    if 'selectors' in config:
+        return _compile_config(config)
+    return _compile_preset(config)
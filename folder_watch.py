@@ -0,0 +1,140 @@
+"""
+Folder Watch
+Mode watch: memproses file HTML yang baru disimpan atau berubah secara inkremental
+
+Folder di-poll setiap beberapa detik. Hanya file baru/berubah (mtime atau
+ukuran berbeda) yang di-parse; review baru di-dedup terhadap CSV output yang
+sudah ada lalu di-append ke file tersebut, tanpa menulis ulang seluruh CSV.
+File yang masih ditulis (ukurannya berubah di antara dua poll) ditunggu
+sampai selesai.
+
+Catatan: output bersifat append-only. Review yang hilang dari file yang
+berubah tidak dihapus dari CSV.
+"""
+
+import os
+import csv
+import time
+
+from review_stream import review_id, dedup_filter_years, CSVStreamWriter, ID_COLUMN
+
+
+DEFAULT_INTERVAL = 2.0
+
+
+def file_signature(filepath: str) -> tuple:
+    stat = os.stat(filepath)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FolderWatcher:
+    """Detect new or changed files between polls"""
+    
+    def __init__(self, list_files, interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            list_files: Callable returning the current list of files to watch
+            interval: Seconds between polls
+        """
+        self.list_files = list_files
+        self.interval = interval
+        self.processed = {}  # filepath -> signature already returned
+        self.pending = {}    # filepath -> signature seen on the previous poll
+    
+    def scan(self) -> list:
+        """Return files that are new or changed and no longer being written"""
+        now = time.time()
+        ready = []
+        pending = {}
+        
+        for filepath in self.list_files():
+            try:
+                signature = file_signature(filepath)
+            except OSError:
+                continue  # Removed between listing and stat
+            
+            if self.processed.get(filepath) == signature:
+                continue
+            
+            # Settled: unchanged since the last poll, or old enough already
+            settled = now - signature[0] / 1e9 >= self.interval
+            if settled or self.pending.get(filepath) == signature:
+                ready.append(filepath)
+                self.processed[filepath] = signature
+            else:
+                pending[filepath] = signature
+        
+        self.pending = pending
+        return ready
+
+
+class IncrementalOutput:
+    """Append-only CSV output, deduplicated against rows already written"""
+    
+    def __init__(self, output_file: str, columns: list, seen=None):
+        """
+        Args:
+            output_file: CSV path (created on the first new review)
+            columns: Config columns
+            seen: Optional DedupIndex; by default the review IDs are read
+                  from the existing CSV
+        """
+        self.output_file = output_file
+        self.columns = list(columns)
+        self.total = 0
+        
+        rehydrate = seen is None
+        self.seen = set() if rehydrate else seen
+        self.parsed = set()  # review_ids of every parsed review, also filtered ones
+        if os.path.exists(output_file):
+            with open(output_file, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    if rehydrate:
+                        self.seen.add(row.get(ID_COLUMN) or review_id(row))
+                    self.total += 1
+    
+    def add(self, reviews: list, years=None) -> int:
+        """
+        Append reviews not seen before, return number of rows written
+        
+        Like batch mode: dedup over everything parsed in this session first,
+        then the year filter (start, end), then the rows already written.
+        """
+        new_rows = list(dedup_filter_years(reviews, years, self.seen, self.parsed))
+        if not new_rows:
+            return 0
+        
+        with CSVStreamWriter(self.output_file, self.columns, append=True) as writer:
+            for r in new_rows:
+                writer.write(r)
+        if hasattr(self.seen, 'commit'):
+            self.seen.commit()
+        
+        self.total += len(new_rows)
+        return len(new_rows)
+
+
+def watch(watcher: FolderWatcher, process_files, stop_event=None):
+    """
+    Call process_files(files) for every batch of new/changed files
+    
+    Runs until stop_event is set or Ctrl+C is pressed.
+    
+    Args:
+        watcher: FolderWatcher for the folder
+        process_files: Callable taking a list of file paths
+        stop_event: Optional threading.Event to stop the loop
+    """
+    print(f"[WATCH] Polling every {watcher.interval}s (Ctrl+C to stop)")
+    try:
+        while stop_event is None or not stop_event.is_set():
+            files = watcher.scan()
+            if files:
+                process_files(files)
+            if stop_event is not None:
+                stop_event.wait(watcher.interval)
+            else:
+                time.sleep(watcher.interval)
+    except KeyboardInterrupt:
+        pass
+    print("\n[WATCH] Stopped")
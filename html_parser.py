@@ -3,16 +3,53 @@ Yelp HTML Parser v5
 Mengekstrak review dari file HTML Yelp yang disimpan secara lokal
 
 Output columns: username, from, written_date, rating, title, review_text, 
-                tema_pengalaman, daya_tarik_wisata, status, contribution
-                
+                tema_pengalaman, daya_tarik_wisata, status, contribution, review_id
+
 Filter: Tahun 2019-2025
 """
 
 import os
 import re
-import csv
 import glob
-from bs4 import BeautifulSoup
+import argparse
+import functools
+
+from extraction_plan import compile_plan, USERNAME_START_RE, NUMBER_RE, YEAR_RE
+from page_loader import read_html, make_soup, escaped_region
+import lxml_backend
+import stream_parser
+from parse_cache import ParseCache, iter_cached_files, cache_version, DEFAULT_CACHE_PATH
+from review_stream import iter_reviews, dedup_filter_years
+from columnar_export import EXPORT_FORMATS, with_format, open_writer
+from dedup_index import DedupIndex, DEFAULT_INDEX_PATH
+from near_duplicates import drop_near_duplicates, DEFAULT_THRESHOLD
+from data_validation import QualityStats
+from folder_watch import FolderWatcher, IncrementalOutput, watch, DEFAULT_INTERVAL
+from parse_pool import resolve_jobs
+
+
+# Selectors for saved Yelp pages, compiled once into an extraction plan
+YELP_PRESET = {
+    'name': 'yelp',
+    'review_tag': 'span',
+    'review_class': 'raw',
+    'review_lang': 'en',
+    'container_tag': 'li',
+    'container_levels': 10,
+    'username_tag': 'a',
+    'username_attr': 'href',
+    'username_pattern': r'/user_details\?userid=',
+    'location_pattern': r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*[A-Z]{2})\b',
+    'date_pattern': r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}',
+    'rating_pattern': r'\d+\s*star',
+    'helpful_pattern': r'Helpful\s*(\d+)',
+    'contribution_pattern': r'(\d+)\s*(\d+)\s*(\d+)',  # reviews, photos, friends
+    'elite_tag': 'a',
+    'elite_attr': 'href',
+    'elite_pattern': '/elite'
+}
+
+PLAN = compile_plan(YELP_PRESET)
 
 
 def find_html_files(directory):
@@ -39,28 +76,56 @@ def extract_year(date_str):
     """Extract year from date string like 'Apr 23, 2025'"""
     if not date_str:
         return None
-    match = re.search(r'(\d{4})', date_str)
+    match = YEAR_RE.search(date_str)
     if match:
         return int(match.group(1))
     return None
 
 
-def parse_html_file(filepath):
-    """Parse a single HTML file and extract reviews"""
+def parse_html_file(filepath, strain=False, backend='bs4'):
+    """
+    Parse a single HTML file and extract reviews
+    
+    Args:
+        filepath: Path to saved Yelp page
+        strain: Only build the tree for <li> containers and review spans (faster)
+        backend: 'bs4' (BeautifulSoup), 'lxml' (XPath on lxml.html, fastest)
+                 or 'stream' (constant memory for very large pages)
+    """
     print(f"[PARSE] Processing: {os.path.basename(filepath)}")
     
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        with open(filepath, 'r', encoding='latin-1') as f:
-            content = f.read()
+    if backend == 'stream':
+        # Constant memory: never hold the whole file or DOM
+        reviews = stream_parser.parse_file(filepath, PLAN)
+        print(f"   Extracted {len(reviews)} reviews")
+        return reviews
+    
+    content = read_html(filepath)
     
-    soup = BeautifulSoup(content, 'lxml')
+    reviews = None
+    if backend == 'lxml':
+        reviews = lxml_backend.parse_content(content, PLAN)
+    elif strain:
+        region_tags = [PLAN.container_tag, PLAN.review_tag]
+        reviews = extract_reviews(make_soup(content, region_tags), PLAN, strained=True)
+    if reviews is None:
+        reviews = extract_reviews(make_soup(content), PLAN)
+    
+    print(f"   Extracted {len(reviews)} reviews")
+    return reviews
+
+
+def extract_reviews(soup, plan=PLAN, strained=False):
+    """
+    Extract reviews from a parsed page using a compiled extraction plan
+    
+    Returns None when the tree was strained and a review span is not inside
+    an <li>, so the caller can fall back to the full tree.
+    """
     reviews = []
     
     # Find review text spans
-    review_spans = soup.find_all('span', lang='en', class_=re.compile(r'raw'))
+    review_spans = soup.find_all(**plan.review_search)
     
     for span in review_spans:
         review_text = span.get_text(strip=True)
@@ -84,11 +149,11 @@ def parse_html_file(filepath):
         
         # Go up to find the li container
         container = span
-        for _ in range(10):
+        for _ in range(plan.container_levels):
             parent = container.parent
             if parent is None:
                 break
-            if parent.name == 'li':
+            if parent.name == plan.container_tag:
                 container = parent
                 break
             container = parent
@@ -96,13 +161,16 @@ def parse_html_file(filepath):
         if container is None:
             continue
         
+        if strained and escaped_region(container):
+            return None
+        
         # Find ALL user links in container
-        user_links = container.find_all('a', href=re.compile(r'/user_details\?userid='))
+        user_links = container.find_all(plan.username_tag, attrs=plan.username_attrs)
         
         # Find the one with actual text (username)
         for link in user_links:
             text = link.get_text(strip=True)
-            if text and len(text) >= 2 and re.match(r'^[A-Za-z]', text):
+            if text and len(text) >= 2 and USERNAME_START_RE.match(text):
                 review['username'] = text
                 break
         
@@ -113,24 +181,24 @@ def parse_html_file(filepath):
         container_text = container.get_text(' ', strip=True)
         
         # Extract location - format "City, ST" 
-        loc_match = re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*[A-Z]{2})\b', container_text)
+        loc_match = plan.location_re.search(container_text)
         if loc_match:
             review['from'] = loc_match.group(1)
         
         # Extract date
-        date_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}', container_text)
+        date_match = plan.date_re.search(container_text)
         if date_match:
             review['written_date'] = date_match.group()
         
         # Extract rating from aria-label
-        rating_elem = container.find(attrs={'aria-label': re.compile(r'\d+\s*star', re.I)})
+        rating_elem = container.find(attrs=plan.rating_aria_attrs)
         if rating_elem:
-            rating_match = re.search(r'(\d+)', rating_elem.get('aria-label', ''))
+            rating_match = NUMBER_RE.search(rating_elem.get('aria-label', ''))
             if rating_match:
                 review['rating'] = rating_match.group(1)
         
         # Extract Elite status (for both 'status' and 'tema_pengalaman')
-        elite_link = container.find('a', href='/elite')
+        elite_link = container.find(plan.elite_tag, attrs=plan.elite_attrs)
         if elite_link:
             elite_text = elite_link.get_text(strip=True)
             review['status'] = elite_text  # e.g., "Elite 26"
@@ -138,90 +206,155 @@ def parse_html_file(filepath):
         
         # Extract contribution (review count, photo count)
         # Look for patterns like "123 456 78" which are reviews/photos/friends counts
-        contribution_match = re.search(r'(\d+)\s*(\d+)\s*(\d+)', container_text)
+        contribution_match = plan.contribution_re.search(container_text)
         if contribution_match:
             reviews_count = contribution_match.group(1)
             photos_count = contribution_match.group(2)
             review['contribution'] = f"{reviews_count} reviews, {photos_count} photos"
         
         # Extract helpful count for daya_tarik_wisata
-        helpful_match = re.search(r'Helpful\s*(\d+)', container_text)
+        helpful_match = plan.helpful_re.search(container_text)
         if helpful_match:
             review['daya_tarik_wisata'] = helpful_match.group(1)
         
         reviews.append(review)
     
-    print(f"   Extracted {len(reviews)} reviews")
     return reviews
 
 
-def filter_by_year(reviews, start_year=2019, end_year=2025):
-    """Filter reviews by year range"""
-    filtered = []
-    for r in reviews:
-        year = extract_year(r.get('written_date', ''))
-        if year and start_year <= year <= end_year:
-            filtered.append(r)
-    return filtered
-
-
-def save_to_csv(reviews, output_file):
-    """Save reviews to CSV file"""
-    columns = ['username', 'from', 'written_date', 'rating', 'title', 
-               'review_text', 'tema_pengalaman', 'daya_tarik_wisata', 
-               'status', 'contribution']
+def run_watch(directory, parse_func, cache, version, jobs, interval=DEFAULT_INTERVAL, index=None):
+    """Parse new/changed files as they appear and append new reviews to the CSV"""
+    output_file = os.path.join(directory, 'yelp_coachella_reviews.csv')
+    output = IncrementalOutput(output_file, PLAN.columns, seen=index)
+    print(f"Output: {output_file} ({output.total} existing reviews)")
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns)
-        writer.writeheader()
-        writer.writerows(reviews)
+    def process_files(files):
+        for filepath, reviews in iter_cached_files(parse_func, files, cache, version, jobs):
+            added = output.add(reviews, (2019, 2025))
+            print(f"[WATCH] {os.path.basename(filepath)}: {len(reviews)} reviews, "
+                  f"{added} new (total {output.total})")
     
-    print(f"\n[SAVED] {len(reviews)} reviews -> {output_file}")
+    watcher = FolderWatcher(lambda: find_html_files(directory), interval)
+    watch(watcher, process_files)
 
 
 def main():
-    directory = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Yelp HTML Parser')
+    parser.add_argument('--dir', type=str, default=None,
+                        help='Directory containing HTML files')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Parse files in N processes (0 = all cores, default: 1)')
+    parser.add_argument('--strain', action='store_true',
+                        help='Only build the tree for review containers (faster, less memory)')
+    parser.add_argument('--backend', type=str, default='bs4', choices=lxml_backend.BACKENDS,
+                        help='Extraction backend (default: bs4)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse every file, ignoring the parse cache')
+    parser.add_argument('--rebuild-cache', action='store_true',
+                        help='Clear the parse cache before running')
+    parser.add_argument('--cache-path', type=str, default=DEFAULT_CACHE_PATH,
+                        help='Parse cache file (SQLite)')
+    parser.add_argument('--cache-size', type=int, default=512,
+                        help='Maximum parse cache size in MB (default: 512)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and process new/changed files as they are saved')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f'Watch polling interval in seconds (default: {DEFAULT_INTERVAL})')
+    parser.add_argument('--dedup-index', action='store_true',
+                        help='Skip reviews collected in earlier runs and append new ones to the CSV')
+    parser.add_argument('--index-path', type=str, default=DEFAULT_INDEX_PATH,
+                        help='Dedup index file (SQLite)')
+    parser.add_argument('--near-dup', action='store_true',
+                        help='Also drop near-duplicate reviews by the same user (edited, "Read more" cut)')
+    parser.add_argument('--near-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Near-duplicate similarity threshold 0-1 (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--quality-report', action='store_true',
+                        help='Print the full validation report of the written reviews (kept while scraping)')
+    parser.add_argument('--format', type=str, default='csv', choices=EXPORT_FORMATS,
+                        help='Output format: csv, or typed parquet/arrow written in row groups (default: csv)')
+    args = parser.parse_args()
+    
+    directory = args.dir or os.path.dirname(os.path.abspath(__file__))
+    jobs = resolve_jobs(args.jobs)
     
     print("=" * 60)
     print("YELP HTML PARSER v5")
     print("=" * 60)
     print(f"Directory: {directory}")
     print(f"Year filter: 2019-2025")
+    print(f"Jobs: {jobs} | Backend: {args.backend}")
+    
+    cache = None
+    if not args.no_cache:
+        cache = ParseCache(args.cache_path, max_bytes=args.cache_size * 1024 * 1024)
+        if args.rebuild_cache:
+            cache.clear()
+    version = cache_version(PLAN, args.backend)
+    parse_func = functools.partial(parse_html_file, strain=args.strain, backend=args.backend)
+    
+    output_file = os.path.join(directory, 'yelp_coachella_reviews.csv')
+    if args.watch and args.format != 'csv':
+        print("[WARN] Watch mode appends to the CSV output; --format is ignored")
+    elif args.format != 'csv':
+        output_file = with_format(output_file, args.format)
+    index = None
+    if args.dedup_index:
+        index = DedupIndex(args.index_path, scope='yelp_coachella')
+        seeded = index.seed_from_csv(output_file)
+        if seeded:
+            print(f"[INDEX] {seeded} review(s) from {output_file} added to the index")
+    
+    if args.watch:
+        run_watch(directory, parse_func, cache, version, jobs, args.interval, index)
+        if cache:
+            cache.close()
+        if index:
+            index.close()
+        return
     
     html_files = find_html_files(directory)
     print(f"Found {len(html_files)} HTML files\n")
     
     if not html_files:
         print("[ERROR] No HTML files found!")
+        if cache:
+            cache.close()
         return
     
-    all_reviews = []
-    for filepath in html_files:
-        reviews = parse_html_file(filepath)
-        all_reviews.extend(reviews)
+    # Stream: files -> reviews -> dedup -> year filter -> CSV
+    # With the dedup index only reviews not collected before are appended
+    stats = {}
+    year_counts = {}
+    samples = []
+    quality = QualityStats()
     
-    # Deduplicate
-    seen = set()
-    unique_reviews = []
-    for r in all_reviews:
-        key = (r.get('username', ''), r.get('review_text', '')[:100])
-        if key not in seen and r.get('username'):
-            seen.add(key)
-            unique_reviews.append(r)
+    results = iter_cached_files(parse_func, html_files, cache, version, jobs)
+    reviews = dedup_filter_years(iter_reviews(results, stats), (2019, 2025), index)
+    if args.near_dup:
+        reviews = drop_near_duplicates(reviews, args.near_threshold, stats=stats)
+    with open_writer(output_file, PLAN.columns, append=index is not None) as writer:
+        for r in reviews:
+            writer.write(r)
+            quality.add(r)
+            year = extract_year(r.get('written_date', ''))
+            year_counts[year] = year_counts.get(year, 0) + 1
+            if len(samples) < 3:
+                samples.append(r)
     
-    print(f"\nTotal unique reviews before filter: {len(unique_reviews)}")
+    if cache:
+        print(f"\n[CACHE] {cache.hits} file(s) from cache, {cache.misses} parsed")
+        cache.close()
     
-    # Filter by year 2019-2025
-    filtered_reviews = filter_by_year(unique_reviews, 2019, 2025)
+    if index:
+        print(f"[INDEX] {index.added} new review(s), {index.count()} known for this business")
+        index.close()
     
-    print(f"Total reviews after year filter (2019-2025): {len(filtered_reviews)}")
-    
-    # Count by year
-    year_counts = {}
-    for r in filtered_reviews:
-        year = extract_year(r.get('written_date', ''))
-        if year:
-            year_counts[year] = year_counts.get(year, 0) + 1
+    print(f"\nTotal reviews extracted: {stats.get('reviews', 0)}")
+    if args.near_dup:
+        print(f"Near-duplicates dropped: {stats.get('near_duplicates', 0)}")
+    print(f"Unique reviews after year filter (2019-2025): {writer.count}")
+    if quality.total:
+        print(f"[QUALITY] {quality.summary()}")
     
     print("\nReviews by year:")
     for year in sorted(year_counts.keys()):
@@ -232,19 +365,23 @@ def main():
         if year not in year_counts:
             print(f"   {year}: 0 reviews (no data)")
     
-    if filtered_reviews:
-        output_file = os.path.join(directory, 'yelp_coachella_reviews.csv')
-        save_to_csv(filtered_reviews, output_file)
+    if writer.count:
+        print(f"\n[SAVED] {writer.count} reviews -> {output_file}")
         
         print("\n--- Sample Reviews ---")
-        for i, r in enumerate(filtered_reviews[:3]):
+        for i, r in enumerate(samples):
             print(f"\n[{i+1}] {r['username']} from {r['from']}")
             print(f"    Date: {r['written_date']} | Rating: {r['rating']} stars")
             print(f"    Status: {r['status']} | Contribution: {r['contribution']}")
             print(f"    Helpful: {r['daya_tarik_wisata']}")
             print(f"    Review: {r['review_text'][:80]}...")
+    elif index:
+        print("[INFO] No new reviews since the last run.")
     else:
         print("[ERROR] No reviews extracted after filtering.")
+    
+    if args.quality_report and quality.total:
+        print('\n'.join(quality.report().lines()))
 
 
 if __name__ == "__main__":
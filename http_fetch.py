@@ -0,0 +1,82 @@
+"""
+HTTP Fetch
+Mengambil halaman lewat HTTP biasa (tanpa browser) dengan connection pool
+
+Banyak halaman review sudah berisi markup review di HTML dari server, jadi
+tidak perlu menjalankan Chrome. HTTPFetcher memakai urllib3.PoolManager:
+koneksi keep-alive dipakai ulang antar request (dan antar thread), respons
+gzip/deflate didekode otomatis, dan error sementara (429/5xx) di-retry
+dengan backoff. Jika halaman ternyata butuh JavaScript, pemanggil kembali ke
+WebDriver (lihat YelpScraper.fetch_page).
+"""
+
+import re
+
+
+FETCH_MODES = ('auto', 'http', 'browser')
+
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+_CHARSET_RE = re.compile(r'charset=([\w-]+)', re.I)
+
+
+class HTTPFetcher:
+    """Pooled keep-alive HTTP client returning page HTML"""
+    
+    def __init__(self, user_agent: str = DEFAULT_USER_AGENT, timeout: float = 15.0,
+                 retries: int = 2, maxsize: int = 4):
+        """
+        Args:
+            user_agent: User-Agent header
+            timeout: Read timeout in seconds
+            retries: Retries for connection errors and 429/5xx responses
+            maxsize: Connections kept per host (use the number of workers)
+        """
+        import urllib3
+        
+        headers = urllib3.make_headers(keep_alive=True, accept_encoding=True, user_agent=user_agent)
+        headers['Accept'] = 'text/html,application/xhtml+xml'
+        headers['Accept-Language'] = 'en-US,en;q=0.9'
+        self.http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=maxsize,
+            headers=headers,
+            timeout=urllib3.Timeout(connect=5.0, read=timeout),
+            retries=urllib3.Retry(total=retries, backoff_factor=0.5,
+                                  status_forcelist=(429, 500, 502, 503, 504),
+                                  raise_on_status=False),
+        )
+        self.requests = 0
+        self.bytes = 0
+    
+    def fetch(self, url: str):
+        """
+        GET a page
+        
+        Returns:
+            HTML text, or None on a network error or non-200 status
+        """
+        import urllib3
+        
+        try:
+            response = self.http.request('GET', url)
+        except urllib3.exceptions.HTTPError as e:
+            print(f"[WARN] HTTP fetch failed for {url}: {e}")
+            return None
+        
+        self.requests += 1
+        self.bytes += len(response.data)
+        if response.status != 200:
+            print(f"[WARN] HTTP {response.status} for {url}")
+            return None
+        
+        match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+        encoding = match.group(1) if match else 'utf-8'
+        try:
+            return response.data.decode(encoding, errors='replace')
+        except LookupError:
+            return response.data.decode('utf-8', errors='replace')
+    
+    def close(self):
+        self.http.clear()
@@ -0,0 +1,191 @@
+"""
+JS Extract
+Ekstraksi review Yelp di dalam browser (execute_script) yang hanya
+mengembalikan field review sebagai JSON
+
+Tanpa ini setiap halaman mengirim seluruh driver.page_source (MB) ke Python
+lalu di-parse ulang dengan BeautifulSoup. Script di bawah menjalankan logika
+yang sama dengan YelpScraper.parse_reviews / _extract_review_data langsung
+di DOM live: pemilihan container (li review / div[data-review-id] / parent
+link profil), lalu field yang sama dengan regex yang sama. Teks dikumpulkan
+seperti get_text() BeautifulSoup (tanpa script/style/komentar; strip=True
+menggabungkan potongan teks yang di-strip tanpa spasi).
+
+Script hanya memakai API DOM dasar (childNodes, getElementsByTagName,
+getAttribute, parentElement) agar perilakunya mudah dicocokkan dengan parser
+Python. Parser Python tetap dipakai sebagai fallback dan untuk cross-check
+(compare_reviews). Karena script belum dibandingkan dengan parse_reviews di
+halaman Yelp asli, default YelpScraper tetap extract='html'; jalankan
+--extract check di halaman asli sebelum memakai 'js'.
+"""
+
+import json
+
+
+EXTRACT_MODES = ('js', 'html', 'check')
+
+FIELDS = ('username', 'from', 'written_date', 'rating', 'title', 'review_text',
+          'tema_pengalaman', 'daya_tarik_wisata')
+
+YELP_EXTRACT_JS = r"""
+const SKIP = {script: 1, style: 1, template: 1};
+const USER_RE = /\/user_details\?userid=/;
+const LI_RE = /.*margin-b.*|.*review.*/i;
+const LOC_CLASS_RE = /.*location.*|.*css-qgunke.*/i;
+const LOC_RE = /^[A-Za-z\s]+,\s*[A-Z]{2}$/;
+const DATE_RES = [/(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}/,
+                  /\d{1,2}\/\d{1,2}\/\d{4}/];
+
+const tag = el => el.tagName.toLowerCase();
+const attr = (el, name) => el.getAttribute(name);
+const byTag = (el, name) => Array.from(el.getElementsByTagName(name));
+
+function strings(node, out) {
+    for (const child of Array.from(node.childNodes)) {
+        if (child.nodeType === 3 || child.nodeType === 4) {
+            out.push(child.nodeValue);
+        } else if (child.nodeType === 1 && !SKIP[tag(child)]) {
+            strings(child, out);
+        }
+    }
+    return out;
+}
+const text = el => strings(el, []).join('');
+const stripped = el => strings(el, []).map(s => s.trim()).filter(s => s).join('');
+
+// BeautifulSoup's Tag.string: the only child string, looking through single children
+function onlyString(el) {
+    let node = el;
+    while (true) {
+        const kids = Array.from(node.childNodes);
+        if (kids.length !== 1) return null;
+        node = kids[0];
+        if (node.nodeType !== 1) return node.nodeValue;
+    }
+}
+
+function parent(el, name) {
+    for (let p = el.parentElement; p; p = p.parentElement) {
+        if (tag(p) === name) return p;
+    }
+    return null;
+}
+
+function extract(c) {
+    const review = {username: '', from: '', written_date: '', rating: '', title: '',
+                    review_text: '', tema_pengalaman: '', daya_tarik_wisata: ''};
+    const links = byTag(c, 'a');
+    const spans = byTag(c, 'span');
+    const all = byTag(c, '*');
+    const allText = text(c);
+    
+    const userLink = links.find(a => USER_RE.test(attr(a, 'href') || ''));
+    if (userLink) review.username = stripped(userLink) || attr(userLink, 'aria-label') || '';
+    
+    const loc = spans.find(s => LOC_CLASS_RE.test(attr(s, 'class') || ''))
+        || spans.find(s => { const t = onlyString(s); return t !== null && LOC_RE.test(t); });
+    if (loc) review.from = stripped(loc);
+    if (!review.from) {
+        const m = /([A-Za-z\s]+,\s*[A-Z]{2})\d/.exec(allText);
+        if (m) review.from = m[1].trim();
+    }
+    
+    for (const re of DATE_RES) {
+        const m = re.exec(allText);
+        if (m) { review.written_date = m[0]; break; }
+    }
+    
+    const ratingEl = all.find(e => /\d+\s*star/i.test(attr(e, 'aria-label') || ''));
+    if (ratingEl) {
+        const m = /(\d+)/.exec(attr(ratingEl, 'aria-label'));
+        if (m) review.rating = m[1];
+    }
+    if (!review.rating) {
+        const star = all.find(e => attr(e, 'role') === 'img' && /star/i.test(attr(e, 'aria-label') || ''));
+        const m = star && /(\d+)/.exec(attr(star, 'aria-label'));
+        if (m) review.rating = m[1];
+    }
+    
+    for (const e of all) {
+        const name = tag(e);
+        if (name !== 'span' && name !== 'p') continue;
+        const t = stripped(e);
+        if ([...t].length > 100 && !/^(Helpful|Thanks|Love|Oh no)/.test(t)) {
+            review.review_text = t;
+            break;
+        }
+    }
+    if (!review.review_text) {
+        const comment = spans.find(s => attr(s, 'lang') === 'en')
+            || byTag(c, 'p').find(p => attr(p, 'lang') === 'en');
+        if (comment) review.review_text = stripped(comment);
+    }
+    
+    const elite = links.find(a => attr(a, 'href') === '/elite');
+    if (elite) review.tema_pengalaman = stripped(elite);
+    
+    const helpful = /Helpful\s*(\d+)/.exec(allText);
+    if (helpful) review.daya_tarik_wisata = helpful[1];
+    return review;
+}
+
+let containers = byTag(document, 'li').filter(li => LI_RE.test(attr(li, 'class') || ''));
+if (!containers.length) {
+    containers = byTag(document, 'div').filter(d => attr(d, 'data-review-id') !== null);
+}
+if (!containers.length) {
+    containers = byTag(document, 'a')
+        .filter(a => USER_RE.test(attr(a, 'href') || ''))
+        .map(a => parent(a, 'li') || parent(a, 'div'))
+        .filter(c => c);
+}
+
+const reviews = [];
+for (const c of containers) {
+    try {
+        const review = extract(c);
+        if (review.username) reviews.push(review);
+    } catch (e) {}
+}
+return reviews;
+"""
+
+
+def extract_reviews_js(driver, script: str = YELP_EXTRACT_JS):
+    """
+    Run the extraction script in the page
+    
+    Returns:
+        List of review dicts, or None if the script failed
+    """
+    try:
+        result = driver.execute_script(script)
+    except Exception as e:
+        print(f"   [WARN] In-browser extraction failed: {e}")
+        return None
+    if not isinstance(result, list):
+        return None
+    return [{field: str(r.get(field) or '') for field in FIELDS} for r in result if isinstance(r, dict)]
+
+
+def compare_reviews(js_reviews: list, py_reviews: list) -> list:
+    """
+    Cross-check in-browser and Python extraction of the same page
+    
+    Returns:
+        List of (index, field, js value, python value) differences; a
+        different review count is reported with field '#count'
+    """
+    diffs = []
+    if len(js_reviews) != len(py_reviews):
+        diffs.append((-1, '#count', len(js_reviews), len(py_reviews)))
+    for i, (js, py) in enumerate(zip(js_reviews, py_reviews)):
+        for field in FIELDS:
+            if js.get(field, '') != py.get(field, ''):
+                diffs.append((i, field, js.get(field, ''), py.get(field, '')))
+    return diffs
+
+
+def payload_kb(reviews: list) -> float:
+    """Approximate size of the JSON returned by the script"""
+    return len(json.dumps(reviews, ensure_ascii=False)) / 1024
@@ -0,0 +1,232 @@
+"""
+lxml Backend
+Ekstraksi review langsung dengan XPath di lxml.html, tanpa BeautifulSoup
+
+Backend ini mengevaluasi selector yang sama dengan jalur BeautifulSoup
+(elemen review, container walk-up, link username, rating aria-label / class,
+link elite) dari sebuah ExtractionPlan, dan menghasilkan baris yang sama.
+Pilih dengan --backend lxml (CLI) atau setting Parser di GUI.
+Backend 'stream' ada di stream_parser.py.
+"""
+
+from extraction_plan import ExtractionPlan, compile_plan, USERNAME_START_RE, NUMBER_RE
+
+
+BACKENDS = ('bs4', 'lxml', 'stream')
+
+# Strings inside these elements are not part of get_text() in BeautifulSoup
+_HIDDEN_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+
+class Selector:
+    """Compiled XPath for a tag plus BeautifulSoup-style attribute matching"""
+    
+    def __init__(self, tag: str = None, attrs: dict = None, axis: str = './/'):
+        attrs = attrs or {}
+        predicates = ''.join(f'[@{name}]' for name in attrs)
+        from lxml import etree
+        self.xpath = etree.XPath(f'{axis}{tag or "*"}{predicates}')
+        self.tag = tag
+        self.attrs = tuple(attrs.items())
+    
+    def _matches(self, el) -> bool:
+        for name, expected in self.attrs:
+            value = el.get(name)
+            if expected is True:
+                continue
+            if hasattr(expected, 'search'):
+                if name == 'class':
+                    # Class regex matches any single class or the whole value
+                    classes = value.split()
+                    if not (any(expected.search(c) for c in classes)
+                            or expected.search(' '.join(classes))):
+                        return False
+                elif not expected.search(value):
+                    return False
+            elif name == 'class':
+                classes = value.split()
+                if expected not in classes and expected != ' '.join(classes):
+                    return False
+            elif value != expected:
+                return False
+        return True
+    
+    def matches(self, el) -> bool:
+        """Check whether el itself matches the selector"""
+        if self.tag and el.tag != self.tag:
+            return False
+        if any(el.get(name) is None for name, _ in self.attrs):
+            return False
+        return self._matches(el)
+    
+    def find_all(self, el) -> list:
+        if not self.attrs:
+            return self.xpath(el)
+        return [match for match in self.xpath(el) if self._matches(match)]
+    
+    def find(self, el):
+        for match in self.xpath(el):
+            if not self.attrs or self._matches(match):
+                return match
+        return None
+
+
+def _strings(el):
+    """Yield text nodes in document order, like BeautifulSoup's strings"""
+    if el.tag in _HIDDEN_TEXT_TAGS:
+        return
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str):
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(el, separator: str = '') -> str:
+    """Equivalent of BeautifulSoup get_text(separator, strip=True)"""
+    return separator.join(s for s in (t.strip() for t in _strings(el)) if s)
+
+
+class LxmlExtractor:
+    """Extract reviews from an lxml tree using a compiled ExtractionPlan"""
+    
+    def __init__(self, plan: ExtractionPlan):
+        self.plan = plan
+        
+        search = dict(plan.review_search)
+        review_attrs = dict(search.pop('attrs', {}))
+        if 'class_' in search:
+            review_attrs['class'] = search['class_']
+        if 'lang' in search:
+            review_attrs['lang'] = search['lang']
+        self.review_sel = Selector(plan.review_tag, review_attrs)
+        
+        self.username_sel = Selector(plan.username_tag, plan.username_attrs)
+        self.username_probes = [Selector(plan.username_tag, probe) for probe in plan.username_probes]
+        self.rating_aria_sel = Selector(attrs=plan.rating_aria_attrs) if plan.rating_aria_attrs else None
+        self.rating_class_sel = Selector(attrs={'class': True}) if plan.rating_class_re else None
+        self.elite_sel = Selector(plan.elite_tag, plan.elite_attrs) if plan.elite_tag else None
+    
+    def find_review_elements(self, root) -> list:
+        return self.review_sel.find_all(root)
+    
+    def find_container(self, elem):
+        """Walk up to the review container (same rules as the BeautifulSoup path)"""
+        plan = self.plan
+        current = elem
+        for _ in range(plan.container_levels):
+            parent = current.getparent()
+            if parent is None:
+                break
+            if parent.tag == plan.container_tag:
+                if not plan.container_needs_user:
+                    return parent
+                # Check if this container has a user link
+                for probe in self.username_probes:
+                    if probe.find(parent) is not None:
+                        return parent
+            current = parent
+        return current
+    
+    def extract_username(self, container) -> str:
+        if not self.plan.username_attrs and not self.plan.container_needs_user:
+            # GUI presets without a username pattern never match a username
+            return ''
+        for link in self.username_sel.find_all(container):
+            text = get_text(link)
+            if text and len(text) >= 2 and USERNAME_START_RE.match(text):
+                return text
+        return ''
+    
+    def extract_rating(self, container) -> str:
+        plan = self.plan
+        if self.rating_aria_sel is not None:
+            elem = self.rating_aria_sel.find(container)
+            if elem is not None:
+                match = NUMBER_RE.search(elem.get('aria-label', ''))
+                if match:
+                    return match.group(1)
+        if self.rating_class_sel is not None:
+            for elem in self.rating_class_sel.find_all(container):
+                for cls in elem.get('class', '').split():
+                    match = plan.rating_class_re.search(cls)
+                    if match:
+                        return str(int(match.group(1)) // 10)  # bubble_50 -> 5
+        return ''
+    
+    def extract_review(self, elem) -> dict:
+        """Extract review data from a review element"""
+        plan = self.plan
+        review = {col: '' for col in plan.columns}
+        
+        review_text = get_text(elem)
+        if len(review_text) < 50:
+            return None
+        review['review_text'] = review_text
+        
+        container = self.find_container(elem)
+        container_text = get_text(container, ' ')
+        
+        review['username'] = self.extract_username(container)
+        if not review['username']:
+            return None
+        
+        if plan.location_re and 'from' in review:
+            match = plan.location_re.search(container_text)
+            if match:
+                review['from'] = match.group(1) if match.lastindex else match.group()
+        
+        if plan.date_re and 'written_date' in review:
+            match = plan.date_re.search(container_text)
+            if match:
+                review['written_date'] = match.group()
+        
+        review['rating'] = self.extract_rating(container)
+        
+        if plan.helpful_re and 'daya_tarik_wisata' in review:
+            match = plan.helpful_re.search(container_text)
+            if match:
+                review['daya_tarik_wisata'] = match.group(1)
+        
+        if plan.contribution_re and 'contribution' in review:
+            match = plan.contribution_re.search(container_text)
+            if match:
+                if match.lastindex and match.lastindex >= 2:
+                    review['contribution'] = f"{match.group(1)} reviews, {match.group(2)} photos"
+                else:
+                    review['contribution'] = match.group(1)
+        
+        if self.elite_sel is not None and ('status' in review or 'tema_pengalaman' in review):
+            elite = self.elite_sel.find(container)
+            status = get_text(elite) if elite is not None else ''
+            if 'status' in review:
+                review['status'] = status
+            if 'tema_pengalaman' in review:
+                review['tema_pengalaman'] = status
+        
+        return review
+    
+    def extract_reviews(self, root) -> list:
+        reviews = []
+        for elem in self.find_review_elements(root):
+            review = self.extract_review(elem)
+            if review and review.get('username'):
+                reviews.append(review)
+        return reviews
+
+
+def parse_html(content: str):
+    """Parse HTML text into an lxml tree"""
+    from lxml import etree
+    parser = etree.HTMLParser(encoding='utf-8')
+    return etree.fromstring(content.encode('utf-8'), parser)
+
+
+def parse_content(content: str, config) -> list:
+    """Extract reviews from HTML text with the lxml backend"""
+    root = parse_html(content)
+    if root is None:
+        return []
+    return LxmlExtractor(compile_plan(config)).extract_reviews(root)
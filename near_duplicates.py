@@ -0,0 +1,220 @@
+"""
+Near-Duplicate Detection
+Deteksi review yang hampir sama dengan shingling + MinHash + LSH
+
+Dedup biasa hanya menangkap review yang persis sama (username + 100 karakter
+pertama). Modul ini juga menangkap review yang di-repost atau sedikit diedit,
+dan review yang sama yang tersimpan dalam versi "Read more" terpotong dan
+versi lengkap.
+
+Cara kerja:
+    - Teks dinormalisasi, "... Read more" di akhir dibuang, lalu dipecah
+      menjadi shingle kata (default 3 kata)
+    - MinHash signature (numpy) dari semua shingle dan dari shingle awal
+      (prefix) saja; prefix membuat versi terpotong bertemu versi lengkap
+    - LSH: signature dibagi menjadi band, review dengan band yang sama menjadi
+      kandidat, jadi tidak ada perbandingan semua-pasangan (sub-kuadratik)
+    - Kandidat dikonfirmasi dengan estimasi Jaccard, atau containment untuk
+      teks yang satu merupakan bagian dari teks yang lain
+"""
+
+import re
+import zlib
+from typing import TYPE_CHECKING
+
+from review_stream import normalize_text
+
+
+DEFAULT_THRESHOLD = 0.8
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Largest prime below 2**32, so hash values fit in uint32
+_PRIME = 4294967291
+
+_READ_MORE_RE = re.compile(r'(\.\.\.|…)?\s*(read more|more)\s*$')
+_WORD_RE = re.compile(r'\w+')
+
+
+def shingles(text: str, size: int = 3) -> list:
+    """Word shingles of normalized text, in document order (may repeat)"""
+    text = normalize_text(text)
+    if text.endswith('more'):
+        text = _READ_MORE_RE.sub('', text)
+    words = _WORD_RE.findall(text)
+    if len(words) < size:
+        return [' '.join(words)] if words else []
+    return [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+class NearDuplicateIndex:
+    """
+    Incremental MinHash LSH index
+    
+    add() returns the position of an earlier near-duplicate (or None) and
+    stores the new text, so the index works as a streaming dedup stage.
+    """
+    
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = 128,
+                 bands: int = 16, shingle_size: int = 3, prefix_shingles: int = 20,
+                 seed: int = 1):
+        """
+        Args:
+            threshold: Minimum estimated Jaccard (or containment) similarity
+            num_perm: MinHash permutations (signature length)
+            bands: LSH bands; num_perm must be divisible by bands
+            shingle_size: Words per shingle
+            prefix_shingles: Shingles used for the prefix signature
+            seed: Seed for the hash permutations (results are deterministic)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.prefix_shingles = prefix_shingles
+        
+        import numpy as np  # deferred: only needed once near-dup detection is used
+        
+        rng = np.random.default_rng(seed)
+        # a < 2**31 keeps a * x below 2**63 for 32-bit x
+        self._a = rng.integers(1, 2 ** 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2 ** 31, size=num_perm, dtype=np.uint64)
+        # Folds each band of a signature into one 64-bit bucket hash
+        self._band_mix = rng.integers(1, 2 ** 63, size=(2, bands, self.rows), dtype=np.uint64)
+        self._prime = np.uint64(_PRIME)
+        
+        self.buckets = {}      # (group, bucket hash) -> [positions]
+        self.signatures = []   # uint32 signature per stored text
+        self.sizes = []        # Number of distinct shingles per stored text
+    
+    def __len__(self) -> int:
+        return len(self.signatures)
+    
+    def signature(self, text: str):
+        """Return (full signature, prefix signature, distinct shingle count)"""
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return None, None, 0
+        
+        import numpy as np
+        hashes = np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams),
+                             dtype=np.uint64, count=len(grams))
+        # Repeated shingles do not change the minimum, so no np.unique
+        values = (np.outer(hashes, self._a) + self._b) % self._prime
+        full = values.min(axis=0).astype(np.uint32)
+        prefix = values[:self.prefix_shingles].min(axis=0).astype(np.uint32)
+        return full, prefix, len(set(grams))
+    
+    def _band_keys(self, full: 'np.ndarray', prefix: 'np.ndarray', group) -> list:
+        # One hash per band of the full and prefix signatures; the mix
+        # differs per band and signature so equal rows in different bands
+        # do not collide
+        import numpy as np
+        sigs = np.stack((full, prefix)).reshape(2, self.bands, self.rows).astype(np.uint64)
+        hashes = (sigs * self._band_mix).sum(axis=2).ravel()
+        return [(group, h) for h in hashes.tolist()]
+    
+    def similarity(self, full: 'np.ndarray', size: int, other: int) -> float:
+        """Estimated similarity to a stored text (max of Jaccard and containment)"""
+        jaccard = float((full == self.signatures[other]).mean())
+        if jaccard <= 0:
+            return 0.0
+        other_size = self.sizes[other]
+        # |A & B| estimated from Jaccard and the set sizes
+        overlap = jaccard * (size + other_size) / (1 + jaccard)
+        containment = overlap / max(1, min(size, other_size))
+        return max(jaccard, min(1.0, containment))
+    
+    def query(self, text: str, group=None):
+        """Position of a stored near-duplicate of text, or None"""
+        full, prefix, size = self.signature(text)
+        if full is None:
+            return None
+        return self._match(full, prefix, size, group)
+    
+    def _match(self, full, prefix, size, group):
+        checked = set()
+        for key in self._band_keys(full, prefix, group):
+            for other in self.buckets.get(key, ()):
+                if other in checked:
+                    continue
+                checked.add(other)
+                if self.similarity(full, size, other) >= self.threshold:
+                    return other
+        return None
+    
+    def add(self, text: str, group=None):
+        """
+        Store text and return the position of an earlier near-duplicate
+        
+        Args:
+            text: Review text
+            group: Optional key; only texts with the same group are compared
+                   (e.g. the normalized username)
+        
+        Returns:
+            Position of the matching earlier text, or None if text is new.
+            Near-duplicates are not stored.
+        """
+        full, prefix, size = self.signature(text)
+        if full is None:
+            return None
+        
+        match = self._match(full, prefix, size, group)
+        if match is not None:
+            return match
+        
+        position = len(self.signatures)
+        self.signatures.append(full)
+        self.sizes.append(size)
+        for key in self._band_keys(full, prefix, group):
+            self.buckets.setdefault(key, []).append(position)
+        return None
+
+
+def drop_near_duplicates(reviews, threshold: float = DEFAULT_THRESHOLD, same_user: bool = True,
+                         stats: dict = None):
+    """
+    Dedup stage: yield reviews that are not near-duplicates of an earlier one
+    
+    Args:
+        reviews: Iterable of review dicts
+        threshold: Similarity threshold (0-1)
+        same_user: Only treat reviews by the same username as duplicates
+        stats: Optional dict, 'near_duplicates' count is updated in place
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    for r in reviews:
+        group = normalize_text(r.get('username', '')) if same_user else None
+        if index.add(r.get('review_text', ''), group) is not None:
+            if stats is not None:
+                stats['near_duplicates'] = stats.get('near_duplicates', 0) + 1
+            continue
+        yield r
+
+
+def find_near_duplicates(reviews: list, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Group near-duplicate reviews (any username) for validation reports
+    
+    Returns:
+        List of clusters, each a list of review positions (size >= 2), in
+        order of first appearance
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    clusters = {}       # Stored position -> review positions
+    stored = {}         # Stored position -> review position
+    for i, r in enumerate(reviews):
+        before = len(index)
+        match = index.add(r.get('review_text', ''))
+        if match is None:
+            if len(index) > before:
+                stored[before] = i
+        else:
+            clusters.setdefault(match, [stored[match]]).append(i)
+    return list(clusters.values())
@@ -0,0 +1,49 @@
+"""
+Page Loader
+Membaca file HTML dan membangun BeautifulSoup tree, opsional hanya untuk
+bagian halaman yang bisa berisi review (partial parsing)
+
+Halaman "Webpage, Complete" sebagian besar berisi script, navigasi dan iklan.
+Dengan partial parsing hanya elemen container review (mis. <li> untuk Yelp)
+dan elemen review_tag beserta isinya yang dibangun menjadi tree, sehingga
+parsing lebih cepat dan hemat memori. Jika ada elemen review yang ternyata
+tidak berada di dalam container_tag, parser kembali ke full tree.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+def read_html(filepath: str) -> str:
+    """Read HTML file as text (UTF-8, falling back to latin-1)"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    except UnicodeDecodeError:
+        with open(filepath, 'r', encoding='latin-1') as f:
+            return f.read()
+
+
+def make_soup(content: str, region_tags=None) -> 'BeautifulSoup':
+    """
+    Build a BeautifulSoup tree
+    
+    Args:
+        content: HTML source
+        region_tags: Tag name (or list of names) of the review containers
+                     and review elements. When given, only those elements
+                     and their subtrees are materialized.
+    """
+    # Deferred so entry points (and the GUI window) start without bs4/lxml
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    if not region_tags:
+        return BeautifulSoup(content, 'lxml')
+    return BeautifulSoup(content, 'lxml', parse_only=SoupStrainer(region_tags))
+
+
+def escaped_region(container) -> bool:
+    """True if a container walk-up ran past the review region to the document root"""
+    return container is None or container.parent is None
@@ -0,0 +1,144 @@
+"""
+Page Pipeline
+Pipeline asyncio producer/consumer: fetch -> parse -> tulis
+
+Tiga tahap berjalan bersamaan dan dihubungkan oleh asyncio.Queue yang
+dibatasi (bounded), jadi browser tidak menganggur selama parsing dan parser
+tidak menganggur selama halaman berikutnya dimuat:
+
+    fetch   fetch(item) di thread pool, `workers` halaman sekaligus
+    parse   parse(html) di executor terpisah (satu thread), berurutan
+    consume consume(item, result) di event loop (dedup, logika berhenti,
+            tulis CSV); return False untuk berhenti
+
+Urutan hasil sama dengan urutan item. Queue yang penuh menahan tahap
+sebelumnya (backpressure), sehingga halaman tidak menumpuk di memori. Saat
+consume berhenti, halaman yang belum dimulai dibatalkan (tidak di-fetch)
+dan halaman yang masih dimuat ditunggu sampai selesai, sehingga tidak ada
+fetch yang masih berjalan setelah run_pipeline selesai (driver dan koneksi
+boleh langsung ditutup).
+"""
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def _run(items, fetch, parse, consume, workers: int, queue_size: int, stats: dict):
+    loop = asyncio.get_running_loop()
+    fetch_pool = ThreadPoolExecutor(max_workers=workers)
+    parse_pool = ThreadPoolExecutor(max_workers=1)
+    stats_lock = threading.Lock()
+    stopping = threading.Event()           # Set when the pipeline ends: queued fetches are skipped
+    fetched = asyncio.Queue(queue_size)    # (item, fetch task), in item order
+    parsed = asyncio.Queue(queue_size)     # (item, result), in item order
+    slots = asyncio.Semaphore(workers)
+    inflight = set()                       # Fetch tasks not awaited by the parse stage yet
+    
+    def timed(func, key):
+        def call(arg):
+            start = time.perf_counter()
+            try:
+                return func(arg)
+            finally:
+                with stats_lock:
+                    stats[key] += time.perf_counter() - start
+        return call
+    
+    fetch_timed = timed(fetch, 'fetch_seconds')
+    parse_timed = timed(parse, 'parse_seconds')
+    
+    def fetch_unless_stopping(item):
+        if stopping.is_set():
+            return None
+        return fetch_timed(item)
+    
+    async def fetch_one(item):
+        try:
+            return await loop.run_in_executor(fetch_pool, fetch_unless_stopping, item)
+        finally:
+            slots.release()
+    
+    async def produce():
+        for item in items:
+            await slots.acquire()
+            task = asyncio.ensure_future(fetch_one(item))
+            inflight.add(task)
+            await fetched.put((item, task))
+        await fetched.put(_DONE)
+    
+    async def parse_stage():
+        while True:
+            entry = await fetched.get()
+            if entry is _DONE:
+                break
+            item, task = entry
+            try:
+                try:
+                    html = await task
+                finally:
+                    inflight.discard(task)
+                result = await loop.run_in_executor(parse_pool, parse_timed, html)
+            except Exception as e:
+                await parsed.put(_Failed(e))
+                return
+            stats['pages'] += 1
+            await parsed.put((item, result))
+        await parsed.put(_DONE)
+    
+    producer = asyncio.ensure_future(produce())
+    parser = asyncio.ensure_future(parse_stage())
+    try:
+        while True:
+            entry = await parsed.get()
+            if entry is _DONE:
+                break
+            if isinstance(entry, _Failed):
+                raise entry.error
+            if consume(*entry) is False:
+                stats['stopped'] = True
+                break
+    finally:
+        stopping.set()
+        for task in [producer, parser, *inflight]:
+            task.cancel()
+        await asyncio.gather(producer, parser, *inflight, return_exceptions=True)
+        # Fetches already running finish here, before the caller closes the
+        # drivers and HTTP connections they use
+        fetch_pool.shutdown(wait=True, cancel_futures=True)
+        parse_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_pipeline(items, fetch, parse, consume, workers: int = 1, queue_size: int = None) -> dict:
+    """
+    Run fetch -> parse -> consume as overlapping stages
+    
+    Args:
+        items: Iterable of page keys (e.g. offsets), may be open-ended
+        fetch: fetch(item) -> html, blocking (runs in a thread pool)
+        parse: parse(html) -> result, blocking (runs in an executor)
+        consume: consume(item, result) in item order; return False to stop
+        workers: Pages fetched at once
+        queue_size: Capacity of each queue (default: 2 x workers)
+    
+    Returns:
+        Stats dict: pages, stopped (consume returned False), fetch_seconds and
+        parse_seconds (summed over threads) and wall_seconds
+    """
+    workers = max(1, workers)
+    stats = {'pages': 0, 'stopped': False, 'fetch_seconds': 0.0, 'parse_seconds': 0.0}
+    start = time.perf_counter()
+    try:
+        asyncio.run(_run(iter(items), fetch, parse, consume, workers, queue_size or 2 * workers, stats))
+    finally:
+        stats['wall_seconds'] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,61 @@
+"""
+Page Wait
+Menunggu halaman dinamis siap berdasarkan jumlah container review
+
+Daripada menunggu elemen pertama lalu sleep tetap, jumlah elemen `selector`
+di-poll: halaman dianggap siap saat jumlahnya > 0 dan tidak berubah selama
+beberapa poll berturut-turut. Halaman yang sudah selesai dimuat
+(document.readyState == 'complete') tetapi tetap tanpa review dilepas
+setelah `empty_grace` detik, tidak menunggu sampai timeout.
+"""
+
+import time
+
+
+def document_complete(driver) -> bool:
+    try:
+        return driver.execute_script('return document.readyState') == 'complete'
+    except Exception:
+        return False
+
+
+def wait_for_stable_count(driver, selector: str, timeout: float = 15.0, poll: float = 0.25,
+                          stable_polls: int = 2, empty_grace: float = 3.0):
+    """
+    Poll the number of elements matching a CSS selector until it stabilizes
+    
+    Args:
+        driver: WebDriver (needs find_elements and execute_script)
+        selector: CSS selector of one element per review
+        timeout: Give up after this many seconds
+        poll: Seconds between counts
+        stable_polls: Unchanged non-zero counts in a row needed to be ready
+        empty_grace: Seconds a fully loaded page may show no reviews
+    
+    Returns:
+        (count, ready): last count, and False if the page timed out or
+        loaded without reviews
+    """
+    from selenium.webdriver.common.by import By
+    
+    start = time.monotonic()
+    last = -1
+    stable = 0
+    while True:
+        count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+        elapsed = time.monotonic() - start
+        
+        if count and count == last:
+            stable += 1
+            if stable >= stable_polls:
+                return count, True
+        else:
+            stable = 0
+        
+        if not count and elapsed >= empty_grace and document_complete(driver):
+            return 0, False
+        if elapsed >= timeout:
+            return count, count > 0
+        
+        last = count
+        time.sleep(poll)
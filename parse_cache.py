@@ -0,0 +1,171 @@
+"""
+Parse Cache
+Cache hasil parsing per file di SQLite supaya file yang tidak berubah tidak
+perlu di-parse ulang
+
+Key cache = hash isi file (SHA-256) + versi plan (hash preset + backend +
+CACHE_FORMAT). File yang baru atau berubah di-parse, sisanya dimuat dari
+cache. Ukuran cache dibatasi; entry yang paling lama tidak dipakai dibuang
+lebih dulu.
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+
+from parse_pool import iter_parsed_files
+
+
+# Bump when the extraction logic changes in a way that alters rows
+CACHE_FORMAT = 1
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.scraper_cache', 'parse_cache.sqlite3')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_hash(filepath: str) -> str:
+    """SHA-256 of file content"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_version(plan, backend: str = 'bs4') -> str:
+    """Version key for a compiled plan and backend"""
+    source = json.dumps(plan.source, sort_keys=True, default=str)
+    raw = f"{CACHE_FORMAT}|{backend}|{source}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class ParseCache:
+    """SQLite store of extracted reviews keyed by file hash and plan version"""
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS parsed_files (
+                content_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                reviews BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (content_hash, version)
+            )
+        """)
+        self.conn.commit()
+    
+    def contains(self, content_hash: str, version: str) -> bool:
+        """Check for an entry without loading it"""
+        row = self.conn.execute(
+            "SELECT 1 FROM parsed_files WHERE content_hash = ? AND version = ?",
+            (content_hash, version)
+        ).fetchone()
+        return row is not None
+    
+    def get(self, content_hash: str, version: str):
+        """Return cached reviews or None"""
+        row = self.conn.execute(
+            "SELECT reviews FROM parsed_files WHERE content_hash = ? AND version = ?",
+            (content_hash, version)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        self.hits += 1
+        self.conn.execute(
+            "UPDATE parsed_files SET last_used = ? WHERE content_hash = ? AND version = ?",
+            (time.time(), content_hash, version)
+        )
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+    
+    def put(self, content_hash: str, version: str, reviews: list):
+        """Store reviews for a file"""
+        blob = zlib.compress(json.dumps(reviews, ensure_ascii=False).encode('utf-8'))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO parsed_files VALUES (?, ?, ?, ?, ?)",
+            (content_hash, version, blob, len(blob), time.time())
+        )
+    
+    def total_size(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM parsed_files").fetchone()[0]
+    
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        excess = self.total_size() - self.max_bytes
+        if excess > 0:
+            rows = self.conn.execute(
+                "SELECT content_hash, version, size FROM parsed_files ORDER BY last_used"
+            ).fetchall()
+            for content_hash, version, size in rows:
+                if excess <= 0:
+                    break
+                self.conn.execute(
+                    "DELETE FROM parsed_files WHERE content_hash = ? AND version = ?",
+                    (content_hash, version)
+                )
+                excess -= size
+        self.conn.commit()
+    
+    def clear(self):
+        """Remove every entry (rebuild cache)"""
+        self.conn.execute("DELETE FROM parsed_files")
+        self.conn.commit()
+        self.conn.execute("VACUUM")
+    
+    def close(self):
+        self.evict()
+        self.conn.close()
+
+
+def iter_cached_files(parse_func, files: list, cache, version: str, jobs: int = 1, cancel=None):
+    """
+    Like iter_parsed_files, but load unchanged files from the cache
+    
+    Only cache misses are sent to the process pool. Results are still
+    yielded as (filepath, reviews) in input order. After `cancel` is set
+    only files that were already parsed are yielded (see iter_parsed_files).
+    """
+    if cache is None:
+        yield from iter_parsed_files(parse_func, files, jobs, cancel)
+        return
+    
+    hashes = [file_hash(f) for f in files]
+    is_cached = [cache.contains(h, version) for h in hashes]
+    misses = [f for f, hit in zip(files, is_cached) if not hit]
+    parsed = iter_parsed_files(parse_func, misses, jobs, cancel)
+    pending = None
+    
+    # Cached reviews are loaded one file at a time, in order
+    for filepath, content_hash, hit in zip(files, hashes, is_cached):
+        if cancel is not None and cancel.is_set() and (hit or pending is False):
+            continue
+        if hit:
+            reviews = cache.get(content_hash, version)
+        else:
+            if pending is None:
+                pending = next(parsed, False)
+            if pending is False or pending[0] != filepath:
+                continue  # cancelled before this file was parsed
+            reviews = pending[1]
+            pending = None
+            cache.misses += 1
+            cache.put(content_hash, version, reviews)
+        yield filepath, reviews
+    
+    parsed.close()
+    cache.evict()
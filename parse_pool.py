@@ -0,0 +1,91 @@
+"""
+Parallel Parse Pool
+Menjalankan parsing file HTML di beberapa proses sekaligus (multi-core)
+
+Hasil per file dikirim balik begitu tersedia, tetapi selalu dalam urutan
+file input sehingga output dan hasil dedup sama persis dengan mode serial.
+
+Dengan `cancel` (threading.Event) parsing selalu berjalan di proses worker,
+juga untuk 1 job, sehingga bisa dihentikan di tengah file: setelah event
+di-set pool di-terminate dalam ~CANCEL_POLL detik, dan hanya file yang
+sudah selesai di-parse yang masih dikirim balik.
+"""
+
+import os
+import multiprocessing
+
+
+CANCEL_POLL = 0.1
+
+
+def default_jobs() -> int:
+    """Number of worker processes to use when --jobs 0 is given"""
+    return os.cpu_count() or 1
+
+
+def resolve_jobs(jobs) -> int:
+    """Normalize a --jobs value (None/1 = serial, 0 = all cores)"""
+    if jobs is None:
+        return 1
+    jobs = int(jobs)
+    if jobs <= 0:
+        return default_jobs()
+    return jobs
+
+
+def iter_parsed_files(parse_func, files: list, jobs: int = 1, cancel=None):
+    """
+    Parse files and yield (filepath, reviews) in input order
+    
+    Args:
+        parse_func: Picklable function taking a filepath and returning a list
+        files: List of file paths
+        jobs: Number of worker processes (1 = serial, 0 = all cores)
+        cancel: Optional threading.Event; once set, parses in progress are
+                terminated and only files already parsed are yielded
+    """
+    jobs = min(resolve_jobs(jobs), max(1, len(files)))
+    
+    if cancel is not None:
+        yield from _iter_cancellable(parse_func, files, jobs, cancel)
+        return
+    
+    if jobs <= 1:
+        for filepath in files:
+            yield filepath, parse_func(filepath)
+        return
+    
+    # imap keeps input order and streams each result as soon as it (and
+    # every file before it) is done
+    with multiprocessing.Pool(processes=jobs) as pool:
+        for filepath, reviews in zip(files, pool.imap(parse_func, files)):
+            yield filepath, reviews
+
+
+def _iter_cancellable(parse_func, files: list, jobs: int, cancel):
+    if not files:
+        return
+    
+    pool = multiprocessing.Pool(processes=jobs)
+    try:
+        results = [pool.apply_async(parse_func, (filepath,)) for filepath in files]
+        position = 0
+        while position < len(files):
+            result = results[position]
+            while not result.ready() and not cancel.is_set():
+                result.wait(CANCEL_POLL)
+            if cancel.is_set():
+                break
+            results[position] = None  # do not keep yielded reviews alive
+            position += 1
+            yield files[position - 1], result.get()
+        
+        if position < len(files):
+            # Cancelled: stop the parses in flight, keep what already finished
+            pool.terminate()
+            for filepath, result in zip(files[position:], results[position:]):
+                if result.ready() and result.successful():
+                    yield filepath, result.get()
+    finally:
+        pool.terminate()
+        pool.join()
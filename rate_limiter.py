@@ -0,0 +1,57 @@
+"""
+Rate Limiter
+Budget kesopanan (politeness) global untuk request ke website
+
+Satu TokenBucket dipakai bersama oleh semua worker/driver, sehingga jumlah
+driver tidak menambah beban ke server. Bucket terisi `rate` token per detik
+sampai maksimal `burst`; setiap request memakai satu token dan menunggu jika
+bucket kosong. Dengan burst=1 request dimulai paling cepat setiap 1/rate
+detik; burst yang lebih besar mengizinkan beberapa request sekaligus setelah
+jeda, dengan rata-rata tetap `rate`. Token dibagikan berurutan (FIFO) dan
+thread-safe.
+"""
+
+import time
+import threading
+
+
+DEFAULT_RATE = 1 / 3
+DEFAULT_BURST = 1
+
+
+class TokenBucket:
+    """Token-bucket limiter shared by all threads"""
+    
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        """
+        Args:
+            rate: Average requests per second (0 = no limit)
+            burst: Maximum requests started back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.requests = 0
+        self.waited = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def wait(self) -> float:
+        """Take one token, blocking until it is available; return seconds waited"""
+        with self._lock:
+            self.requests += 1
+            if not self.rate:
+                return 0.0
+            
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (tokens may go negative), so waiting
+            # threads are served in order
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += delay
+        
+        if delay > 0:
+            time.sleep(delay)
+        return delay
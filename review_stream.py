@@ -0,0 +1,239 @@
+"""
+Review Stream
+Pipeline streaming: file -> review -> dedup -> filter tahun -> CSV
+
+Review dari setiap file diteruskan satu per satu lewat generator. Dedup lalu
+filter tahun dilakukan in-line, dan baris langsung ditulis ke CSV (flush
+berkala), sehingga memori tidak bertambah seiring jumlah file. Yang disimpan
+hanya set review_id.
+
+Setiap review mendapat review_id yang stabil (hash dari username dan awal
+review_text yang dinormalisasi), ditulis sebagai kolom terakhir. Dengan
+DedupIndex (dedup_index.py) set review_id disimpan di disk sehingga review
+yang sudah pernah dikumpulkan tidak ditulis lagi di run berikutnya.
+
+CSV ditulis ke file sementara '<output>.part' dan baru di-rename ke nama
+output setelah selesai; jika tidak ada baris sama sekali file tidak dibuat.
+Dengan append=True baris ditambahkan ke CSV yang sudah ada; baris terakhir
+yang terpotong (proses mati saat menulis) dibuang dulu.
+"""
+
+import os
+import csv
+import hashlib
+import unicodedata
+
+from extraction_plan import YEAR_RE
+
+
+FLUSH_EVERY = 500
+
+ID_COLUMN = 'review_id'
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold, NFKC-normalize and collapse whitespace"""
+    text = unicodedata.normalize('NFKC', text or '').casefold()
+    return ' '.join(text.split())
+
+
+def review_id(review: dict) -> str:
+    """Stable ID from the normalized username and the first 100 characters of the text"""
+    raw = normalize_text(review.get('username', '')) + '\x1f' + normalize_text(review.get('review_text', ''))[:100]
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def output_columns(columns) -> list:
+    """Output CSV columns: the config columns plus review_id"""
+    columns = list(columns)
+    if ID_COLUMN not in columns:
+        columns.append(ID_COLUMN)
+    return columns
+
+
+def review_year(review: dict):
+    """Year of written_date, or None"""
+    match = YEAR_RE.search(review.get('written_date', '') or '')
+    return int(match.group(1)) if match else None
+
+
+def iter_reviews(results, stats: dict = None):
+    """
+    Flatten (filepath, reviews) pairs from iter_parsed_files into reviews
+    
+    Args:
+        results: Iterable of (filepath, reviews)
+        stats: Optional dict, 'files' and 'reviews' counts are updated in place
+    """
+    for _, reviews in results:
+        if stats is not None:
+            stats['files'] = stats.get('files', 0) + 1
+            stats['reviews'] = stats.get('reviews', 0) + len(reviews)
+        yield from reviews
+
+
+def dedup_reviews(reviews, seen=None):
+    """
+    Yield reviews with a username whose review_id was not seen before
+    
+    Each yielded review gets its 'review_id'. seen can be a set or a
+    DedupIndex (anything with `in` and add()).
+    """
+    seen = set() if seen is None else seen
+    for r in reviews:
+        if not r.get('username'):
+            continue
+        rid = review_id(r)
+        if rid not in seen:
+            seen.add(rid)
+            r[ID_COLUMN] = rid
+            yield r
+
+
+def filter_years(reviews, start: int, end: int):
+    """Yield reviews whose year is within start..end"""
+    for r in reviews:
+        year = review_year(r)
+        if year and start <= year <= end:
+            yield r
+
+
+def dedup_filter_years(reviews, years=None, index=None, seen=None):
+    """
+    Dedup first, then the year filter
+    
+    The first occurrence of a review_id wins even when it is outside the
+    years. A persistent index (DedupIndex) is checked after the filter, so
+    it only records the reviews that are kept.
+    
+    Args:
+        reviews: Iterable of review dicts
+        years: (start, end) or None for no year filter
+        index: DedupIndex (or set) of reviews already written, or None
+        seen: Set of review_ids passed so far in this run, kept between
+              calls (watch mode); default a new set
+    """
+    reviews = dedup_reviews(reviews, seen)
+    if years:
+        reviews = filter_years(reviews, *years)
+    if index is not None:
+        reviews = dedup_reviews(reviews, index)
+    return reviews
+
+
+def read_header(csv_path: str) -> list:
+    """Header of an existing CSV (empty list if missing or empty)"""
+    if not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0:
+        return []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def trim_partial_row(csv_path: str) -> bool:
+    """
+    Drop an incomplete last row (a write cut off by a crash) from a CSV
+    
+    Rows written by the csv module end with '\r\n', so only a file that
+    does not is scanned for the start of its last row.
+    
+    Returns:
+        True if the file was truncated
+    """
+    if not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0:
+        return False
+    with open(csv_path, 'rb') as f:
+        f.seek(max(0, os.path.getsize(csv_path) - 2))
+        if f.read() == b'\r\n':
+            return False
+        f.seek(0)
+        
+        # The reader pulls one line at a time, so tell() before each row
+        # is where that row starts
+        lines = (line.decode('utf-8', errors='replace') for line in iter(f.readline, b''))
+        reader = csv.reader(lines)
+        last_start = position = 0
+        while True:
+            try:
+                next(reader)
+            except (StopIteration, csv.Error):
+                break
+            last_start, position = position, f.tell()
+    
+    with open(csv_path, 'r+b') as f:
+        f.truncate(last_start)
+    return True
+
+
+class CSVStreamWriter:
+    """Write rows to a CSV as they are produced, flushing every few rows"""
+    
+    def __init__(self, output_file: str, columns, flush_every: int = FLUSH_EVERY, append: bool = False):
+        """
+        Args:
+            output_file: CSV path
+            columns: Config columns (review_id is added)
+            flush_every: Flush to disk every N rows
+            append: Add rows to an existing CSV (keeping its header) instead of
+                    replacing it
+        """
+        self.output_file = output_file
+        self.flush_every = flush_every
+        self.append = append
+        self.count = 0
+        columns = output_columns(columns)
+        
+        if append:
+            self.part_file = None
+            if trim_partial_row(output_file):
+                print(f"[WARN] Dropped an incomplete last row from {output_file}")
+            header = read_header(output_file)
+            self.f = open(output_file, 'a', newline='', encoding='utf-8')
+            self.writer = csv.DictWriter(self.f, fieldnames=header or columns, extrasaction='ignore')
+            if not header:
+                self.writer.writeheader()
+        else:
+            self.part_file = output_file + '.part'
+            self.f = open(self.part_file, 'w', newline='', encoding='utf-8')
+            self.writer = csv.DictWriter(self.f, fieldnames=columns)
+            self.writer.writeheader()
+    
+    def write(self, row: dict):
+        self.writer.writerow(row)
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.f.flush()
+    
+    def sync(self) -> bool:
+        """
+        Flush the written rows to disk
+        
+        Returns:
+            True if they are now durable in the output file itself (append
+            mode); otherwise they only reach it on close()
+        """
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        return self.part_file is None
+    
+    def close(self) -> int:
+        """Finish the file (removed if empty), return number of rows"""
+        if self.f.closed:
+            return self.count
+        self.f.close()
+        if self.part_file is None:
+            return self.count
+        if self.count:
+            os.replace(self.part_file, self.output_file)
+        else:
+            os.remove(self.part_file)
+        return self.count
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep the .part file, the output is incomplete
+            self.f.close()
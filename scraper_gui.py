@@ -7,14 +7,29 @@ Requirements:
 """
 
 import os
-import re
 import csv
 import glob
+import queue
 import threading
+import functools
+import contextlib
+import multiprocessing
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from datetime import datetime
-from bs4 import BeautifulSoup
+
+from extraction_plan import compile_plan, ExtractionPlan, USERNAME_START_RE, NUMBER_RE
+from page_loader import read_html, make_soup, escaped_region
+import lxml_backend
+import stream_parser
+from parse_pool import default_jobs
+from review_stream import normalize_text, dedup_reviews, filter_years
+from columnar_export import export_format, open_writer, write_reviews
+from near_duplicates import NearDuplicateIndex
+from data_validation import validate_reviews, near_duplicate_groups, QualityStats
+from dedup_index import DedupIndex, DEFAULT_INDEX_PATH
+from parse_cache import ParseCache, iter_cached_files, cache_version, DEFAULT_CACHE_PATH
+from virtual_table import VirtualTable, CSVSource
 
 
 class ScraperConfig:
@@ -100,9 +115,163 @@ class ScraperConfig:
     }
 
 
+def parse_file(filepath: str, config, strain: bool = False, backend: str = 'bs4') -> list:
+    """Parse single HTML file (module-level so it can run in a worker process)"""
+    plan = compile_plan(config)
+    
+    if backend == 'stream':
+        return stream_parser.parse_file(filepath, plan)
+    
+    content = read_html(filepath)
+    
+    if backend == 'lxml':
+        return lxml_backend.parse_content(content, plan)
+    
+    reviews = None
+    if strain:
+        # Only build the tree for review containers and review elements
+        region_tags = [plan.container_tag, plan.review_tag]
+        reviews = extract_reviews(make_soup(content, region_tags), plan, strained=True)
+    if reviews is None:
+        reviews = extract_reviews(make_soup(content), plan)
+    
+    return reviews
+
+
+def extract_reviews(soup, plan: ExtractionPlan, strained: bool = False) -> list:
+    """Extract all reviews from a parsed page (None if a strained tree is not enough)"""
+    reviews = []
+    
+    # Find review elements
+    elements = soup.find_all(**plan.review_search)
+    
+    if strained and any(escaped_region(find_container(e, plan)) for e in elements):
+        return None
+    
+    for elem in elements:
+        review = extract_review(elem, plan)
+        if review and review.get('username'):
+            reviews.append(review)
+    
+    return reviews
+
+
+def find_container(elem, plan: ExtractionPlan):
+    """Walk up from review element to its container"""
+    container = elem
+    for _ in range(plan.container_levels):
+        parent = container.parent
+        if parent is None:
+            break
+        if parent.name == plan.container_tag:
+            container = parent
+            break
+        container = parent
+    return container
+
+
+def extract_review(elem, plan: ExtractionPlan) -> dict:
+    """Extract review data from element (plan from compile_plan, built once per run)"""
+    review = {
+        'username': '',
+        'from': '',
+        'written_date': '',
+        'rating': '',
+        'title': '',
+        'review_text': '',
+        'tema_pengalaman': '',
+        'daya_tarik_wisata': '',
+        'status': '',
+        'contribution': ''
+    }
+    
+    # Get review text
+    text = elem.get_text(strip=True)
+    if len(text) < 50:
+        return None
+    review['review_text'] = text
+    
+    # Find container
+    container = find_container(elem, plan)
+    
+    container_text = container.get_text(' ', strip=True)
+    
+    # Extract username
+    if plan.username_attrs:
+        links = container.find_all(plan.username_tag, attrs=plan.username_attrs)
+        for link in links:
+            name = link.get_text(strip=True)
+            if name and len(name) >= 2 and USERNAME_START_RE.match(name):
+                review['username'] = name
+                break
+    
+    if not review['username']:
+        return None
+    
+    # Extract location
+    if plan.location_re:
+        match = plan.location_re.search(container_text)
+        if match:
+            review['from'] = match.group(1) if match.lastindex else match.group()
+    
+    # Extract date
+    if plan.date_re:
+        match = plan.date_re.search(container_text)
+        if match:
+            review['written_date'] = match.group()
+    
+    # Extract rating
+    if plan.rating_aria_attrs:
+        rating_elem = container.find(attrs=plan.rating_aria_attrs)
+        if rating_elem:
+            match = NUMBER_RE.search(rating_elem.get('aria-label', ''))
+            if match:
+                review['rating'] = match.group(1)
+    
+    # Extract helpful
+    if plan.helpful_re:
+        match = plan.helpful_re.search(container_text)
+        if match:
+            review['daya_tarik_wisata'] = match.group(1)
+    
+    # Extract contribution
+    if plan.contribution_re:
+        match = plan.contribution_re.search(container_text)
+        if match:
+            if match.lastindex and match.lastindex >= 2:
+                review['contribution'] = f"{match.group(1)} reviews, {match.group(2)} photos"
+            else:
+                review['contribution'] = match.group(1)
+    
+    # Extract elite/status
+    if plan.has_elite:
+        elite_elem = container.find(plan.elite_tag, attrs=plan.elite_attrs)
+        if elite_elem:
+            review['status'] = elite_elem.get_text(strip=True)
+            review['tema_pengalaman'] = review['status']
+    
+    return review
+
+
+def preview_row(review: dict) -> tuple:
+    """Results table cells of a review"""
+    return (
+        review.get('username', ''),
+        review.get('from', ''),
+        review.get('written_date', ''),
+        review.get('rating', ''),
+        review.get('review_text', '')[:50] + '...'
+    )
+
+
 class ScraperApp:
     """Main Desktop Application"""
     
+    # Worker threads never touch widgets: log/update_status/update_progress
+    # queue events, applied in batches on the Tk main loop. Reviews are only
+    # appended to self.reviews; the results table picks them up each tick.
+    UI_POLL_MS = 50
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Web Scraper - Review Extractor")
@@ -116,14 +285,25 @@ class ScraperApp:
         self.year_end = tk.StringVar(value='2025')
         self.year_filter_enabled = tk.BooleanVar(value=True)
         self.output_file = tk.StringVar(value='scraped_reviews.csv')
+        self.write_var = tk.BooleanVar(value=False)
+        self.jobs_var = tk.StringVar(value='1')
+        self.strain_var = tk.BooleanVar(value=False)
+        self.backend_var = tk.StringVar(value='bs4')
+        self.cache_var = tk.BooleanVar(value=True)
+        self.index_var = tk.BooleanVar(value=False)
+        self.near_dup_var = tk.BooleanVar(value=False)
         
         self.reviews = []
+        self.quality = QualityStats()  # running validation counts of self.reviews
         self.is_running = False
+        self.cancel_event = threading.Event()  # Stop: terminate the parse pool
         self.selected_files = []  # For direct file selection
+        self.ui_events = queue.Queue()
         
         self.create_gui()
         self.apply_theme()
-        
+        self.root.after(self.UI_POLL_MS, self.process_ui_events)
+    
     def create_gui(self):
         """Create the GUI layout"""
         # Main container with padding
@@ -189,6 +369,16 @@ class ScraperApp:
         output_entry = ttk.Entry(row1, textvariable=self.output_file, width=30)
         output_entry.pack(side=tk.LEFT, padx=10)
         
+        write_check = ttk.Checkbutton(row1, text="Write while scraping", 
+                                      variable=self.write_var)
+        write_check.pack(side=tk.LEFT)
+        
+        ttk.Label(row1, text="Parser:").pack(side=tk.LEFT, padx=(20, 0))
+        backend_combo = ttk.Combobox(row1, textvariable=self.backend_var, 
+                                     values=list(lxml_backend.BACKENDS),
+                                     state='readonly', width=6)
+        backend_combo.pack(side=tk.LEFT, padx=10)
+        
         # Row 2: Year Filter
         row2 = ttk.Frame(config_frame)
         row2.pack(fill=tk.X, pady=5)
@@ -205,6 +395,27 @@ class ScraperApp:
         year_end_entry = ttk.Entry(row2, textvariable=self.year_end, width=6)
         year_end_entry.pack(side=tk.LEFT)
         
+        ttk.Label(row2, text="Workers:").pack(side=tk.LEFT, padx=(20, 0))
+        jobs_spin = ttk.Spinbox(row2, from_=1, to=default_jobs(), 
+                                textvariable=self.jobs_var, width=4)
+        jobs_spin.pack(side=tk.LEFT, padx=10)
+        
+        strain_check = ttk.Checkbutton(row2, text="Partial parsing (faster)", 
+                                       variable=self.strain_var)
+        strain_check.pack(side=tk.LEFT, padx=(10, 0))
+        
+        cache_check = ttk.Checkbutton(row2, text="Use parse cache", 
+                                      variable=self.cache_var)
+        cache_check.pack(side=tk.LEFT, padx=(10, 0))
+        
+        index_check = ttk.Checkbutton(row2, text="Skip reviews from earlier runs", 
+                                      variable=self.index_var)
+        index_check.pack(side=tk.LEFT, padx=(10, 0))
+        
+        near_check = ttk.Checkbutton(row2, text="Drop near-duplicates", 
+                                     variable=self.near_dup_var)
+        near_check.pack(side=tk.LEFT, padx=(10, 0))
+        
         # ========== BUTTONS ==========
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=10)
@@ -223,9 +434,15 @@ class ScraperApp:
         validate_btn = ttk.Button(button_frame, text="✓ Validate Data", command=self.validate_data)
         validate_btn.pack(side=tk.LEFT, padx=5)
         
-        export_btn = ttk.Button(button_frame, text="💾 Export CSV", command=self.export_csv)
+        rebuild_btn = ttk.Button(button_frame, text="♻ Rebuild Cache", command=self.rebuild_cache)
+        rebuild_btn.pack(side=tk.LEFT, padx=5)
+        
+        export_btn = ttk.Button(button_frame, text="💾 Export", command=self.export_csv)
         export_btn.pack(side=tk.RIGHT, padx=5)
         
+        open_btn = ttk.Button(button_frame, text="📂 Open CSV", command=self.open_results)
+        open_btn.pack(side=tk.RIGHT, padx=5)
+        
         # ========== PROGRESS ==========
         progress_frame = ttk.Frame(main_frame)
         progress_frame.pack(fill=tk.X, pady=5)
@@ -250,27 +467,13 @@ class ScraperApp:
         results_frame = ttk.LabelFrame(main_frame, text="📊 Results Preview", padding="5")
         results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        # Treeview for results
-        columns = ('username', 'from', 'date', 'rating', 'review')
-        self.tree = ttk.Treeview(results_frame, columns=columns, show='headings', height=8)
-        
-        self.tree.heading('username', text='Username')
-        self.tree.heading('from', text='Location')
-        self.tree.heading('date', text='Date')
-        self.tree.heading('rating', text='Rating')
-        self.tree.heading('review', text='Review')
-        
-        self.tree.column('username', width=100)
-        self.tree.column('from', width=100)
-        self.tree.column('date', width=100)
-        self.tree.column('rating', width=50)
-        self.tree.column('review', width=400)
-        
-        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Virtual table over self.reviews: only the visible rows exist in Tk
+        columns = [('username', 'Username', 100, 'username'),
+                   ('from', 'Location', 100, 'from'),
+                   ('date', 'Date', 100, 'written_date'),
+                   ('rating', 'Rating', 50, 'rating'),
+                   ('review', 'Review', 400, 'review_text')]
+        self.table = VirtualTable(results_frame, columns, preview_row, self.reviews, height=8)
         
         # ========== FOOTER ==========
         footer_frame = ttk.Frame(main_frame)
@@ -286,7 +489,7 @@ class ScraperApp:
                                 font=('Segoe UI', 8), foreground='blue', cursor='hand2')
         github_link.pack()
         github_link.bind('<Button-1>', lambda e: self.open_github())
-        
+    
     def apply_theme(self):
         """Apply custom styling"""
         style = ttk.Style()
@@ -308,7 +511,7 @@ class ScraperApp:
         """Open GitHub profile in browser"""
         import webbrowser
         webbrowser.open('https://github.com/MuhRidhoBareng')
-        
+    
     def browse_folder(self):
         """Open folder browser dialog"""
         folder = filedialog.askdirectory(title="Select folder containing HTML files")
@@ -353,25 +556,66 @@ class ScraperApp:
         self.log(f"Found {len(files)} HTML files")
     
     def log(self, message: str):
-        """Add message to log"""
+        """Add message to log (safe from any thread)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self.ui_events.put(('log', f"[{timestamp}] {message}\n"))
     
     def clear_log(self):
         """Clear log text"""
         self.log_text.delete(1.0, tk.END)
-        
+    
     def update_status(self, text: str):
-        """Update status label"""
-        self.status_label.config(text=text)
-        self.root.update_idletasks()
+        """Update status label (safe from any thread)"""
+        self.ui_events.put(('status', text))
     
     def update_progress(self, value: float):
-        """Update progress bar"""
-        self.progress_var.set(value)
-        self.root.update_idletasks()
+        """Update progress bar (safe from any thread)"""
+        self.ui_events.put(('progress', value))
+    
+    def process_ui_events(self):
+        """
+        Apply queued UI events in one batch (runs on the Tk main loop)
+        
+        Log lines are inserted with a single call, only the latest status and
+        progress are shown, and the results table only redraws its visible
+        rows, so the cost per tick does not grow with the number of reviews.
+        """
+        lines = []
+        status = progress = None
+        finished = False
+        reports = []
+        try:
+            while True:
+                kind, value = self.ui_events.get_nowait()
+                if kind == 'log':
+                    lines.append(value)
+                elif kind == 'status':
+                    status = value
+                elif kind == 'progress':
+                    progress = value
+                elif kind == 'finished':
+                    finished = True
+                elif kind == 'report':
+                    reports.append(value)
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log_text.insert(tk.END, ''.join(lines))
+            self.log_text.see(tk.END)
+        self.table.refresh()
+        if status is not None:
+            self.status_label.config(text=status)
+        if progress is not None:
+            self.progress_var.set(progress)
+        if finished:
+            self.start_btn.config(state=tk.NORMAL)
+            self.stop_btn.config(state=tk.DISABLED)
+        
+        # Popups block, so schedule the next tick first
+        self.root.after(self.UI_POLL_MS, self.process_ui_events)
+        for report in reports:
+            self.show_report(report)
     
     def start_scraping(self):
         """Start the scraping process in a thread"""
@@ -386,26 +630,65 @@ class ScraperApp:
             return
         
         self.is_running = True
+        self.cancel_event = threading.Event()
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
         self.reviews = []
-        
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.quality = QualityStats()
+        self.show_source(self.reviews)
         
         # Start in thread
         thread = threading.Thread(target=self.scrape_worker, daemon=True)
         thread.start()
     
+    def show_source(self, source):
+        """Show a data source in the results table (closes a previous CSV)"""
+        if isinstance(self.table.source, CSVSource):
+            self.table.source.close()
+        self.table.set_source(source)
+    
+    def open_results(self):
+        """Browse a CSV written earlier; rows are read from disk as they are shown"""
+        if self.is_running:
+            messagebox.showwarning("Warning", "Stop scraping before opening another file")
+            return
+        
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            initialfile=self.output_file.get()
+        )
+        if not filename:
+            return
+        
+        try:
+            self.show_source(CSVSource(filename))
+        except OSError as e:
+            messagebox.showerror("Error", f"Cannot open file: {str(e)}")
+            return
+        self.log(f"Showing {len(self.table.source)} rows from {filename}")
+    
     def stop_scraping(self):
-        """Stop the scraping process"""
+        """Stop the scraping process (parses in progress are terminated)"""
         self.is_running = False
+        self.cancel_event.set()
         self.log("Stopping...")
         self.update_status("Stopped")
     
+    def rebuild_cache(self):
+        """Clear the parse cache so every file is parsed again"""
+        if self.is_running:
+            messagebox.showwarning("Warning", "Stop scraping before rebuilding the cache")
+            return
+        
+        cache = ParseCache(DEFAULT_CACHE_PATH)
+        cache.clear()
+        cache.close()
+        self.log("Parse cache cleared")
+    
     def scrape_worker(self):
         """Worker thread for scraping"""
+        cache = None
+        index = None
         try:
             folder = self.folder_path.get()
             preset = self.preset_var.get()
@@ -433,211 +716,135 @@ class ScraperApp:
                 self.update_status("No files")
                 return
             
-            self.log(f"Processing {len(files)} files...")
+            try:
+                jobs = max(1, int(self.jobs_var.get()))
+            except ValueError:
+                jobs = 1
+            
+            self.log(f"Processing {len(files)} files with {jobs} worker(s)...")
             
             total_files = len(files)
-            for i, filepath in enumerate(files):
-                if not self.is_running:
-                    break
-                    
-                progress = ((i + 1) / total_files) * 100
-                self.update_progress(progress)
-                self.update_status(f"File {i+1}/{total_files}")
-                
-                filename = os.path.basename(filepath)
-                self.log(f"Parsing: {filename[:50]}...")
-                
-                reviews = self.parse_file(filepath, config)
-                
-                for r in reviews:
-                    if not self.is_running:
-                        break
-                    self.reviews.append(r)
-                    self.add_to_tree(r)
-                
-                self.log(f"  Found {len(reviews)} reviews")
+            plan = compile_plan(config)
+            parse_func = functools.partial(parse_file, config=plan, 
+                                           strain=self.strain_var.get(),
+                                           backend=self.backend_var.get())
+            
+            # SQLite connections belong to the thread that opened them
+            if self.cache_var.get():
+                cache = ParseCache(DEFAULT_CACHE_PATH)
+            version = cache_version(plan, self.backend_var.get())
             
-            # Apply year filter
+            year_range = None
             if self.year_filter_enabled.get():
                 try:
-                    start = int(self.year_start.get())
-                    end = int(self.year_end.get())
-                    self.reviews = self.filter_by_year(self.reviews, start, end)
-                    self.log(f"After year filter ({start}-{end}): {len(self.reviews)} reviews")
+                    year_range = (int(self.year_start.get()), int(self.year_end.get()))
                 except ValueError:
                     pass
             
-            # Deduplicate
-            self.reviews = self.deduplicate(self.reviews)
+            # With "Write while scraping" rows are also written to the output
+            # (CSV, or typed Parquet/Arrow by extension) as each file is parsed;
+            # otherwise nothing is written until Export
+            write_output = self.write_var.get()
+            output_path = self.output_file.get() or 'scraped_reviews.csv'
+            if not os.path.isabs(output_path):
+                output_path = os.path.join(os.path.dirname(files[0]), output_path)
+            if write_output:
+                self.log(f"Writing to {output_path}")
             
-            self.log(f"\n{'='*40}")
-            self.log(f"COMPLETE! Total: {len(self.reviews)} unique reviews")
-            self.update_status(f"Done: {len(self.reviews)}")
+            # Persistent index: only reviews not collected before are appended.
+            # Reviews are recorded when they are written, so it needs the output
+            if self.index_var.get():
+                if write_output:
+                    index = DedupIndex(DEFAULT_INDEX_PATH, scope=preset)
+                    seeded = index.seed_from_csv(output_path)
+                    if seeded:
+                        self.log(f"Index: {seeded} review(s) from {output_path} added")
+                else:
+                    self.log("Skip reviews from earlier runs needs 'Write while scraping'; not used")
+            seen = index if index is not None else set()
+            near = NearDuplicateIndex() if self.near_dup_var.get() else None
+            near_dropped = 0
+            quality = self.quality
+            cancel = self.cancel_event
+            
+            # Files are parsed in worker processes (also with 1 worker) so
+            # Stop can terminate a parse in progress; after Stop the loop
+            # only receives files that had already been parsed
+            results = iter_cached_files(parse_func, files, cache, version, jobs, cancel)
+            output = (open_writer(output_path, plan.columns, append=index is not None)
+                      if write_output else contextlib.nullcontext())
+            with output as writer:
+                for i, (filepath, reviews) in enumerate(results):
+                    progress = ((i + 1) / total_files) * 100
+                    self.update_progress(progress)
+                    self.update_status(f"File {i+1}/{total_files} | Quality {quality.score}/100")
+                    
+                    filename = os.path.basename(filepath)
+                    self.log(f"Parsed: {filename[:50]}")
+                    
+                    kept = reviews
+                    if year_range:
+                        kept = filter_years(kept, *year_range)
+                    added = 0
+                    for r in dedup_reviews(kept, seen):
+                        if near is not None and near.add(r.get('review_text', ''), 
+                                                         normalize_text(r.get('username', ''))) is not None:
+                            near_dropped += 1
+                            continue
+                        self.reviews.append(r)
+                        quality.add(r)
+                        if writer is not None:
+                            writer.write(r)
+                        added += 1
+                    
+                    self.log(f"  Found {len(reviews)} reviews, {added} new")
+            
+            if cache:
+                self.log(f"Cache: {cache.hits} file(s) from cache, {cache.misses} parsed")
+            if year_range:
+                self.log(f"Year filter: {year_range[0]}-{year_range[1]}")
+            if near is not None:
+                self.log(f"Near-duplicates dropped: {near_dropped}")
+            if index:
+                self.log(f"Index: {index.added} new review(s), {index.count()} known for {preset}")
+            if writer is not None and writer.count:
+                self.log(f"Saved {writer.count} reviews -> {output_path}")
             
+            self.log(f"\n{'='*40}")
+            if cancel.is_set():
+                self.log(f"STOPPED! Kept: {len(self.reviews)} unique reviews from files parsed before Stop")
+                self.update_status(f"Stopped: {len(self.reviews)}")
+            else:
+                self.log(f"COMPLETE! Total: {len(self.reviews)} unique reviews")
+                self.update_status(f"Done: {len(self.reviews)}")
+            self.log(f"Quality: {quality.summary()}")
+        
         except Exception as e:
             self.log(f"ERROR: {str(e)}")
             self.update_status("Error")
         finally:
+            if cache:
+                cache.close()
+            if index:
+                index.close()
             self.is_running = False
-            self.root.after(0, lambda: self.start_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.stop_btn.config(state=tk.DISABLED))
+            self.ui_events.put(('finished', None))
     
-    def parse_file(self, filepath: str, config: dict) -> list:
-        """Parse single HTML file"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            with open(filepath, 'r', encoding='latin-1') as f:
-                content = f.read()
-        
-        soup = BeautifulSoup(content, 'lxml')
-        reviews = []
-        
-        # Find review elements
-        search_kwargs = {'name': config['review_tag']}
-        if config['review_class']:
-            search_kwargs['class_'] = re.compile(config['review_class'])
-        if config['review_lang']:
-            search_kwargs['lang'] = config['review_lang']
-        
-        elements = soup.find_all(**search_kwargs)
-        
-        for elem in elements:
-            review = self.extract_review(elem, config)
-            if review and review.get('username'):
-                reviews.append(review)
-        
-        return reviews
-    
-    def extract_review(self, elem, config: dict) -> dict:
-        """Extract review data from element"""
-        review = {
-            'username': '',
-            'from': '',
-            'written_date': '',
-            'rating': '',
-            'title': '',
-            'review_text': '',
-            'tema_pengalaman': '',
-            'daya_tarik_wisata': '',
-            'status': '',
-            'contribution': ''
-        }
-        
-        # Get review text
-        text = elem.get_text(strip=True)
-        if len(text) < 50:
-            return None
-        review['review_text'] = text
-        
-        # Find container
-        container = elem
-        for _ in range(config['container_levels']):
-            parent = container.parent
-            if parent is None:
-                break
-            if parent.name == config['container_tag']:
-                container = parent
-                break
-            container = parent
-        
-        container_text = container.get_text(' ', strip=True)
-        
-        # Extract username
-        if config['username_pattern']:
-            links = container.find_all(config['username_tag'], 
-                                       attrs={config['username_attr']: re.compile(config['username_pattern'])})
-            for link in links:
-                name = link.get_text(strip=True)
-                if name and len(name) >= 2 and re.match(r'^[A-Za-z]', name):
-                    review['username'] = name
-                    break
-        
-        if not review['username']:
-            return None
-        
-        # Extract location
-        if config['location_pattern']:
-            match = re.search(config['location_pattern'], container_text)
-            if match:
-                review['from'] = match.group(1) if match.lastindex else match.group()
-        
-        # Extract date
-        if config['date_pattern']:
-            match = re.search(config['date_pattern'], container_text)
-            if match:
-                review['written_date'] = match.group()
-        
-        # Extract rating
-        if config['rating_pattern']:
-            rating_elem = container.find(attrs={'aria-label': re.compile(config['rating_pattern'], re.I)})
-            if rating_elem:
-                match = re.search(r'(\d+)', rating_elem.get('aria-label', ''))
-                if match:
-                    review['rating'] = match.group(1)
-        
-        # Extract helpful
-        if config['helpful_pattern']:
-            match = re.search(config['helpful_pattern'], container_text)
-            if match:
-                review['daya_tarik_wisata'] = match.group(1)
-        
-        # Extract contribution
-        if config['contribution_pattern']:
-            match = re.search(config['contribution_pattern'], container_text)
-            if match:
-                if match.lastindex and match.lastindex >= 2:
-                    review['contribution'] = f"{match.group(1)} reviews, {match.group(2)} photos"
-                else:
-                    review['contribution'] = match.group(1)
-        
-        # Extract elite/status
-        if config['elite_pattern'] and config['elite_tag']:
-            elite_elem = container.find(config['elite_tag'], 
-                                        attrs={config['elite_attr']: config['elite_pattern']})
-            if elite_elem:
-                review['status'] = elite_elem.get_text(strip=True)
-                review['tema_pengalaman'] = review['status']
-        
-        return review
-    
-    def filter_by_year(self, reviews: list, start: int, end: int) -> list:
-        """Filter reviews by year range"""
-        filtered = []
-        for r in reviews:
-            date_str = r.get('written_date', '')
-            match = re.search(r'(\d{4})', date_str)
-            if match:
-                year = int(match.group(1))
-                if start <= year <= end:
-                    filtered.append(r)
-        return filtered
+    def parse_file(self, filepath: str, plan: ExtractionPlan) -> list:
+        """Parse single HTML file with a compiled plan"""
+        return parse_file(filepath, plan, strain=self.strain_var.get(), 
+                          backend=self.backend_var.get())
+    
+    def extract_review(self, elem, plan: ExtractionPlan) -> dict:
+        """Extract review data from element with a compiled plan"""
+        return extract_review(elem, plan)
     
     def deduplicate(self, reviews: list) -> list:
         """Remove duplicate reviews"""
-        seen = set()
-        unique = []
-        for r in reviews:
-            key = (r.get('username', ''), r.get('review_text', '')[:100])
-            if key not in seen and r.get('username'):
-                seen.add(key)
-                unique.append(r)
-        return unique
-    
-    def add_to_tree(self, review: dict):
-        """Add review to treeview"""
-        text_preview = review.get('review_text', '')[:50] + '...'
-        self.tree.insert('', tk.END, values=(
-            review.get('username', ''),
-            review.get('from', ''),
-            review.get('written_date', ''),
-            review.get('rating', ''),
-            text_preview
-        ))
+        return list(dedup_reviews(reviews))
     
     def export_csv(self):
-        """Export reviews to CSV"""
+        """Export reviews to CSV, or typed Parquet/Arrow by the chosen extension"""
         if not self.reviews:
             messagebox.showwarning("Warning", "No reviews to export!")
             return
@@ -645,7 +852,8 @@ class ScraperApp:
         # Ask for save location
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("CSV files", "*.csv"), ("Parquet files", "*.parquet"),
+                       ("Arrow files", "*.arrow"), ("All files", "*.*")],
             initialfile=self.output_file.get()
         )
         
@@ -655,7 +863,13 @@ class ScraperApp:
         try:
             columns = ['username', 'from', 'written_date', 'rating', 'title',
                       'review_text', 'tema_pengalaman', 'daya_tarik_wisata',
-                      'status', 'contribution']
+                      'status', 'contribution', 'review_id']
+            
+            if export_format(filename) != 'csv':
+                write_reviews(self.reviews, filename, columns)
+                self.log(f"Exported {len(self.reviews)} reviews to {filename}")
+                messagebox.showinfo("Success", f"Exported {len(self.reviews)} reviews!")
+                return
             
             with open(filename, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=columns)
@@ -668,181 +882,47 @@ class ScraperApp:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
     
     def validate_data(self):
-        """Validate scraped data and show report"""
+        """Validate scraped data in the background and show the report"""
         if not self.reviews:
             messagebox.showwarning("Warning", "No data to validate! Run scraping first.")
             return
         
-        self.log("\n" + "=" * 50)
-        self.log("DATA VALIDATION REPORT")
-        self.log("=" * 50)
-        
-        total = len(self.reviews)
-        self.log(f"\nTotal Reviews: {total}")
-        
-        # Track issues
-        issues = []
-        warnings = []
-        
-        # 1. Check for empty fields
-        empty_counts = {
-            'username': 0,
-            'from': 0,
-            'written_date': 0,
-            'rating': 0,
-            'review_text': 0
-        }
-        
-        for r in self.reviews:
-            for field in empty_counts:
-                if not r.get(field, '').strip():
-                    empty_counts[field] += 1
-        
-        self.log("\n--- Empty Fields Check ---")
-        for field, count in empty_counts.items():
-            pct = (count / total) * 100
-            status = "✓" if count == 0 else "⚠" if pct < 20 else "✗"
-            self.log(f"  {status} {field}: {count} empty ({pct:.1f}%)")
-            if count > 0 and field in ['username', 'review_text']:
-                issues.append(f"{field} has {count} empty values")
-            elif count > 0:
-                warnings.append(f"{field} has {count} empty values")
-        
-        # 2. Check rating validity
-        self.log("\n--- Rating Validation ---")
-        valid_ratings = 0
-        invalid_ratings = 0
-        rating_dist = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        
-        for r in self.reviews:
-            rating = r.get('rating', '')
-            if rating:
-                try:
-                    rating_int = int(rating)
-                    if 1 <= rating_int <= 5:
-                        valid_ratings += 1
-                        rating_dist[rating_int] += 1
-                    else:
-                        invalid_ratings += 1
-                except ValueError:
-                    invalid_ratings += 1
-        
-        self.log(f"  ✓ Valid ratings (1-5): {valid_ratings}")
-        if invalid_ratings > 0:
-            self.log(f"  ✗ Invalid ratings: {invalid_ratings}")
-            issues.append(f"{invalid_ratings} invalid ratings")
-        
-        self.log("  Rating distribution:")
-        for star, count in rating_dist.items():
-            bar = "█" * int(count / max(1, total) * 20)
-            self.log(f"    {star}★: {count} {bar}")
-        
-        # 3. Check date validity
-        self.log("\n--- Date Validation ---")
-        valid_dates = 0
-        invalid_dates = 0
-        year_dist = {}
-        
-        date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+(\d{4})'
-        
-        for r in self.reviews:
-            date_str = r.get('written_date', '')
-            if date_str:
-                match = re.search(date_pattern, date_str)
-                if match:
-                    valid_dates += 1
-                    year = match.group(2)
-                    year_dist[year] = year_dist.get(year, 0) + 1
-                else:
-                    invalid_dates += 1
-        
-        self.log(f"  ✓ Valid dates: {valid_dates}")
-        if invalid_dates > 0:
-            self.log(f"  ⚠ Invalid/missing dates: {invalid_dates}")
-            warnings.append(f"{invalid_dates} invalid dates")
-        
-        self.log("  Year distribution:")
-        for year in sorted(year_dist.keys()):
-            count = year_dist[year]
-            bar = "█" * int(count / max(1, total) * 20)
-            self.log(f"    {year}: {count} {bar}")
-        
-        # 4. Check review text length
-        self.log("\n--- Review Text Analysis ---")
-        text_lengths = [len(r.get('review_text', '')) for r in self.reviews]
-        if text_lengths:
-            avg_len = sum(text_lengths) / len(text_lengths)
-            min_len = min(text_lengths)
-            max_len = max(text_lengths)
-            short_reviews = sum(1 for l in text_lengths if l < 50)
-            
-            self.log(f"  Average length: {avg_len:.0f} chars")
-            self.log(f"  Min length: {min_len} chars")
-            self.log(f"  Max length: {max_len} chars")
-            if short_reviews > 0:
-                self.log(f"  ⚠ Short reviews (<50 chars): {short_reviews}")
-                warnings.append(f"{short_reviews} very short reviews")
-        
-        # 5. Check for duplicates
-        self.log("\n--- Duplicate Check ---")
-        seen_reviews = set()
-        duplicates = 0
-        for r in self.reviews:
-            key = (r.get('username', ''), r.get('review_text', '')[:100])
-            if key in seen_reviews:
-                duplicates += 1
-            seen_reviews.add(key)
-        
-        if duplicates == 0:
-            self.log(f"  ✓ No duplicates found")
-        else:
-            self.log(f"  ⚠ Potential duplicates: {duplicates}")
-            warnings.append(f"{duplicates} potential duplicates")
-        
-        # Summary
-        self.log("\n" + "=" * 50)
-        self.log("VALIDATION SUMMARY")
-        self.log("=" * 50)
-        
-        if not issues and not warnings:
-            self.log("✓ All checks passed! Data looks valid.")
-            score = 100
-        else:
-            if issues:
-                self.log(f"\n✗ Issues ({len(issues)}):")
-                for issue in issues:
-                    self.log(f"   - {issue}")
-            if warnings:
-                self.log(f"\n⚠ Warnings ({len(warnings)}):")
-                for warning in warnings:
-                    self.log(f"   - {warning}")
-            
-            # Calculate score
-            score = max(0, 100 - (len(issues) * 20) - (len(warnings) * 5))
-        
-        self.log(f"\nData Quality Score: {score}/100")
-        
-        if score >= 80:
-            self.log("→ Data quality: GOOD")
-        elif score >= 50:
-            self.log("→ Data quality: ACCEPTABLE")
-        else:
-            self.log("→ Data quality: NEEDS REVIEW")
-        
-        self.log("=" * 50)
-        
-        # Show summary popup
+        self.log("Validating...")
+        reviews = list(self.reviews)
+        # The counts were kept while scraping; only near-duplicates need a scan
+        report = self.quality.report() if self.quality.total == len(reviews) else None
+        thread = threading.Thread(target=self.validate_worker, args=(reviews, report), daemon=True)
+        thread.start()
+    
+    def validate_worker(self, reviews: list, report=None):
+        """Worker thread: columnar validation (or the running counts), then render the report"""
+        try:
+            if report is None:
+                report = validate_reviews(reviews, near_duplicates=True)
+            else:
+                report.near_duplicates = near_duplicate_groups(reviews)
+                report.assess()
+        except Exception as e:
+            self.log(f"ERROR: Validation failed: {str(e)}")
+            return
+        for line in report.lines():
+            self.log(line)
+        self.ui_events.put(('report', report))
+    
+    def show_report(self, report):
+        """Show validation summary popup"""
         messagebox.showinfo(
             "Validation Complete",
-            f"Data Quality Score: {score}/100\n\n"
-            f"Total Reviews: {total}\n"
-            f"Issues: {len(issues)}\n"
-            f"Warnings: {len(warnings)}\n\n"
+            f"Data Quality Score: {report.score}/100\n\n"
+            f"Total Reviews: {report.total}\n"
+            f"Issues: {len(report.issues)}\n"
+            f"Warnings: {len(report.warnings)}\n\n"
             f"See log for details."
         )
 
 
 def main():
+    multiprocessing.freeze_support()  # Needed for worker processes in the packaged exe
     root = tk.Tk()
     app = ScraperApp(root)
     root.mainloop()
@@ -0,0 +1,94 @@
+"""
+Streaming Parser
+Ekstraksi review dengan memori konstan untuk halaman HTML yang sangat besar
+
+File dibaca bertahap dengan lxml iterparse (tanpa membaca seluruh file ke
+string dan tanpa membangun seluruh DOM). Setiap kali container review paling
+luar (mis. <li> untuk Yelp) selesai di-parse, review di dalamnya diekstrak
+dengan LxmlExtractor lalu subtree tersebut dibuang. Peak memory dibatasi oleh
+satu container review, bukan oleh ukuran file.
+
+Catatan: elemen review yang tidak berada di dalam container_tag dilewati.
+Untuk preset yang container_tag-nya dipakai untuk layout halaman (mis. 'div'),
+container paling luar bisa mencakup hampir seluruh halaman.
+"""
+
+import codecs
+
+from extraction_plan import compile_plan
+from lxml_backend import LxmlExtractor
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def detect_encoding(filepath: str) -> str:
+    """Return 'utf-8' if the file decodes as UTF-8, else 'latin-1' (streamed check)"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        with open(filepath, 'rb') as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    decoder.decode(b'', final=True)
+                    return 'utf-8'
+                decoder.decode(chunk)
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def _release(el):
+    """Drop a finished element and everything before it from the tree"""
+    el.clear(keep_tail=True)
+    parent = el.getparent()
+    if parent is not None:
+        while el.getprevious() is not None:
+            del parent[0]
+
+
+def iter_reviews(filepath: str, config):
+    """
+    Yield reviews from a saved page one container at a time
+    
+    Args:
+        filepath: Path to HTML file
+        config: ExtractionPlan or preset/config dict
+    """
+    plan = compile_plan(config)
+    extractor = LxmlExtractor(plan)
+    container_tag = plan.container_tag
+    
+    from lxml import etree
+    context = etree.iterparse(
+        filepath, events=('start', 'end'), html=True,
+        encoding=detect_encoding(filepath), huge_tree=True
+    )
+    
+    open_containers = 0
+    for event, el in context:
+        if event == 'start':
+            if el.tag == container_tag:
+                open_containers += 1
+            continue
+        
+        if el.tag == container_tag:
+            open_containers -= 1
+            if open_containers == 0:
+                # Outermost container is complete: extract in document order
+                candidates = extractor.find_review_elements(el)
+                if extractor.review_sel.matches(el):
+                    candidates.insert(0, el)
+                for elem in candidates:
+                    review = extractor.extract_review(elem)
+                    if review and review.get('username'):
+                        yield review
+        
+        if open_containers == 0:
+            _release(el)
+    
+    del context
+
+
+def parse_file(filepath: str, config) -> list:
+    """Parse single HTML file with the streaming extractor"""
+    return list(iter_reviews(filepath, config))
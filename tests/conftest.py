@@ -0,0 +1,21 @@
+"""
+Shared fixtures; the modules are flat files in the repo root
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import write_corpus
+
+
+@pytest.fixture
+def yelp_pages(tmp_path):
+    """Directory with three synthetic Yelp pages (see benchmarks/corpus.py)"""
+    write_corpus(str(tmp_path), 'yelp', pages=3, reviews=20)
+    return tmp_path
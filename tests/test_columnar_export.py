@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+import pyarrow.parquet as pq
+
+from columnar_export import ArrowStreamWriter, open_writer, read_id_rows, split_contribution, parse_date
+from review_stream import CSVStreamWriter
+
+COLUMNS = ['username', 'written_date', 'rating', 'review_text', 'daya_tarik_wisata', 'contribution']
+
+
+def make_rows(start, count):
+    return [{'username': f'user{i}', 'written_date': f'Apr {i % 28 + 1}, 2024', 'rating': str(i % 5 + 1),
+             'review_text': f'text {i}', 'daya_tarik_wisata': str(i), 'contribution': f'{i} reviews, 2 photos',
+             'review_id': f'{i:016x}'} for i in range(start, start + count)]
+
+
+def read(path):
+    if path.endswith('.parquet'):
+        return pq.read_table(path)
+    with pa.OSFile(path, 'rb') as f:
+        return pa.ipc.open_file(f).read_all()
+
+
+@pytest.mark.parametrize('ext', ['parquet', 'arrow'])
+def test_round_trip_typed(tmp_path, ext):
+    path = str(tmp_path / f'out.{ext}')
+    with ArrowStreamWriter(path, COLUMNS, row_group_size=4) as writer:
+        for row in make_rows(0, 10) + [{'username': 'bad', 'rating': 'x', 'written_date': 'yesterday'}]:
+            writer.write(row)
+    
+    table = read(path)
+    assert writer.count == 11
+    assert table.schema.field('rating').type == pa.int8()
+    assert table.schema.field('written_date').type == pa.date32()
+    assert 'contribution' not in table.schema.names
+    rows = table.to_pylist()
+    assert rows[3]['rating'] == 4
+    assert rows[3]['written_date'] == datetime.date(2024, 4, 4)
+    assert rows[3]['contribution_reviews'] == 3 and rows[3]['contribution_photos'] == 2
+    assert rows[-1]['rating'] is None and rows[-1]['written_date'] is None
+    if ext == 'parquet':
+        assert pq.ParquetFile(path).num_row_groups == 3
+    assert not (tmp_path / f'out.{ext}.part').exists()
+
+
+@pytest.mark.parametrize('ext', ['parquet', 'arrow'])
+def test_append_keeps_existing_rows(tmp_path, ext):
+    path = str(tmp_path / f'out.{ext}')
+    with open_writer(path, COLUMNS) as writer:
+        for row in make_rows(0, 5):
+            writer.write(row)
+    with open_writer(path, COLUMNS, append=True, row_group_size=2) as writer:
+        for row in make_rows(5, 3):
+            writer.write(row)
+    
+    assert read(path)['username'].to_pylist() == [f'user{i}' for i in range(8)]
+    assert [r['review_id'] for r in read_id_rows(path)] == [f'{i:016x}' for i in range(8)]
+
+
+def test_append_without_new_rows_keeps_file(tmp_path):
+    path = str(tmp_path / 'out.parquet')
+    with open_writer(path, COLUMNS) as writer:
+        for row in make_rows(0, 3):
+            writer.write(row)
+    with open_writer(path, COLUMNS, append=True):
+        pass
+    assert read(path).num_rows == 3
+    assert not (tmp_path / 'out.parquet.part').exists()
+
+
+def test_append_other_columns_fails(tmp_path):
+    path = str(tmp_path / 'out.parquet')
+    with open_writer(path, COLUMNS) as writer:
+        writer.write(make_rows(0, 1)[0])
+    with pytest.raises(ValueError):
+        open_writer(path, ['username'], append=True)
+    assert not (tmp_path / 'out.parquet.part').exists()
+
+
+def test_open_writer_csv_by_extension(tmp_path):
+    writer = open_writer(str(tmp_path / 'out.csv'), COLUMNS)
+    assert isinstance(writer, CSVStreamWriter)
+    writer.close()
+
+
+def test_parsers():
+    assert split_contribution('12 reviews, 3 photos') == (12, 3)
+    assert split_contribution('7') == (7, None)
+    assert split_contribution('') == (None, None)
+    assert parse_date('12/31/2023') == datetime.date(2023, 12, 31)
+    assert parse_date('Feb 30, 2024') is None
+
+
+def test_read_id_rows_without_review_id(tmp_path):
+    path = str(tmp_path / 'out.arrow')
+    with open_writer(path, ['username', 'review_text']) as writer:
+        writer.write({'username': 'a', 'review_text': 'hello'})
+    # Files written before review_id existed give username + review_text
+    table = read(path).drop_columns(['review_id'])
+    with pa.OSFile(path, 'wb') as f, pa.ipc.new_file(f, table.schema) as out:
+        out.write_table(table)
+    assert list(read_id_rows(path)) == [{'username': 'a', 'review_text': 'hello'}]
@@ -0,0 +1,24 @@
+import pickle
+
+from custom_scraper import UniversalScraper
+from scraper_config import YELP_CONFIG
+
+
+def test_scraper_pickles_without_quality_stats():
+    scraper = UniversalScraper(YELP_CONFIG)
+    scraper.quality.add({'username': 'a', 'review_text': 'b'})
+    clone = pickle.loads(pickle.dumps(scraper))
+    assert 'quality' not in clone.__dict__
+    assert scraper.quality.total == 1
+
+
+def test_parallel_run_matches_serial(yelp_pages):
+    serial = UniversalScraper(YELP_CONFIG, jobs=1)
+    serial_count = serial.run(str(yelp_pages))
+    output = yelp_pages / YELP_CONFIG['output_file']
+    serial_rows = output.read_text(encoding='utf-8')
+    
+    parallel = UniversalScraper(YELP_CONFIG, jobs=2)
+    assert parallel.run(str(yelp_pages)) == serial_count > 0
+    assert output.read_text(encoding='utf-8') == serial_rows
+    assert parallel.quality.total == serial_count
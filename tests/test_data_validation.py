@@ -0,0 +1,74 @@
+import csv
+
+import pytest
+
+from data_validation import QualityStats, validate_reviews, validate_csv
+
+REVIEWS = [
+    {'username': 'a', 'from': 'Indio, CA', 'written_date': 'Apr 23, 2025', 'rating': '5',
+     'review_text': 'Great music and a friendly crowd, would go again next year for sure.'},
+    {'username': 'a', 'from': 'Indio, CA', 'written_date': 'Apr 23, 2025', 'rating': '5',
+     'review_text': 'Great music and a friendly crowd, would go again next year for sure.'},
+    {'username': 'b', 'from': '', 'written_date': '4/2/2024', 'rating': '6', 'review_text': 'Too hot'},
+    {'username': 'c', 'from': None, 'written_date': '', 'rating': 'x', 'review_text': float('nan')},
+    {'username': '', 'written_date': 'Jan 1, 2019', 'rating': '', 'review_text': '   '},
+    {'username': 'd', 'from': 'Phoenix, AZ', 'written_date': 'posted Dec 9, 2021', 'rating': '3',
+     'review_text': 'x' * 120},
+    {'username': 'd', 'from': 'Phoenix, AZ', 'written_date': 'Dec 9, 2021', 'rating': '3',
+     'review_text': 'x' * 100 + 'different tail'},
+]
+
+
+def test_incremental_stats_match_validate_frame():
+    stats = QualityStats()
+    stats.update(REVIEWS)
+    incremental = stats.report().to_dict()
+    columnar = validate_reviews(REVIEWS).to_dict()
+    
+    assert incremental.pop('text_length') == pytest.approx(columnar.pop('text_length'))
+    assert incremental == columnar
+    assert columnar['duplicates'] == 2
+
+
+class SameHash(str):
+    def __hash__(self):
+        return 0
+
+
+def test_duplicates_are_exact_keys_not_hashes():
+    # Different usernames with colliding hashes are not duplicates
+    reviews = [{'username': SameHash(name), 'review_text': 'same text'} for name in 'ab']
+    stats = QualityStats()
+    stats.update(reviews)
+    assert stats.report().duplicates == validate_reviews(reviews).duplicates == 0
+
+
+ROWS = [
+    {'username': 'a', 'from': 'X, CA', 'written_date': 'Apr 1, 2024', 'rating': '5', 'review_text': 't' * 60},
+    {'username': 'a', 'from': 'X, CA', 'written_date': 'Apr 1, 2024', 'rating': '5', 'review_text': 't' * 60},
+    {'username': 'b', 'from': '', 'written_date': 'yesterday', 'rating': '9', 'review_text': 'short'},
+    {'username': '', 'from': 'Y, AZ', 'written_date': 'Jan 5, 2020', 'rating': '', 'review_text': 'u' * 80},
+]
+
+
+def test_validate_frame_counts():
+    report = validate_reviews(ROWS)
+    assert report.total == 4
+    assert report.empty == {'username': 1, 'from': 1, 'written_date': 0, 'rating': 1, 'review_text': 0}
+    assert (report.ratings_valid, report.ratings_invalid) == (2, 1)
+    assert report.rating_distribution == {1: 0, 2: 0, 3: 0, 4: 0, 5: 2}
+    assert (report.dates_valid, report.dates_invalid) == (3, 1)
+    assert report.year_distribution == {'2020': 1, '2024': 2}
+    assert report.text_length == {'avg': 51.25, 'min': 5, 'max': 80}
+    assert report.short_reviews == 1 and report.duplicates == 1
+    assert len(report.issues) == 2 and len(report.warnings) == 5
+    assert report.score == 35 and report.quality == 'NEEDS REVIEW'
+
+
+def test_validate_csv_matches_validate_reviews(tmp_path):
+    path = tmp_path / 'out.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(ROWS[0]))
+        writer.writeheader()
+        writer.writerows(ROWS)
+    assert validate_csv(str(path)).to_dict() == validate_reviews(ROWS).to_dict()
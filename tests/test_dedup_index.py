@@ -0,0 +1,78 @@
+import os
+import sys
+import csv
+import subprocess
+
+import pytest
+
+from benchmarks.corpus import write_corpus
+from dedup_index import DedupIndex
+from scraper_config import YELP_CONFIG
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# custom_scraper run with a dedup index; with kill_after the process dies
+# (os._exit, like kill -9) after that many rows were written and flushed to
+# the CSV, before the index commit
+RUN = r"""
+import os, sys
+sys.path.insert(0, sys.argv[1])
+import review_stream
+from custom_scraper import UniversalScraper
+from scraper_config import YELP_CONFIG
+
+directory, index_path, kill_after = sys.argv[2], sys.argv[3], int(sys.argv[4])
+if kill_after:
+    write = review_stream.CSVStreamWriter.write
+    
+    def write_then_die(self, row):
+        write(self, row)
+        if self.count == kill_after:
+            self.f.flush()
+            os._exit(9)
+    review_stream.CSVStreamWriter.write = write_then_die
+
+UniversalScraper(YELP_CONFIG, index_path=index_path).run(directory)
+"""
+
+
+def run(directory, index_path, kill_after=0):
+    proc = subprocess.run([sys.executable, '-c', RUN, ROOT, str(directory), str(index_path), str(kill_after)],
+                          cwd=ROOT, capture_output=True, text=True, timeout=300)
+    return proc.returncode
+
+
+def review_ids(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return [row['review_id'] for row in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize('kill_after', [1, 15])
+def test_crash_and_restart_writes_no_duplicates(tmp_path, kill_after):
+    pages, clean = tmp_path / 'pages', tmp_path / 'clean'
+    write_corpus(str(pages), 'yelp', pages=1, reviews=20)
+    write_corpus(str(clean), 'yelp', pages=3, reviews=20)
+    assert run(clean, tmp_path / 'clean.db') == 0
+    
+    # A complete run fills the index scope, then new pages arrive
+    assert run(pages, tmp_path / 'index.db') == 0
+    write_corpus(str(pages), 'yelp', pages=3, reviews=20)
+    assert run(pages, tmp_path / 'index.db', kill_after) == 9
+    assert run(pages, tmp_path / 'index.db') == 0
+    
+    output = YELP_CONFIG['output_file']
+    ids = review_ids(pages / output)
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(review_ids(clean / output))
+
+
+def test_seed_adds_only_missing_ids(tmp_path):
+    output = tmp_path / 'out.csv'
+    output.write_text('username,review_text,review_id\r\na,x,id1\r\nb,y,id2\r\n', encoding='utf-8')
+    index = DedupIndex(str(tmp_path / 'index.db'), scope='s')
+    index.add('id1')
+    index.commit()
+    assert index.seed_from_csv(str(output)) == 1
+    assert 'id2' in index and index.count() == 2
+    assert index.seed_from_csv(str(output)) == 0
+    index.close()
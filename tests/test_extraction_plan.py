@@ -0,0 +1,36 @@
+"""
+A compiled ExtractionPlan gives the rows of the legacy per-element extraction,
+and the GUI compiles it once per file instead of once per review
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+import scraper_gui
+from benchmarks.bench_extraction import make_yelp_page, legacy_extract_review
+from extraction_plan import compile_plan
+from scraper_gui import ScraperConfig, extract_review
+
+
+@pytest.mark.parametrize('preset', list(ScraperConfig.PRESETS))
+def test_plan_matches_legacy_extraction(preset):
+    config = ScraperConfig.PRESETS[preset]
+    plan = compile_plan(config)
+    elements = BeautifulSoup(make_yelp_page(30), 'lxml').find_all(**plan.review_search)
+    assert [extract_review(e, plan) for e in elements] == \
+        [legacy_extract_review(e, config) for e in elements]
+
+
+def test_parse_file_compiles_once(tmp_path, monkeypatch):
+    path = tmp_path / 'page.html'
+    path.write_text(make_yelp_page(25), encoding='utf-8')
+    calls = []
+    
+    def counting_compile(config):
+        calls.append(config)
+        return compile_plan(config)
+    
+    monkeypatch.setattr(scraper_gui, 'compile_plan', counting_compile)
+    reviews = scraper_gui.parse_file(str(path), ScraperConfig.PRESETS['Yelp'])
+    assert len(reviews) == 25
+    assert len(calls) == 1
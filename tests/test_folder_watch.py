@@ -0,0 +1,34 @@
+from folder_watch import IncrementalOutput
+from review_stream import dedup_filter_years
+
+COLUMNS = ['username', 'written_date', 'review_text']
+
+FILES = [
+    [{'username': 'a', 'written_date': 'Jan 2, 2017', 'review_text': 'same text'},
+     {'username': 'b', 'written_date': 'Mar 1, 2021', 'review_text': 'other'}],
+    [{'username': 'a', 'written_date': 'Jan 2, 2020', 'review_text': 'same text'},
+     {'username': 'b', 'written_date': 'Mar 1, 2021', 'review_text': 'other'},
+     {'username': 'c', 'written_date': 'Jun 5, 2022', 'review_text': 'third'}],
+]
+
+
+def copy(reviews):
+    return [dict(r) for r in reviews]
+
+
+def test_watch_matches_batch(tmp_path):
+    batch = list(dedup_filter_years((r for f in FILES for r in copy(f)), (2019, 2025)))
+    
+    output = IncrementalOutput(str(tmp_path / 'out.csv'), COLUMNS)
+    added = [output.add(copy(f), (2019, 2025)) for f in FILES]
+    assert added == [1, 1]
+    assert output.total == len(batch) == 2
+
+
+def test_watch_skips_written_rows_after_restart(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    IncrementalOutput(path, COLUMNS).add(copy(FILES[1]), (2019, 2025))
+    
+    output = IncrementalOutput(path, COLUMNS)
+    assert output.total == 3
+    assert output.add(copy(FILES[1]), (2019, 2025)) == 0
@@ -0,0 +1,154 @@
+"""
+Parity of the in-browser extraction script (js_extract.py) with
+YelpScraper.parse_reviews on saved pages
+
+Under node the script runs against a minimal DOM built from the lxml tree
+of the page (the script only uses childNodes, getElementsByTagName,
+getAttribute and parentElement). With a Chrome binary on PATH the same
+pages are also loaded in headless Chrome.
+"""
+
+import os
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from benchmarks.corpus import make_page
+from benchmarks.fake_site import PHOTO_LINK_RE
+from js_extract import YELP_EXTRACT_JS, FIELDS, compare_reviews, extract_reviews_js
+from yelp_scraper import YelpScraper
+
+EDGE_PAGES = {
+    'data-review-id': (
+        '<html><body><div id="x">\n'
+        '<div data-review-id="1"><a href="/user_details?userid=a"> Ann <b>B.</b> </a><span>San Diego, CA</span>\n'
+        '<div aria-label="4 star rating" role="img"></div><span>Mar 3, 2023</span>'
+        '<script>var s="Helpful 99";</script>\n'
+        '<p lang="en">Short text &amp; more <!-- c --> here</p><a href="/elite">Elite 24</a>'
+        '<div>Helpful 7</div></div>\n'
+        '<div data-review-id="2"><a href="/user_details?userid=b" aria-label="Bob Z."></a>'
+        '<span><b>Austin, TX</b></span>\n'
+        '<div role="img" aria-label="Five star"></div><span>12/01/2022</span>\n'
+        '<p><span>Thanks for reading, this is a long review text that goes on and on and on to exceed '
+        'one hundred characters easily yes</span></p>\n'
+        '<p>Loved it \U0001F600 — a long review text with emoji that goes on and on to exceed one '
+        'hundred characters easily, surely yes it does</p></div>\n'
+        '</div></body></html>'
+    ),
+    'profile-link-parent': (
+        '<html><body><section><div class="a"><a href="/user_details?userid=c">Cy</a>'
+        '<a href="/user_details?userid=c">Cy again</a>\n'
+        '<span class="user-location">Paris, FR</span><span aria-label="2 stars">x</span> Jan 5, 2020 '
+        '<span lang="en">Bonjour</span></div></section>\n'
+        '<ul><li>no review here</li></ul></body></html>'
+    ),
+}
+
+# Runs the script (file argv[2]) with a DOM built from the JSON tree on stdin
+DOM_SHIM = r"""
+const fs = require('fs');
+const data = JSON.parse(fs.readFileSync(0, 'utf8'));
+const script = fs.readFileSync(process.argv[2], 'utf8');
+
+function build(n, parent) {
+    let node;
+    if (n.t === 'text') {
+        node = {nodeType: 3, nodeValue: n.v, childNodes: []};
+    } else if (n.t === 'comment') {
+        node = {nodeType: 8, nodeValue: n.v, childNodes: []};
+    } else {
+        node = {nodeType: 1, tagName: n.tag.toUpperCase(), attrs: n.a, childNodes: []};
+        node.getAttribute = name => Object.prototype.hasOwnProperty.call(node.attrs, name) ? node.attrs[name] : null;
+        node.getElementsByTagName = name => {
+            const out = [];
+            (function walk(x) {
+                for (const c of x.childNodes) {
+                    if (c.nodeType !== 1) continue;
+                    if (name === '*' || c.tagName.toLowerCase() === name) out.push(c);
+                    walk(c);
+                }
+            })(node);
+            return out;
+        };
+        for (const c of n.c) node.childNodes.push(build(c, node));
+    }
+    node.parentElement = parent && parent.tagName !== '#DOCUMENT' ? parent : null;
+    return node;
+}
+
+const document = build({t: 'el', tag: '#document', a: {}, c: [data]}, null);
+process.stdout.write(JSON.stringify(new Function('document', script)(document)));
+"""
+
+
+def saved_pages():
+    pages = dict(EDGE_PAGES)
+    for seed in (1, 2):
+        # As served by benchmarks/fake_site.py (profile link without avatar)
+        pages[f'corpus-{seed}'] = PHOTO_LINK_RE.sub('', make_page('yelp', 40, seed=seed, noise=0.5))
+    return pages
+
+
+def dom_tree(element):
+    """lxml element as the JSON tree read by DOM_SHIM"""
+    import lxml.etree
+    
+    if isinstance(element, lxml.etree._Comment):
+        return {'t': 'comment', 'v': element.text or ''}
+    node = {'t': 'el', 'tag': element.tag, 'a': dict(element.attrib), 'c': []}
+    if element.text:
+        node['c'].append({'t': 'text', 'v': element.text})
+    for child in element:
+        if not isinstance(child, lxml.etree._ProcessingInstruction):
+            node['c'].append(dom_tree(child))
+        if child.tail:
+            node['c'].append({'t': 'text', 'v': child.tail})
+    return node
+
+
+def python_reviews(html):
+    reviews = YelpScraper().parse_reviews(html)
+    return [{field: str(r.get(field) or '') for field in FIELDS} for r in reviews]
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+@pytest.mark.parametrize('name', list(saved_pages()))
+def test_script_matches_parse_reviews_under_node(tmp_path, name):
+    import lxml.html
+    
+    html = saved_pages()[name]
+    shim, script = tmp_path / 'shim.js', tmp_path / 'script.js'
+    shim.write_text(DOM_SHIM, encoding='utf-8')
+    script.write_text(YELP_EXTRACT_JS, encoding='utf-8')
+    tree = dom_tree(lxml.html.document_fromstring(html))
+    proc = subprocess.run(['node', str(shim), str(script)], input=json.dumps(tree),
+                          capture_output=True, text=True, encoding='utf-8', timeout=60)
+    assert proc.returncode == 0, proc.stderr
+    
+    js = [{field: str(r.get(field) or '') for field in FIELDS} for r in json.loads(proc.stdout)]
+    py = python_reviews(html)
+    assert py
+    assert compare_reviews(js, py) == []
+
+
+CHROME = next(filter(None, map(shutil.which, ('google-chrome', 'chromium', 'chromium-browser', 'chrome'))), None)
+
+
+@pytest.mark.skipif(CHROME is None, reason='Chrome is not installed')
+def test_script_matches_parse_reviews_in_chrome(tmp_path):
+    from selenium import webdriver
+    from resource_blocking import BlockProfile
+    
+    options = YelpScraper(block=BlockProfile(())).chrome_options()
+    options.binary_location = CHROME
+    driver = webdriver.Chrome(options=options)
+    try:
+        for name, html in saved_pages().items():
+            path = tmp_path / f'{name}.html'
+            path.write_text(html, encoding='utf-8')
+            driver.get('file://' + os.path.abspath(path))
+            assert compare_reviews(extract_reviews_js(driver), python_reviews(html)) == [], name
+    finally:
+        driver.quit()
@@ -0,0 +1,39 @@
+import pytest
+
+from benchmarks.bench_parsers import make_parse_func
+from benchmarks.corpus import write_corpus, SITES
+
+TARGETS = ('html_parser', 'custom_scraper', 'scraper_gui')
+
+CASES = [(target, site) for target in TARGETS for site in SITES
+         if make_parse_func(target, site, 'bs4') is not None]
+
+# Text hidden from get_text(), entities, comments and non-ASCII text
+EDGE_REVIEW = (
+    '<li class="review__09f24"><div><a href="/user_details?userid=x">Zoë &amp; Co</a>'
+    '<span>Indio, CA</span><div aria-label="2 star rating" role="img"></div><span>Feb 2, 2023</span>'
+    '<p><span lang="en" class="raw__09f24__T4Ezm">Café <!-- hidden --> line<script>var x = "no";</script><style>p{}</style> '
+    'and more text that is long enough to be the review body of this container, really.</span></p>'
+    '<div>Helpful 4</div></div></li>'
+)
+
+
+@pytest.mark.parametrize('target,site', CASES)
+def test_lxml_matches_bs4(tmp_path, target, site):
+    files = write_corpus(str(tmp_path), site, pages=2, reviews=30, noise=0.5)
+    bs4, lxml = make_parse_func(target, site, 'bs4'), make_parse_func(target, site, 'lxml')
+    for path in files:
+        reviews = bs4(path)
+        assert reviews
+        assert lxml(path) == reviews
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'latin-1'])
+def test_lxml_matches_bs4_on_edge_cases(tmp_path, encoding):
+    path = tmp_path / 'COACHELLA - Yelp 1.html'
+    html = f'<html><body><ul>{EDGE_REVIEW}</ul></body></html>'
+    path.write_bytes(html.replace('Zoë', 'Zoe' if encoding == 'latin-1' else 'Zoë').encode(encoding))
+    bs4, lxml = make_parse_func('html_parser', 'yelp', 'bs4'), make_parse_func('html_parser', 'yelp', 'lxml')
+    reviews = bs4(str(path))
+    assert len(reviews) == 1 and 'Café' in reviews[0]['review_text']
+    assert lxml(str(path)) == reviews
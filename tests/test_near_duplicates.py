@@ -0,0 +1,57 @@
+import random
+
+from near_duplicates import NearDuplicateIndex, drop_near_duplicates, find_near_duplicates, shingles
+
+VOCABULARY = [f'word{i}' for i in range(2000)]
+
+
+def make_texts(count, words=60, seed=7):
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(VOCABULARY) for _ in range(words)) for _ in range(count)]
+
+
+def edit(text, changes, seed):
+    rng = random.Random(seed)
+    words = text.split()
+    for i in rng.sample(range(len(words)), changes):
+        words[i] = rng.choice(VOCABULARY)
+    return ' '.join(words)
+
+
+def jaccard(a, b):
+    a, b = set(shingles(a)), set(shingles(b))
+    return len(a & b) / len(a | b)
+
+
+def test_recall_of_edited_and_truncated_reviews():
+    originals = make_texts(300)
+    index = NearDuplicateIndex()
+    assert all(index.add(text) is None for text in originals)
+    
+    edited = [edit(text, 1, i) for i, text in enumerate(originals)]
+    truncated = [' '.join(text.split()[:25]) + '... Read more' for text in originals]
+    assert min(jaccard(a, b) for a, b in zip(originals, edited)) >= 0.85
+    
+    for variants in (edited, truncated):
+        found = sum(index.query(text) == i for i, text in enumerate(variants))
+        assert found / len(variants) >= 0.95
+
+
+def test_distinct_reviews_are_not_matched():
+    texts = make_texts(500, seed=11)
+    index = NearDuplicateIndex()
+    assert sum(index.add(text) is not None for text in texts) == 0
+
+
+def test_drop_near_duplicates_per_user():
+    text = make_texts(1)[0]
+    reviews = [
+        {'username': 'Ann', 'review_text': text},
+        {'username': 'ann ', 'review_text': edit(text, 1, 1)},   # same user, edited
+        {'username': 'Bob', 'review_text': text},                # other user keeps it
+    ]
+    stats = {}
+    kept = list(drop_near_duplicates(reviews, stats=stats))
+    assert [r['username'] for r in kept] == ['Ann', 'Bob']
+    assert stats['near_duplicates'] == 1
+    assert find_near_duplicates(reviews) == [[0, 1, 2]]
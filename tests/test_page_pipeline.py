@@ -0,0 +1,80 @@
+import time
+import threading
+
+import pytest
+
+from driver_pool import DriverPool
+from page_pipeline import run_pipeline
+
+
+class Driver:
+    def __init__(self):
+        self.quit_called = False
+    
+    def quit(self):
+        self.quit_called = True
+
+
+def test_stop_waits_for_running_fetches():
+    lock = threading.Lock()
+    running = []
+    started = []
+    
+    def fetch(item):
+        with lock:
+            started.append(item)
+            running.append(item)
+        time.sleep(0.05 if item == 0 else 0.3)
+        with lock:
+            running.remove(item)
+        return item
+    
+    stats = run_pipeline(range(100), fetch, lambda html: html, lambda item, result: False, workers=4)
+    assert stats['stopped']
+    assert running == []
+    # Only the first wave of fetches ran, nothing queued later was started
+    finished = list(started)
+    time.sleep(0.4)
+    assert started == finished
+    assert len(started) <= 4 * 2 + 4
+
+
+def test_results_in_order():
+    seen = []
+    
+    def consume(item, result):
+        seen.append(result)
+        return item < 9
+    
+    run_pipeline(range(20), lambda item: item, lambda html: html * 2, consume, workers=3)
+    assert seen == [i * 2 for i in range(10)]
+
+
+def test_acquire_after_close_raises():
+    pool = DriverPool(Driver, 1)
+    with pool.driver():
+        pass
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_waiting_acquire_raises_on_close():
+    pool = DriverPool(Driver, 1)
+    driver = pool.acquire()
+    errors = []
+    
+    def wait():
+        try:
+            pool.acquire()
+        except RuntimeError as e:
+            errors.append(e)
+    
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    time.sleep(0.05)
+    pool.close()
+    waiter.join(2)
+    assert not waiter.is_alive() and errors
+    pool.release(driver)
+    assert driver.quit_called
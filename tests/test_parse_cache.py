@@ -0,0 +1,69 @@
+import itertools
+
+import parse_cache
+from benchmarks.bench_parsers import make_parse_func
+from benchmarks.corpus import write_corpus
+from extraction_plan import compile_plan
+from parse_cache import ParseCache, iter_cached_files, cache_version
+from scraper_config import YELP_CONFIG
+
+
+def parse_all(cache, files, version, parse_func):
+    calls = []
+    
+    def counting(path):
+        calls.append(path)
+        return parse_func(path)
+    return dict(iter_cached_files(counting, files, cache, version)), calls
+
+
+def test_unchanged_files_come_from_the_cache(tmp_path):
+    files = write_corpus(str(tmp_path / 'pages'), 'yelp', pages=3, reviews=10)
+    parse_func = make_parse_func('custom_scraper', 'yelp', 'bs4')
+    version = cache_version(compile_plan(YELP_CONFIG))
+    cache = ParseCache(str(tmp_path / 'cache.db'))
+    
+    first, calls = parse_all(cache, files, version, parse_func)
+    assert calls == files and cache.misses == 3
+    second, calls = parse_all(cache, files, version, parse_func)
+    assert calls == [] and cache.hits == 3
+    assert second == first == {f: parse_func(f) for f in files}
+    cache.close()
+
+
+def test_changed_file_or_version_is_parsed_again(tmp_path):
+    files = write_corpus(str(tmp_path / 'pages'), 'yelp', pages=2, reviews=10)
+    parse_func = make_parse_func('custom_scraper', 'yelp', 'bs4')
+    plan = compile_plan(YELP_CONFIG)
+    cache = ParseCache(str(tmp_path / 'cache.db'))
+    parse_all(cache, files, cache_version(plan), parse_func)
+    
+    with open(files[0], 'a', encoding='utf-8') as f:
+        f.write('<!-- saved again -->')
+    _, calls = parse_all(cache, files, cache_version(plan), parse_func)
+    assert calls == [files[0]]
+    
+    # Another backend or preset is another version
+    assert cache_version(plan, 'lxml') != cache_version(plan)
+    other = compile_plan(dict(YELP_CONFIG, selectors=dict(YELP_CONFIG['selectors'], container_tag='div')))
+    assert cache_version(other) != cache_version(plan)
+    _, calls = parse_all(cache, files, cache_version(plan, 'lxml'), parse_func)
+    assert calls == files
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = itertools.count(1000)
+    monkeypatch.setattr(parse_cache.time, 'time', lambda: next(clock))
+    cache = ParseCache(str(tmp_path / 'cache.db'))
+    reviews = [{'username': f'u{i}', 'review_text': f'text {i} ' * 50} for i in range(20)]
+    for key in 'abc':
+        cache.put(key, 'v', reviews)
+    cache.max_bytes = 2 * cache.total_size() // 3
+    
+    assert cache.get('a', 'v') == reviews   # a is used again, b is now the oldest
+    cache.evict()
+    assert not cache.contains('b', 'v')
+    assert cache.contains('a', 'v') and cache.contains('c', 'v')
+    assert cache.total_size() <= cache.max_bytes
+    cache.close()
@@ -0,0 +1,43 @@
+import pytest
+
+from benchmarks.bench_parsers import make_parse_func
+from benchmarks.corpus import write_corpus, make_page, SITES
+from benchmarks.fake_site import PHOTO_LINK_RE
+from page_loader import make_soup
+from yelp_scraper import YelpScraper
+
+TARGETS = ('html_parser', 'custom_scraper', 'scraper_gui')
+
+CASES = [(target, site) for target in TARGETS for site in SITES
+         if make_parse_func(target, site, 'bs4') is not None]
+
+
+@pytest.mark.parametrize('target,site', CASES)
+def test_strained_tree_gives_same_reviews(tmp_path, target, site):
+    files = write_corpus(str(tmp_path), site, pages=2, reviews=30, noise=0.5)
+    full = make_parse_func(target, site, 'bs4', strain=False)
+    strained = make_parse_func(target, site, 'bs4', strain=True)
+    for path in files:
+        reviews = full(path)
+        assert reviews
+        assert strained(path) == reviews
+
+
+def test_strained_tree_keeps_only_review_regions():
+    html = make_page('yelp', 5, seed=1, noise=0.5)
+    full, strained = make_soup(html), make_soup(html, 'li')
+    assert strained.find('nav') is None and strained.find('script') is None
+    assert [str(li) for li in strained.find_all('li')] == [str(li) for li in full.find_all('li')]
+
+
+@pytest.mark.parametrize('html', [
+    PHOTO_LINK_RE.sub('', make_page('yelp', 20, seed=3, noise=0.5)),
+    # No <li> containers: the strained parse falls back to the full tree
+    '<html><body><div data-review-id="1"><a href="/user_details?userid=a">Ann B.</a>'
+    '<span>Mar 3, 2023</span><div aria-label="4 star rating"></div>'
+    '<p lang="en">Short text</p></div></body></html>',
+])
+def test_yelp_scraper_strain_matches_full_parse(html):
+    reviews = YelpScraper(strain=False).parse_reviews(html)
+    assert reviews
+    assert YelpScraper(strain=True).parse_reviews(html) == reviews
@@ -0,0 +1,78 @@
+import time
+import threading
+
+import pytest
+
+import rate_limiter
+from rate_limiter import TokenBucket
+
+
+class FakeTime:
+    """monotonic() and sleep() on a clock that only moves when sleeping"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(rate_limiter, 'time', fake)
+    return fake
+
+
+def start_times(bucket, clock, count):
+    times = []
+    for _ in range(count):
+        bucket.wait()
+        times.append(clock.now)
+    return times
+
+
+def test_requests_are_spaced_by_the_rate(clock):
+    bucket = TokenBucket(rate=2, burst=1)
+    assert start_times(bucket, clock, 5) == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert bucket.requests == 5 and bucket.waited == pytest.approx(2.0)
+
+
+def test_burst_after_idle_then_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    start_times(bucket, clock, 3)
+    clock.now += 10   # Idle: the bucket refills up to burst, not more
+    times = start_times(bucket, clock, 5)
+    assert times == pytest.approx([10.0, 10.0, 10.0, 10.5, 11.0])
+
+
+def test_no_limit(clock):
+    bucket = TokenBucket(rate=0)
+    assert start_times(bucket, clock, 3) == [0.0, 0.0, 0.0]
+
+
+def test_shared_between_threads():
+    rate, per_thread, threads = 100, 10, 4
+    bucket = TokenBucket(rate=rate, burst=1)
+    starts = []
+    lock = threading.Lock()
+    
+    def worker():
+        for _ in range(per_thread):
+            bucket.wait()
+            with lock:
+                starts.append(time.monotonic())
+    
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    
+    # All threads together stay at the rate: n requests take (n - 1) / rate
+    elapsed = max(starts) - min(starts)
+    assert elapsed >= (per_thread * threads - 1) / rate * 0.95
+    assert bucket.requests == per_thread * threads
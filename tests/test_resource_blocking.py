@@ -0,0 +1,54 @@
+"""
+BlockProfile only turns on Chrome's performance log when it blocks something
+"""
+
+from resource_blocking import BlockProfile, blocked_requests
+from yelp_scraper import YelpScraper
+
+
+def capabilities(block):
+    return YelpScraper(block=block).chrome_options().to_capabilities()
+
+
+def test_empty_profile_leaves_performance_log_off():
+    caps = capabilities(BlockProfile(()))
+    assert 'goog:loggingPrefs' not in caps
+    assert 'prefs' not in caps['goog:chromeOptions']
+
+
+def test_blocking_profile_records_performance_log():
+    caps = capabilities(BlockProfile(('image', 'tracker')))
+    assert caps['goog:loggingPrefs'] == {'performance': 'ALL'}
+    assert caps['goog:chromeOptions']['prefs'] == {'profile.managed_default_content_settings.images': 2}
+
+
+class LogDriver:
+    """Driver stub that counts get_log calls"""
+    
+    page_source = '<html></html>'
+    
+    def __init__(self):
+        self.log_calls = 0
+    
+    def get(self, url):
+        pass
+    
+    def get_log(self, kind):
+        self.log_calls += 1
+        return []
+    
+    def find_elements(self, by, selector):
+        return []
+    
+    def execute_script(self, script):
+        return {'requests': 3, 'bytes': 2048}
+
+
+def test_open_page_skips_log_without_blocking(monkeypatch):
+    monkeypatch.setattr('yelp_scraper.wait_for_stable_count', lambda driver, selector: (0, False))
+    for block, calls in ((BlockProfile(()), 0), (BlockProfile(('font',)), 2)):
+        driver, timing = LogDriver(), {}
+        YelpScraper(block=block).open_page(driver, 0, timing)
+        assert driver.log_calls == calls
+        assert timing['blocked'] == 0 and timing['requests'] == 3 and timing['kb'] == 2.0
+    assert blocked_requests(driver) == 0
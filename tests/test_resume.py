@@ -0,0 +1,81 @@
+import os
+import sys
+import csv
+import subprocess
+
+import pytest
+
+from benchmarks.fake_site import FakeSite
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Crawls the fake site with a dedup index; with kill_after the process dies
+# (os._exit, like kill -9) right after that many pages were checkpointed, or
+# with a negative kill_after halfway through writing that many rows
+CRAWL = r"""
+import os, sys
+sys.path.insert(0, sys.argv[1])
+import crawl_checkpoint
+import review_stream
+from dedup_index import DedupIndex
+from yelp_scraper import YelpScraper
+from benchmarks.fake_site import FakeDriver
+
+url, output, index_path, kill_after = sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5])
+if kill_after < 0:
+    write = review_stream.CSVStreamWriter.write
+    
+    def write_then_die(self, row):
+        if self.count == -kill_after - 1:
+            self.f.write(row['username'] + ',"half a revi')
+            self.f.flush()
+            os._exit(9)
+        write(self, row)
+    review_stream.CSVStreamWriter.write = write_then_die
+elif kill_after:
+    record = crawl_checkpoint.CrawlCheckpoint.record
+    
+    def record_then_die(self, *args):
+        record(self, *args)
+        if self.pages >= kill_after:
+            os._exit(9)
+    crawl_checkpoint.CrawlCheckpoint.record = record_then_die
+
+index = DedupIndex(index_path, scope=url)
+index.seed_from_csv(output)
+scraper = YelpScraper(rate=0, driver_factory=FakeDriver, fetch_mode='http', base_url=url,
+                      extract='html', dedup_index=index)
+scraper.scrape_all_reviews(output_file=output, resume=not kill_after)
+index.close()
+"""
+
+
+def crawl(url, output, index_path, kill_after=0):
+    proc = subprocess.run([sys.executable, '-c', CRAWL, ROOT, url, str(output), str(index_path), str(kill_after)],
+                          cwd=ROOT, capture_output=True, text=True, timeout=300)
+    return proc.returncode
+
+
+def review_ids(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return [row['review_id'] for row in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize('kill_after', [3, 55, -405])
+def test_kill_and_resume_with_index_writes_no_duplicates(tmp_path, kill_after):
+    output = tmp_path / 'out.csv'
+    with FakeSite(pages=10, latency=0) as site:
+        # An earlier complete run: the index scope already has IDs
+        assert crawl(site.url, output, tmp_path / 'index.db') == 0
+        
+        site.pages = 60
+        assert crawl(site.url, tmp_path / 'clean.csv', tmp_path / 'clean.db') == 0
+        assert crawl(site.url, output, tmp_path / 'index.db', kill_after) == 9
+        assert os.path.exists(str(output) + '.checkpoint')
+        assert crawl(site.url, output, tmp_path / 'index.db') == 0
+    
+    expected = review_ids(tmp_path / 'clean.csv')
+    ids = review_ids(output)
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(expected)
+    assert not os.path.exists(str(output) + '.checkpoint')
@@ -0,0 +1,58 @@
+import csv
+
+import pytest
+
+from dedup_index import DedupIndex
+from review_stream import CSVStreamWriter, trim_partial_row, dedup_filter_years
+
+COLUMNS = ['username', 'review_text']
+
+
+def write_rows(path, rows, append=False):
+    with CSVStreamWriter(str(path), COLUMNS, append=append) as writer:
+        for row in rows:
+            writer.write(row)
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.mark.parametrize('cut', [1, 2, 9, 30])
+def test_append_drops_cut_off_last_row(tmp_path, cut):
+    path = tmp_path / 'out.csv'
+    rows = [{'username': f'u{i}', 'review_text': f'line one\r\nline two {i}', 'review_id': f'id{i}'}
+            for i in range(3)]
+    write_rows(path, rows)
+    data = path.read_bytes()
+    path.write_bytes(data[:-cut])
+    
+    write_rows(path, [{'username': 'u9', 'review_text': 'new', 'review_id': 'id9'}], append=True)
+    assert [r['review_id'] for r in read_rows(path)] == ['id0', 'id1', 'id9']
+
+
+def test_trim_leaves_complete_file(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_rows(path, [{'username': 'u', 'review_text': 't', 'review_id': 'x'}])
+    before = path.read_bytes()
+    assert not trim_partial_row(str(path))
+    assert path.read_bytes() == before
+
+
+def test_dedup_before_year_filter(tmp_path):
+    # The first occurrence wins even when its year is filtered out
+    reviews = [
+        {'username': 'a', 'review_text': 'same text', 'written_date': 'Jan 2, 2017'},
+        {'username': 'a', 'review_text': 'same text', 'written_date': 'Jan 2, 2020'},
+        {'username': 'b', 'review_text': 'other', 'written_date': 'Mar 1, 2021'},
+    ]
+    kept = list(dedup_filter_years([dict(r) for r in reviews], (2019, 2025)))
+    assert [r['username'] for r in kept] == ['b']
+    
+    index = DedupIndex(str(tmp_path / 'index.sqlite3'))
+    kept = list(dedup_filter_years([dict(r) for r in reviews], (2019, 2025), index))
+    assert [r['username'] for r in kept] == ['b']
+    # Only kept reviews are recorded in the index
+    assert index.count() == 1
+    index.close()
@@ -0,0 +1,37 @@
+import pytest
+
+import stream_parser
+from benchmarks.bench_parsers import make_parse_func
+from benchmarks.corpus import write_corpus, SITES
+
+TARGETS = ('html_parser', 'custom_scraper', 'scraper_gui')
+
+CASES = [(target, site) for target in TARGETS for site in SITES
+         if make_parse_func(target, site, 'bs4') is not None]
+
+
+@pytest.mark.parametrize('target,site', CASES)
+def test_stream_matches_bs4(tmp_path, target, site):
+    files = write_corpus(str(tmp_path), site, pages=2, reviews=30, noise=0.5)
+    bs4, stream = make_parse_func(target, site, 'bs4'), make_parse_func(target, site, 'stream')
+    for path in files:
+        reviews = bs4(path)
+        assert reviews
+        assert stream(path) == reviews
+
+
+def test_stream_matches_bs4_on_large_page(tmp_path, monkeypatch):
+    # 1 MB padded page; the encoding check reads it in many chunks
+    monkeypatch.setattr(stream_parser, 'CHUNK_SIZE', 4096)
+    path = write_corpus(str(tmp_path), 'yelp', pages=1, reviews=200, noise=0.5, page_kb=1024)[0]
+    reviews = make_parse_func('html_parser', 'yelp', 'bs4')(path)
+    assert len(reviews) == 200
+    assert make_parse_func('html_parser', 'yelp', 'stream')(path) == reviews
+
+
+def test_detect_encoding(tmp_path):
+    utf8, latin1 = tmp_path / 'a.html', tmp_path / 'b.html'
+    utf8.write_bytes('<p>Café</p>'.encode('utf-8'))
+    latin1.write_bytes('<p>Café</p>'.encode('latin-1'))
+    assert stream_parser.detect_encoding(str(utf8)) == 'utf-8'
+    assert stream_parser.detect_encoding(str(latin1)) == 'latin-1'
@@ -0,0 +1,85 @@
+"""
+CSVSource reads rows from disk on demand; VirtualTable keeps streamed rows sorted
+"""
+
+import csv
+import heapq
+
+import pytest
+
+from virtual_table import CSVSource, sort_keys
+
+ROWS = [
+    {'username': 'a', 'rating': '3', 'review_text': 'plain'},
+    {'username': 'b', 'rating': '5', 'review_text': 'two\nlines, "quoted"'},
+    {'username': 'c', 'rating': '1', 'review_text': ''},
+]
+
+
+def write_rows(path, rows, header=True, mode='w'):
+    with open(path, mode, newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(ROWS[0]))
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_csv_source_reads_rows(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_rows(path, ROWS)
+    source = CSVSource(str(path))
+    assert len(source) == 3
+    assert [source[i] for i in range(3)] == ROWS
+    assert source[-1] == ROWS[-1]
+    with pytest.raises(IndexError):
+        source[3]
+    source.close()
+
+
+def test_csv_source_follows_a_growing_file(tmp_path):
+    path = tmp_path / 'out.csv'
+    write_rows(path, ROWS[:1])
+    source = CSVSource(str(path))
+    assert len(source) == 1
+    
+    # A row that is only partly written is not shown yet
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write('b,5,"two\n')
+    assert len(source) == 1
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.write('lines, ""quoted"""\r\n')
+    write_rows(path, ROWS[2:], header=False, mode='a')
+    assert len(source) == 3
+    assert [source[i] for i in range(3)] == ROWS
+    source.close()
+
+
+def test_sorted_batches_merge_to_full_sort():
+    rows = [{'rating': str((i * 7) % 11)} for i in range(50)]
+    order = sort_keys(rows, 'rating', 0, 20)
+    order = list(heapq.merge(order, sort_keys(rows, 'rating', 20, 50)))
+    assert order == sort_keys(rows, 'rating')
+
+
+def test_table_scrolls_and_sorts_streamed_rows():
+    tk = pytest.importorskip('tkinter')
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip('no display')
+    from virtual_table import VirtualTable
+    
+    rows = []
+    columns = [('rating', 'Rating', 50, 'rating')]
+    table = VirtualTable(root, columns, lambda r: (r['rating'],), rows, height=4)
+    table.sort_by('rating')
+    for batch in range(3):
+        rows.extend({'rating': str((i * 7) % 11)} for i in range(batch * 10, batch * 10 + 10))
+        table.refresh()
+    assert table._order == sort_keys(rows, 'rating')
+    
+    table._on_key(1)
+    assert table.top == 1
+    table._on_key(table.rows)
+    assert table.top == 1 + table.rows
+    root.destroy()
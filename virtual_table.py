@@ -0,0 +1,277 @@
+"""
+Virtual Table
+Tabel hasil (ttk.Treeview) yang hanya membuat baris yang sedang terlihat
+
+Treeview biasa menyimpan satu item Tk per review, sehingga tidak bisa dipakai
+di atas ~50 ribu baris. VirtualTable hanya punya item sebanyak baris yang
+muat di layar; saat di-scroll, nilai item itu diganti dengan baris yang
+sesuai dari sumber data. Sumber data cukup punya __len__ dan __getitem__
+(list review di memori, atau CSVSource yang membaca baris dari file CSV di
+disk saat dibutuhkan) dan boleh terus bertambah: refresh() dipanggil untuk
+menampilkan baris baru.
+
+Klik pada heading mengurutkan berdasarkan kolom itu (klik lagi = terbalik)
+tanpa membangun ulang widget: yang diurutkan hanya daftar (key, index).
+Baris yang datang setelah pengurutan diurutkan sekali per refresh lalu
+di-merge dengan urutan yang sudah ada.
+"""
+
+import re
+import csv
+import heapq
+import tkinter as tk
+from tkinter import ttk
+
+
+NUMBER_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+DATE_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2}),\s+(\d{4})$')
+MONTHS = {m: i for i, m in enumerate(('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1)}
+
+WHEEL_ROWS = 3
+
+
+def sort_value(value) -> tuple:
+    """Sort key for a cell: numbers, then 'Mon D, YYYY' dates, then text"""
+    text = str(value or '').strip()
+    if NUMBER_RE.match(text):
+        return (0, float(text), '')
+    match = DATE_RE.match(text)
+    if match:
+        return (1, int(match.group(3)) * 10000 + MONTHS[match.group(1)] * 100 + int(match.group(2)), '')
+    return (2, 0, text.casefold())
+
+
+def sort_keys(source, key: str, start: int = 0, stop: int = None) -> list:
+    """Sorted [(sort value, index)] of source[start:stop] by one field"""
+    stop = len(source) if stop is None else stop
+    return sorted((sort_value(source[i].get(key, '')), i) for i in range(start, stop))
+
+
+class CSVSource:
+    """
+    Rows of a CSV file read from disk when they are shown
+    
+    Only the byte offset of each row is kept in memory. The file may still
+    be growing (e.g. written while scraping): len() indexes rows appended
+    since the last call and ignores a trailing row that is not complete yet.
+    """
+    
+    def __init__(self, path: str, encoding: str = 'utf-8'):
+        """
+        Args:
+            path: CSV file with a header row
+            encoding: Text encoding of the file
+        """
+        self.path = path
+        self.encoding = encoding
+        self.header = None
+        self._file = open(path, 'rb')
+        self._offsets = []  # start of each complete row
+        self._end = 0  # end of the indexed part of the file
+    
+    def _scan(self):
+        """Index complete rows appended since the last scan"""
+        f = self._file
+        f.seek(self._end)
+        start = self._end
+        quotes = 0
+        for line in iter(f.readline, b''):
+            if not line.endswith(b'\n'):
+                break  # row still being written
+            # A newline inside a quoted field leaves an odd number of quotes
+            quotes += line.count(b'"')
+            if quotes % 2:
+                continue
+            if self.header is None:
+                self.header = self._decode(line)
+            else:
+                self._offsets.append(start)
+            start = f.tell()
+            quotes = 0
+        self._end = start
+    
+    def _decode(self, data: bytes) -> list:
+        return next(csv.reader([data.decode(self.encoding, errors='replace')]), [])
+    
+    def __len__(self):
+        self._scan()
+        return len(self._offsets)
+    
+    def __getitem__(self, index: int) -> dict:
+        start = self._offsets[index]
+        index = index % len(self._offsets)
+        end = self._offsets[index + 1] if index + 1 < len(self._offsets) else self._end
+        self._file.seek(start)
+        return dict(zip(self.header, self._decode(self._file.read(end - start))))
+    
+    def close(self):
+        self._file.close()
+
+
+class VirtualTable:
+    """Treeview that materializes only the visible rows of a data source"""
+    
+    def __init__(self, parent, columns, row_values, source=(), height: int = 8):
+        """
+        Args:
+            parent: Tk container (the table packs a Treeview and a Scrollbar)
+            columns: List of (column id, heading, width, sort key) where
+                     sort key is the field of a source item to sort by
+            row_values: Function item -> tuple of cell values
+            source: Sequence with __len__ and __getitem__
+            height: Initial number of visible rows
+        """
+        self.columns = columns
+        self.row_values = row_values
+        self.source = source
+        self.top = 0
+        self.rows = height
+        self.sort_column = None
+        self.reverse = False
+        self._order = None  # sorted [(key, index)] when a sort is active
+        self._known = 0  # source items already in _order
+        self._shown = None
+        self._measured = False
+        
+        self.tree = ttk.Treeview(parent, columns=[c[0] for c in columns], show='headings', height=height)
+        for column_id, heading, width, _ in columns:
+            self.tree.heading(column_id, text=heading, command=lambda c=column_id: self.sort_by(c))
+            self.tree.column(column_id, width=width)
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.yview)
+        
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_wheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-WHEEL_ROWS))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(WHEEL_ROWS))
+        self.tree.bind('<Up>', lambda e: self._on_key(-1))
+        self.tree.bind('<Down>', lambda e: self._on_key(1))
+        self.tree.bind('<Prior>', lambda e: self._on_key(-self.rows))
+        self.tree.bind('<Next>', lambda e: self._on_key(self.rows))
+        self.tree.bind('<Home>', lambda e: self._on_key(-self.top))
+        self.tree.bind('<End>', lambda e: self._on_key(len(self.source)))
+    
+    def set_source(self, source):
+        """Show another data source (keeps the current sort column)"""
+        self.source = source
+        self.top = 0
+        self._known = 0
+        self._order = [] if self.sort_column else None
+        self._shown = None
+        self.refresh()
+    
+    def item_at(self, position: int):
+        """Source item shown at a position of the (sorted) table"""
+        if self._order is None:
+            return self.source[position]
+        if self.reverse:
+            position = len(self._order) - 1 - position
+        return self.source[self._order[position][1]]
+    
+    def sort_by(self, column_id: str):
+        """Sort by a column; sorting the same column again reverses it"""
+        if column_id == self.sort_column:
+            self.reverse = not self.reverse
+        else:
+            key = self._sort_key(column_id)
+            self.sort_column = column_id
+            self.reverse = False
+            self._order = sort_keys(self.source, key)
+            self._known = len(self._order)
+        
+        for cid, heading, _, _ in self.columns:
+            arrow = (' ▼' if self.reverse else ' ▲') if cid == column_id else ''
+            self.tree.heading(cid, text=heading + arrow)
+        self.top = 0
+        self._shown = None
+        self.refresh()
+    
+    def _sort_key(self, column_id: str) -> str:
+        for cid, _, _, key in self.columns:
+            if cid == column_id:
+                return key
+        raise KeyError(column_id)
+    
+    def refresh(self):
+        """Pick up new source items and redraw the visible rows if needed"""
+        total = len(self.source)
+        if self._order is not None and self._known < total:
+            # One sort of the new rows and one merge per refresh
+            new = sort_keys(self.source, self._sort_key(self.sort_column), self._known, total)
+            self._order = list(heapq.merge(self._order, new))
+            self._known = total
+            self._shown = None
+        
+        self.top = max(0, min(self.top, total - self.rows))
+        visible = min(self.rows, total - self.top)
+        # Rows already on screen only change when the view or the order does
+        state = (self.top, visible, self.reverse)
+        if state != self._shown:
+            self._draw(visible)
+            self._shown = state
+        self._update_scrollbar(total)
+        if not self._measured and visible:
+            self._fit(self.tree.winfo_height())
+    
+    def _draw(self, visible: int):
+        items = self.tree.get_children()
+        for iid in items[visible:]:
+            self.tree.delete(iid)
+        for row in range(visible):
+            values = self.row_values(self.item_at(self.top + row))
+            if row < len(items):
+                self.tree.item(items[row], values=values)
+            else:
+                self.tree.insert('', tk.END, values=values)
+    
+    def _update_scrollbar(self, total: int):
+        if total <= self.rows:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.rows) / total)
+    
+    def scroll(self, rows: int):
+        self.scroll_to(self.top + rows)
+    
+    def scroll_to(self, top: int):
+        self.top = max(0, top)
+        self.refresh()
+    
+    def yview(self, *args):
+        """Scrollbar command ('moveto', fraction) / ('scroll', n, 'units'|'pages')"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.source)))
+        elif args[0] == 'scroll':
+            step = self.rows if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+    
+    def _on_wheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        notches = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll(-notches * WHEEL_ROWS)
+    
+    def _on_key(self, rows: int):
+        # The Treeview's own bindings would move the selection over the
+        # few materialized items instead of scrolling the data
+        self.scroll(rows)
+        return 'break'
+    
+    def _on_resize(self, event):
+        self._fit(event.height)
+    
+    def _fit(self, height: int):
+        """Number of rows from the widget height (measured on a drawn row)"""
+        items = self.tree.get_children()
+        box = self.tree.bbox(items[0]) if items else None
+        if not box or height <= 1:
+            return
+        self._measured = True
+        _, y, _, row_height = box
+        rows = max(1, (height - y) // row_height)
+        if rows != self.rows:
+            self.rows = rows
+            self._shown = None
+            self.refresh()
@@ -2,24 +2,29 @@
 Yelp Coachella Reviews Scraper
 Menggunakan Selenium + BeautifulSoup untuk scraping review dari Yelp
 
-Output columns: username, from, written_date, rating, title, review_text, tema_pengalaman, daya_tarik_wisata
+Output columns: username, from, written_date, rating, title, review_text, tema_pengalaman, daya_tarik_wisata, review_id
 """
 
 import time
-import csv
 import re
+import csv
+import threading
 import argparse
 from datetime import datetime
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from page_loader import make_soup
+from driver_pool import DriverPool
+from page_pipeline import run_pipeline
+from rate_limiter import TokenBucket, DEFAULT_RATE, DEFAULT_BURST
+from page_wait import wait_for_stable_count
+from data_validation import QualityStats
+from js_extract import EXTRACT_MODES, extract_reviews_js, compare_reviews, payload_kb
+from resource_blocking import BlockProfile, DEFAULT_BLOCK, parse_block_types, blocked_requests, resource_stats
+from http_fetch import HTTPFetcher, FETCH_MODES
+from review_stream import dedup_reviews
+from columnar_export import open_writer
+from dedup_index import DedupIndex
+from crawl_checkpoint import CrawlCheckpoint, checkpoint_path
 
 
 class YelpScraper:
@@ -27,73 +32,318 @@ class YelpScraper:
     
     BASE_URL = "https://www.yelp.com/biz/coachella-indio-2"
     
-    def __init__(self, headless: bool = True):
+    # Yelp shows 10 reviews per page
+    PAGE_SIZE = 10
+    MAX_PAGES = 60
+    
+    COLUMNS = ['username', 'from', 'written_date', 'rating', 'title', 
+               'review_text', 'tema_pengalaman', 'daya_tarik_wisata']
+    
+    # Server-rendered review markup (profile links inside the reviews)
+    REVIEW_MARKUP_RE = re.compile(r'/user_details\?userid=')
+    # One element per review in the rendered page, counted by load_page
+    READY_SELECTOR = "a[href*='/user_details?userid=']"
+    
+    TIMING_COLUMNS = ['offset', 'tier', 'wait', 'fetch', 'containers', 'ready', 'requests', 'kb', 'blocked',
+                      'returned_kb', 'mismatches']
+    
+    def __init__(self, headless: bool = True, strain: bool = False, dedup_index=None,
+                 workers: int = 1, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 driver_factory=None,
+                 fetch_mode: str = 'auto', base_url: str = None, block: BlockProfile = None,
+                 extract: str = 'html'):
         """
         Initialize scraper dengan Chrome WebDriver
         
         Args:
             headless: Run browser tanpa GUI jika True
+            strain: Parse hanya elemen <li> (container review) agar lebih cepat
+            dedup_index: DedupIndex opsional; review dari run sebelumnya dilewati
+                         dan CSV di-append
+            workers: Jumlah driver yang mengambil halaman secara paralel
+            rate: Rata-rata request per detik, berlaku untuk semua driver (0 = tanpa batas)
+            burst: Jumlah request yang boleh dimulai berturut-turut
+            driver_factory: Fungsi tanpa argumen yang membuat driver
+                            (default: Chrome, lihat make_driver)
+            fetch_mode: 'auto' (HTTP dulu, browser jika perlu JavaScript),
+                        'http' (tanpa browser) atau 'browser' (selalu WebDriver)
+            base_url: Halaman bisnis Yelp (default: BASE_URL)
+            block: Resource yang diblokir di browser (default: gambar, font,
+                   media dan tracker; BlockProfile(()) = tidak ada)
+            extract: Cara membaca review di browser: 'html' (page_source +
+                     parse_reviews, default), 'js' (script di halaman, hanya
+                     field review yang dikirim) atau 'check' (keduanya,
+                     dibandingkan)
         """
-        self.options = Options()
-        if headless:
-            self.options.add_argument("--headless=new")
-        
-        # Options untuk menghindari deteksi bot
-        self.options.add_argument("--disable-blink-features=AutomationControlled")
-        self.options.add_argument("--disable-extensions")
-        self.options.add_argument("--no-sandbox")
-        self.options.add_argument("--disable-dev-shm-usage")
-        self.options.add_argument("--window-size=1920,1080")
-        self.options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.options.add_experimental_option('useAutomationExtension', False)
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode}. Available: {', '.join(FETCH_MODES)}")
+        if extract not in EXTRACT_MODES:
+            raise ValueError(f"Unknown extract mode: {extract}. Available: {', '.join(EXTRACT_MODES)}")
+        
+        self.strain = strain
+        self.dedup_index = dedup_index
+        self.workers = max(1, workers)
+        self.rate = rate
+        self.burst = burst
+        self.driver_factory = driver_factory or self.make_driver
+        self.fetch_mode = fetch_mode
+        self.extract = extract
+        if base_url:
+            self.BASE_URL = base_url
+        self.headless = headless
+        
+        # Skip images, fonts, media and trackers; reviews only need the HTML
+        self.block = block if block is not None else BlockProfile()
         
         self.driver = None
+        self.pool = None
+        self.limiter = None
+        self.http = None
         self.reviews = []
+        self.quality = QualityStats()  # running validation counts of the scraped reviews
+        self.fetch_stats = {'http': 0, 'browser': 0}
+        self.page_timings = []
+        self._stats_lock = threading.Lock()
+    
+    def chrome_options(self):
+        """Chrome options for make_driver (Selenium is imported on first use)"""
+        from selenium.webdriver.chrome.options import Options
+        
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        
+        # Options untuk menghindari deteksi bot
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        
+        self.block.configure(options)
+        return options
+    
+    def make_driver(self):
+        """Create a Chrome WebDriver (default driver factory)"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
         
-    def start_driver(self):
-        """Start Chrome WebDriver"""
         print("[*] Starting Chrome WebDriver...")
         service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=self.options)
-        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        driver = webdriver.Chrome(service=service, options=self.chrome_options())
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
             'source': 'Object.defineProperty(navigator, "webdriver", {get: () => undefined})'
         })
-        print("[OK] WebDriver started successfully")
-        
+        self.block.apply(driver)
+        print(f"[OK] WebDriver started successfully (blocking: {self.block})")
+        return driver
+    
+    def start_driver(self):
+        """Start a single WebDriver (self.driver) for get_page"""
+        self.driver = self.driver_factory()
+    
     def close_driver(self):
         """Close WebDriver"""
         if self.driver:
             self.driver.quit()
             print("[STOP] WebDriver closed")
-            
+    
+    def page_url(self, start: int = 0) -> str:
+        """URL of the review page at a pagination offset"""
+        return f"{self.BASE_URL}?start={start}" if start > 0 else self.BASE_URL
+    
     def get_page(self, start: int = 0) -> str:
         """
         Navigate ke halaman review dengan pagination
         
         Args:
             start: Offset untuk pagination (0, 10, 20, ...)
-            
+        
+        Returns:
+            HTML page source
+        """
+        return self.load_page(self.driver, start)
+    
+    def load_page(self, driver, start: int = 0, timing: dict = None) -> str:
+        """
+        Load one review page with a given driver and return its source
+        
+        Args:
+            driver: WebDriver (or any object with get/find_elements/
+                    execute_script/page_source)
+            start: Offset untuk pagination (0, 10, 20, ...)
+            timing: Optional dict, see open_page
+        
         Returns:
             HTML page source
         """
-        url = f"{self.BASE_URL}?start={start}" if start > 0 else self.BASE_URL
+        self.open_page(driver, start, timing)
+        return driver.page_source
+    
+    def open_page(self, driver, start: int = 0, timing: dict = None):
+        """
+        Navigate a driver to a review page and wait until it is ready
+        
+        Args:
+            driver: WebDriver (or any object with get/find_elements/
+                    execute_script/page_source)
+            start: Offset untuk pagination (0, 10, 20, ...)
+            timing: Optional dict, 'containers', 'ready' and the network
+                    stats ('requests', 'kb', 'blocked') are set
+        """
+        url = self.page_url(start)
         print(f"[PAGE] Loading: {url}")
         
-        self.driver.get(url)
+        # Drop log entries of the previous page
+        if self.block:
+            blocked_requests(driver)
+        driver.get(url)
+        
+        # Wait until the number of reviews stops changing
+        count, ready = wait_for_stable_count(driver, self.READY_SELECTOR)
+        if not ready:
+            print(f"[WARN] No reviews rendered on page start={start}")
+        if timing is not None:
+            timing['containers'] = count
+            timing['ready'] = ready
+            timing['blocked'] = blocked_requests(driver) if self.block else 0
+            stats = resource_stats(driver)
+            if stats:
+                timing['requests'] = stats[0]
+                timing['kb'] = stats[1] / 1024
+    
+    def read_page(self, driver, start: int = 0, timing: dict = None):
+        """
+        Read the reviews of an opened page according to the extract mode
+        
+        'js' runs the extraction script in the page and returns the review
+        list; the page source is only transferred (and parsed in Python)
+        when the script fails or finds nothing although reviews were
+        rendered. 'check' also parses the source and reports differences.
+        'html' returns the page source.
         
-        # Wait for reviews to load
-        try:
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='review']"))
-            )
-            # Extra wait for dynamic content
-            time.sleep(2)
-        except TimeoutException:
-            print(f"[WARN] Timeout waiting for reviews on page start={start}")
-            
-        return self.driver.page_source
+        Returns:
+            List of reviews, or HTML page source for parse_reviews
+        """
+        if self.extract == 'html':
+            html = driver.page_source
+            if timing is not None:
+                timing['returned_kb'] = len(html) / 1024
+            return html
+        
+        reviews = extract_reviews_js(driver)
+        rendered = timing.get('containers', 0) if timing else 0
+        if reviews is None or (not reviews and rendered):
+            print(f"   [WARN] In-browser extraction found nothing on start={start}, parsing page source")
+            html = driver.page_source
+            if timing is not None:
+                timing['returned_kb'] = len(html) / 1024
+            return html
+        
+        if timing is not None:
+            timing['returned_kb'] = payload_kb(reviews)
+        if self.extract == 'check':
+            diffs = compare_reviews(reviews, self.parse_reviews(driver.page_source))
+            if timing is not None:
+                timing['mismatches'] = len(diffs)
+            if diffs:
+                print(f"   [CHECK] start={start}: {len(diffs)} difference(s) between JS and Python extraction")
+                for index, field, js_value, py_value in diffs[:3]:
+                    print(f"      #{index} {field}: JS={str(js_value)[:40]!r} PY={str(py_value)[:40]!r}")
+            else:
+                print(f"   [CHECK] start={start}: JS and Python extraction match ({len(reviews)} reviews)")
+        return reviews
+    
+    def parse_page(self, page) -> list:
+        """Reviews of a fetched page (already extracted in the browser, or HTML)"""
+        if isinstance(page, list):
+            return page
+        return self.parse_reviews(page)
+    
+    def has_reviews(self, html: str) -> bool:
+        """True if the HTML already contains review markup (no JavaScript needed)"""
+        return bool(html) and self.REVIEW_MARKUP_RE.search(html) is not None
+    
+    def fetch_page(self, start: int = 0) -> str:
+        """
+        Fetch one review page with the cheapest tier that works
+        
+        In 'auto' mode the page is first requested over pooled HTTP; only
+        when the response has no review markup (rendered by JavaScript) a
+        WebDriver from the pool loads it. Every request waits for the shared
+        rate limiter.
+        
+        Args:
+            start: Offset untuk pagination (0, 10, 20, ...)
+        
+        Returns:
+            HTML page source, or the review list when the reviews were
+            extracted in the browser (see read_page)
+        """
+        if self.fetch_mode != 'browser':
+            url = self.page_url(start)
+            timing = {'offset': start, 'tier': 'http', 'wait': self.limiter.wait()}
+            began = time.perf_counter()
+            html = self.http.fetch(url)
+            timing['fetch'] = time.perf_counter() - began
+            if self.fetch_mode == 'http' or self.has_reviews(html):
+                self._record(timing)
+                return html or ''
+            self._record(timing, counted=False)
+            print(f"[PAGE] No reviews in HTTP response, using browser: {url}")
+        
+        with self.pool.driver() as driver:
+            timing = {'offset': start, 'tier': 'browser', 'wait': self.limiter.wait()}
+            began = time.perf_counter()
+            self.open_page(driver, start, timing)
+            page = self.read_page(driver, start, timing)
+            timing['fetch'] = time.perf_counter() - began
+        self._record(timing)
+        return page
+    
+    def _record(self, timing: dict, counted: bool = True):
+        with self._stats_lock:
+            self.page_timings.append(timing)
+            if counted:
+                self.fetch_stats[timing['tier']] += 1
+    
+    def timing_summary(self) -> str:
+        """Average limiter wait and fetch time per tier"""
+        parts = []
+        for tier in ('http', 'browser'):
+            rows = [t for t in self.page_timings if t['tier'] == tier]
+            if rows:
+                wait = sum(t['wait'] for t in rows) / len(rows)
+                fetch = sum(t['fetch'] for t in rows) / len(rows)
+                parts.append(f"{tier}: {len(rows)} request(s), wait {wait:.2f}s, fetch {fetch:.2f}s avg")
+        
+        loaded = [t for t in self.page_timings if 'requests' in t]
+        if loaded:
+            requests = sum(t['requests'] for t in loaded) / len(loaded)
+            kb = sum(t['kb'] for t in loaded) / len(loaded)
+            blocked = sum(t['blocked'] for t in loaded) / len(loaded)
+            parts.append(f"browser page: {requests:.0f} request(s), {kb:.0f} KB loaded, "
+                         f"{blocked:.0f} blocked avg")
+        
+        returned = [t for t in self.page_timings if 'returned_kb' in t]
+        if returned:
+            kb = sum(t['returned_kb'] for t in returned) / len(returned)
+            parts.append(f"{kb:.1f} KB returned to Python per page ({self.extract})")
+        return ' | '.join(parts)
+    
+    def save_timings(self, filename: str):
+        """Write per-request timings (seconds) to a CSV for tuning rate/burst/workers"""
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.TIMING_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for t in sorted(self.page_timings, key=lambda t: t['offset']):
+                writer.writerow({k: round(v, 3) if isinstance(v, float) else v for k, v in t.items()})
+        print(f"[SAVE] Saved {len(self.page_timings)} page timings to {filename}")
     
     def parse_reviews(self, html: str) -> list:
         """
@@ -101,20 +351,24 @@ class YelpScraper:
         
         Args:
             html: HTML source dari halaman Yelp
-            
+        
         Returns:
             List of review dictionaries
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = make_soup(html, 'li' if self.strain else None)
         reviews = []
         
         # Find all review containers - Yelp uses various class patterns
         review_containers = soup.find_all('li', class_=re.compile(r'.*margin-b.*|.*review.*', re.I))
         
+        # The alternative selectors below need the full tree
+        if not review_containers and self.strain:
+            soup = make_soup(html)
+        
         # Alternative selectors if the above doesn't work
         if not review_containers:
             review_containers = soup.find_all('div', {'data-review-id': True})
-            
+        
         if not review_containers:
             # Try finding by user profile links pattern
             user_links = soup.find_all('a', href=re.compile(r'/user_details\?userid='))
@@ -131,7 +385,7 @@ class YelpScraper:
             except Exception as e:
                 print(f"   [WARN] Error parsing review: {e}")
                 continue
-                
+        
         return reviews
     
     def _extract_review_data(self, container) -> dict:
@@ -140,7 +394,7 @@ class YelpScraper:
         
         Args:
             container: BeautifulSoup element untuk satu review
-            
+        
         Returns:
             Dictionary dengan review data
         """
@@ -240,85 +494,171 @@ class YelpScraper:
         
         return review
     
-    def scrape_all_reviews(self, limit: int = None) -> list:
+    def scrape_all_reviews(self, limit: int = None, output_file: str = None, resume: bool = False) -> list:
         """
         Scrape semua review dengan pagination
         
+        Fetch, parse dan penulisan berjalan sebagai pipeline (page_pipeline):
+        halaman diambil `workers` sekaligus (HTTP atau driver, lihat
+        fetch_page; request dibatasi satu token bucket untuk semua worker),
+        di-parse di thread terpisah selama halaman berikutnya dimuat, lalu
+        di-dedup dan ditulis berurutan sesuai offset.
+        
+        Dengan output_file setiap halaman yang selesai dicatat di checkpoint
+        (<output>.checkpoint); crawl yang terputus bisa dilanjutkan dengan
+        resume=True dari offset berikutnya, dengan review yang sudah
+        dikumpulkan (dan set dedup-nya) dipulihkan dari checkpoint.
+        
         Args:
             limit: Maximum number of reviews to scrape (None = all)
-            
+            output_file: CSV/Parquet/Arrow yang ditulis langsung selama scraping (opsional;
+                         tanpa ini gunakan save_to_csv setelahnya)
+            resume: Lanjutkan crawl yang terputus dari checkpoint
+        
         Returns:
             List of all reviews
         """
-        self.start_driver()
         all_reviews = []
-        start = 0
-        page_num = 1
-        consecutive_empty = 0
+        self.quality = QualityStats()
+        seen = self.dedup_index if self.dedup_index is not None else set()
+        state = {'consecutive_empty': 0}
         max_consecutive_empty = 3
         
-        try:
-            while True:
-                print(f"\n[PAGE] Page {page_num} (offset: {start})")
-                
-                html = self.get_page(start)
-                page_reviews = self.parse_reviews(html)
-                
-                if not page_reviews:
-                    consecutive_empty += 1
-                    print(f"   [WARN] No reviews found on this page ({consecutive_empty}/{max_consecutive_empty})")
-                    if consecutive_empty >= max_consecutive_empty:
-                        print("   [STOP] Too many empty pages, stopping...")
-                        break
-                else:
-                    consecutive_empty = 0
-                    
-                # Add reviews, avoiding duplicates
-                for review in page_reviews:
-                    if not any(r['username'] == review['username'] and 
-                              r['written_date'] == review['written_date'] 
-                              for r in all_reviews):
-                        all_reviews.append(review)
-                
-                print(f"   [OK] Total reviews collected: {len(all_reviews)}")
-                
-                # Check limit
+        writer = None
+        
+        def write(review: dict):
+            nonlocal writer
+            if writer is None:
+                # Opened on the first review so an empty run leaves no file
+                writer = open_writer(output_file, self.COLUMNS,
+                                     append=self.dedup_index is not None)
+            writer.write(review)
+        
+        checkpoint = None
+        first_offset = 0
+        if output_file:
+            checkpoint = CrawlCheckpoint(checkpoint_path(output_file), self.BASE_URL)
+            if resume and checkpoint.load():
+                first_offset = checkpoint.last_offset + self.PAGE_SIZE
+                state['consecutive_empty'] = checkpoint.consecutive_empty
+                print(f"[RESUME] {checkpoint.pages} page(s), {len(checkpoint.reviews)} review(s) "
+                      f"from {checkpoint.path}, continuing at offset {first_offset}")
+                if self.dedup_index is not None:
+                    # The interrupted run appended to the output: rows that
+                    # reached it after the last index commit are not written again
+                    recovered = self.dedup_index.seed_from_csv(output_file)
+                    if recovered:
+                        print(f"[RESUME] {recovered} review(s) already in {output_file}")
+                for review in checkpoint.reviews:
+                    all_reviews.append(review)
+                    self.quality.add(review)
+                    # With a dedup index, reviews committed by the interrupted
+                    # run are already in the output
+                    if review['review_id'] not in seen:
+                        seen.add(review['review_id'])
+                        write(review)
+            elif resume:
+                print("[RESUME] No checkpoint to resume, starting at offset 0")
+            elif checkpoint.exists():
+                print(f"[INFO] Unfinished crawl in {checkpoint.path} is discarded (use --resume to continue it)")
+            checkpoint.open(resume=resume)
+        
+        def consume(start: int, page_reviews: list) -> bool:
+            page_num = start // self.PAGE_SIZE + 1
+            print(f"\n[PAGE] Page {page_num} (offset: {start})")
+            
+            if not page_reviews:
+                state['consecutive_empty'] += 1
+                print(f"   [WARN] No reviews found on this page ({state['consecutive_empty']}/{max_consecutive_empty})")
+                if state['consecutive_empty'] >= max_consecutive_empty:
+                    print("   [STOP] Too many empty pages, stopping...")
+                    return False
+            else:
+                state['consecutive_empty'] = 0
+            
+            # Add reviews, avoiding duplicates (O(1) review_id lookup)
+            new_reviews = []
+            for review in dedup_reviews(page_reviews, seen):
+                new_reviews.append(review)
+                all_reviews.append(review)
+                self.quality.add(review)
+                if output_file:
+                    write(review)
                 if limit and len(all_reviews) >= limit:
-                    print(f"\n[TARGET] Reached limit of {limit} reviews")
-                    all_reviews = all_reviews[:limit]
                     break
-                
-                # Check if there's a next page
-                # Yelp shows 10 reviews per page
-                if len(page_reviews) < 10:
-                    print("\n[END] Last page reached (fewer than 10 reviews)")
-                    break
-                
-                # Move to next page
-                start += 10
-                page_num += 1
-                
-                # Be nice to the server
-                time.sleep(3)
-                
-                # Safety limit to prevent infinite loops
-                if page_num > 60:  # 60 pages * 10 = 600 reviews max
-                    print("\n[STOP] Safety limit reached (60 pages)")
-                    break
-                    
+            
+            if writer is not None and self.dedup_index is not None and writer.sync():
+                # Appended rows are on disk: commit their IDs with the page
+                self.dedup_index.commit()
+            if checkpoint:
+                checkpoint.record(start, len(page_reviews), state['consecutive_empty'], new_reviews)
+            print(f"   [OK] Total reviews collected: {len(all_reviews)} | quality {self.quality.score}/100")
+            
+            # Check limit
+            if limit and len(all_reviews) >= limit:
+                print(f"\n[TARGET] Reached limit of {limit} reviews")
+                return False
+            
+            # Check if there's a next page
+            if len(page_reviews) < self.PAGE_SIZE:
+                print(f"\n[END] Last page reached (fewer than {self.PAGE_SIZE} reviews)")
+                return False
+            return True
+        
+        # Drivers are only started when a page needs the browser
+        self.pool = DriverPool(self.driver_factory, self.workers)
+        self.limiter = TokenBucket(self.rate, self.burst)
+        self.http = HTTPFetcher(maxsize=self.workers)
+        offsets = range(first_offset, self.MAX_PAGES * self.PAGE_SIZE, self.PAGE_SIZE)
+        stats = None
+        finished = False
+        
+        try:
+            if limit and len(all_reviews) >= limit:
+                print(f"\n[TARGET] Reached limit of {limit} reviews")
+                finished = True
+            else:
+                stats = run_pipeline(offsets, self.fetch_page, self.parse_page, consume, self.workers)
+                if not stats['stopped']:
+                    # Safety limit to prevent infinite loops
+                    print(f"\n[STOP] Safety limit reached ({self.MAX_PAGES} pages)")
+                finished = True
+        
         except KeyboardInterrupt:
             print("\n[WARN] Scraping interrupted by user")
         except Exception as e:
             print(f"\n[ERROR] Error during scraping: {e}")
         finally:
-            self.close_driver()
-            
+            self.pool.close()
+            self.http.close()
+            print(f"[STOP] {self.limiter.requests} page request(s): {self.fetch_stats['http']} via HTTP "
+                  f"({self.http.bytes / 1024:.0f} KB), {self.fetch_stats['browser']} via browser "
+                  f"({self.pool.size} max)")
+            if self.page_timings:
+                print(f"[TIME] {self.timing_summary()}")
+            if stats:
+                print(f"[TIME] fetch {stats['fetch_seconds']:.1f}s + parse {stats['parse_seconds']:.1f}s "
+                      f"in {stats['wall_seconds']:.1f}s wall clock")
+            if self.quality.total:
+                print(f"[QUALITY] {self.quality.summary()}")
+            if writer:
+                writer.close()
+                if self.dedup_index is not None:
+                    self.dedup_index.commit()
+                print(f"\n[SAVE] Saved {writer.count} reviews to {output_file}")
+            elif output_file:
+                print("[ERROR] No reviews to save")
+            if checkpoint:
+                checkpoint.close(finished)
+                if not finished:
+                    print(f"[RESUME] Progress saved in {checkpoint.path}; run again with --resume to continue")
+        
         self.reviews = all_reviews
         return all_reviews
     
     def save_to_csv(self, filename: str = "yelp_coachella_reviews.csv"):
         """
-        Simpan reviews ke CSV file
+        Simpan reviews ke CSV file (Parquet/Arrow bertipe untuk .parquet/.arrow)
         
         Args:
             filename: Nama file output
@@ -326,15 +666,15 @@ class YelpScraper:
         if not self.reviews:
             print("[ERROR] No reviews to save")
             return
-            
-        columns = ['username', 'from', 'written_date', 'rating', 'title', 
-                   'review_text', 'tema_pengalaman', 'daya_tarik_wisata']
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(self.reviews)
-            
+        # With a dedup index only new reviews were collected: append them
+        append = self.dedup_index is not None
+        with open_writer(filename, self.COLUMNS, append=append) as writer:
+            for review in self.reviews:
+                writer.write(review)
+        if append:
+            self.dedup_index.commit()
+        
         print(f"\n[SAVE] Saved {len(self.reviews)} reviews to {filename}")
 
 
@@ -343,24 +683,69 @@ def main():
     parser.add_argument('--limit', type=int, default=None,
                         help='Maximum number of reviews to scrape (default: all)')
     parser.add_argument('--output', type=str, default='yelp_coachella_reviews.csv',
-                        help='Output CSV filename')
+                        help='Output file: .csv, or .parquet/.arrow for typed columns written in row groups')
     parser.add_argument('--show-browser', action='store_true',
                         help='Show browser window during scraping')
+    parser.add_argument('--strain', action='store_true',
+                        help='Only build the tree for <li> review containers (faster)')
+    parser.add_argument('--dedup-index', action='store_true',
+                        help='Skip reviews collected in earlier runs and append new ones to the CSV')
+    parser.add_argument('--url', type=str, default=YelpScraper.BASE_URL,
+                        help='Yelp business page to scrape')
+    parser.add_argument('--fetch', type=str, default='auto', choices=FETCH_MODES,
+                        help='auto: plain HTTP, browser only when needed; http: never start a browser; '
+                             'browser: always use the browser (default: auto)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of browsers fetching pages concurrently (default: 1)')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'Average page requests per second, shared by all workers (default: {DEFAULT_RATE:.2f})')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST,
+                        help=f'Requests allowed back to back after an idle period (default: {DEFAULT_BURST})')
+    parser.add_argument('--block', type=str, default=','.join(DEFAULT_BLOCK),
+                        help='Resource types the browser does not load: image, font, media, tracker, '
+                             f'all or none (default: {",".join(DEFAULT_BLOCK)})')
+    parser.add_argument('--block-pattern', action='append', default=[],
+                        help="Extra URL pattern to block, '*' as wildcard (repeatable)")
+    parser.add_argument('--extract', type=str, default='html', choices=EXTRACT_MODES,
+                        help='Browser pages: html = transfer page_source and parse in Python, '
+                             'js = extract reviews in the page and return JSON, check = both and compare '
+                             '(default: html; try check on real pages before using js)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted crawl from its checkpoint (<output>.checkpoint)')
+    parser.add_argument('--timings', type=str, default=None,
+                        help='Write per-page timings to this CSV file')
+    parser.add_argument('--quality-report', action='store_true',
+                        help='Print the full validation report of the scraped reviews (kept while scraping)')
     
     args = parser.parse_args()
     
+    try:
+        block = BlockProfile(parse_block_types(args.block), args.block_pattern)
+    except ValueError as e:
+        parser.error(str(e))
+    
     print("=" * 60)
     print("YELP COACHELLA REVIEWS SCRAPER")
     print("=" * 60)
-    print(f"Target: {YelpScraper.BASE_URL}")
+    print(f"Target: {args.url}")
     print(f"Limit: {args.limit or 'All reviews'}")
     print(f"Output: {args.output}")
+    print(f"Blocked resources: {block}")
+    print(f"Workers: {args.workers} | Rate: {args.rate:.2f} req/s (burst {args.burst}) | Fetch: {args.fetch}")
     print("=" * 60)
     
-    scraper = YelpScraper(headless=not args.show_browser)
+    index = None
+    if args.dedup_index:
+        index = DedupIndex(scope=args.url)
+        index.seed_from_csv(args.output)
+    
+    scraper = YelpScraper(headless=not args.show_browser, strain=args.strain, dedup_index=index,
+                          workers=args.workers, rate=args.rate, burst=args.burst, fetch_mode=args.fetch,
+                          base_url=args.url,
+                          block=block, extract=args.extract)
     
     start_time = datetime.now()
-    reviews = scraper.scrape_all_reviews(limit=args.limit)
+    reviews = scraper.scrape_all_reviews(limit=args.limit, output_file=args.output, resume=args.resume)
     end_time = datetime.now()
     
     duration = (end_time - start_time).total_seconds()
@@ -373,14 +758,21 @@ def main():
     print(f"Rate: {len(reviews)/max(duration,1)*60:.1f} reviews/minute")
     
     if reviews:
-        scraper.save_to_csv(args.output)
-        
         # Show sample
         print("\nSample review:")
         sample = reviews[0]
         for key, value in sample.items():
             display_value = value[:50] + "..." if len(str(value)) > 50 else value
             print(f"   {key}: {display_value}")
+    
+    if args.quality_report and scraper.quality.total:
+        print('\n'.join(scraper.quality.report().lines()))
+    
+    if args.timings:
+        scraper.save_timings(args.timings)
+    
+    if index:
+        index.close()
 
 
 if __name__ == "__main__":